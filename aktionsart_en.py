@@ -1,316 +1,9 @@
 import streamlit as st
-import spacy
-from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
-
-# --- 1. CLASSES AND ENUMS ---
-
-class Aktionsart(Enum):
-    STATE = "state"
-    CAUSATIVE_STATE = "causative state"
-    ACHIEVEMENT = "achievement"
-    CAUSATIVE_ACHIEVEMENT = "causative achievement"
-    SEMELFACTIVE = "semelfactive"
-    CAUSATIVE_SEMELFACTIVE = "causative semelfactive"
-    ACTIVE_ACCOMPLISHMENT = "active accomplishment"
-    CAUSATIVE_ACTIVE_ACCOMPLISHMENT = "causative active accomplishment"
-    ACCOMPLISHMENT = "accomplishment"
-    CAUSATIVE_ACCOMPLISHMENT = "causative accomplishment"
-    ACTIVITY = "activity"
-    CAUSATIVE_ACTIVITY = "causative activity"
-    PROCESS = "process"
-    CAUSATIVE_PROCESS = "causative process"
-
-@dataclass
-class Features:
-    causative: Optional[bool] = None
-    stative: Optional[bool] = None
-    punctual: Optional[bool] = None
-    telic: Optional[bool] = None
-    dynamic: Optional[bool] = None
-
-@dataclass
-class ClauseData:
-    gerund: str = ""
-    participle: str = ""
-    infinitive: str = ""
-    subject: str = ""
-    postverbal: str = ""
-    person_number: str = "3s"
-
-# --- 2. DICTIONARIES AND AUXILIARIES ---
-
-BE_PRESENT = {
-    '1s': "am", '2s': "are", '3s': "is",
-    '1p': "are", '2p': "are", '3p': "are"
-}
-
-BE_PAST = {
-    '1s': "was", '2s': "were", '3s': "was",
-    '1p': "were", '2p': "were", '3p': "were"
-}
-
-HAVE_PRESENT = {
-    '1s': "have", '2s': "have", '3s': "has",
-    '1p': "have", '2p': "have", '3p': "have"
-}
-
-IRREGULARS = {
-    "be": {"ger": "being", "pp": "been"},
-    "have": {"ger": "having", "pp": "had"},
-    "do": {"ger": "doing", "pp": "done"},
-    "go": {"ger": "going", "pp": "gone"},
-    "say": {"ger": "saying", "pp": "said"},
-    "make": {"ger": "making", "pp": "made"},
-    "get": {"ger": "getting", "pp": "gotten"},
-    "know": {"ger": "knowing", "pp": "known"},
-    "think": {"ger": "thinking", "pp": "thought"},
-    "take": {"ger": "taking", "pp": "taken"},
-    "see": {"ger": "seeing", "pp": "seen"},
-    "come": {"ger": "coming", "pp": "come"},
-    "want": {"ger": "wanting", "pp": "wanted"},
-    "look": {"ger": "looking", "pp": "looked"},
-    "use": {"ger": "using", "pp": "used"},
-    "find": {"ger": "finding", "pp": "found"},
-    "give": {"ger": "giving", "pp": "given"},
-    "tell": {"ger": "telling", "pp": "told"},
-    "work": {"ger": "working", "pp": "worked"},
-    "call": {"ger": "calling", "pp": "called"},
-    "try": {"ger": "trying", "pp": "tried"},
-    "ask": {"ger": "asking", "pp": "asked"},
-    "need": {"ger": "needing", "pp": "needed"},
-    "feel": {"ger": "feeling", "pp": "felt"},
-    "become": {"ger": "becoming", "pp": "become"},
-    "leave": {"ger": "leaving", "pp": "left"},
-    "put": {"ger": "putting", "pp": "put"},
-    "mean": {"ger": "meaning", "pp": "meant"},
-    "keep": {"ger": "keeping", "pp": "kept"},
-    "let": {"ger": "letting", "pp": "let"},
-    "begin": {"ger": "beginning", "pp": "begun"},
-    "seem": {"ger": "seeming", "pp": "seemed"},
-    "help": {"ger": "helping", "pp": "helped"},
-    "talk": {"ger": "talking", "pp": "talked"},
-    "turn": {"ger": "turning", "pp": "turned"},
-    "start": {"ger": "starting", "pp": "started"},
-    "show": {"ger": "showing", "pp": "shown"},
-    "hear": {"ger": "hearing", "pp": "heard"},
-    "play": {"ger": "playing", "pp": "played"},
-    "run": {"ger": "running", "pp": "run"},
-    "move": {"ger": "moving", "pp": "moved"},
-    "live": {"ger": "living", "pp": "lived"},
-    "believe": {"ger": "believing", "pp": "believed"},
-    "bring": {"ger": "bringing", "pp": "brought"},
-    "happen": {"ger": "happening", "pp": "happened"},
-    "write": {"ger": "writing", "pp": "written"},
-    "sit": {"ger": "sitting", "pp": "sat"},
-    "stand": {"ger": "standing", "pp": "stood"},
-    "lose": {"ger": "losing", "pp": "lost"},
-    "pay": {"ger": "paying", "pp": "paid"},
-    "meet": {"ger": "meeting", "pp": "met"},
-    "include": {"ger": "including", "pp": "included"},
-    "continue": {"ger": "continuing", "pp": "continued"},
-    "set": {"ger": "setting", "pp": "set"},
-    "learn": {"ger": "learning", "pp": "learned"},
-    "change": {"ger": "changing", "pp": "changed"},
-    "lead": {"ger": "leading", "pp": "led"},
-    "understand": {"ger": "understanding", "pp": "understood"},
-    "watch": {"ger": "watching", "pp": "watched"},
-    "follow": {"ger": "following", "pp": "followed"},
-    "stop": {"ger": "stopping", "pp": "stopped"},
-    "create": {"ger": "creating", "pp": "created"},
-    "speak": {"ger": "speaking", "pp": "spoken"},
-    "read": {"ger": "reading", "pp": "read"},
-    "allow": {"ger": "allowing", "pp": "allowed"},
-    "add": {"ger": "adding", "pp": "added"},
-    "spend": {"ger": "spending", "pp": "spent"},
-    "grow": {"ger": "growing", "pp": "grown"},
-    "open": {"ger": "opening", "pp": "opened"},
-    "walk": {"ger": "walking", "pp": "walked"},
-    "win": {"ger": "winning", "pp": "won"},
-    "offer": {"ger": "offering", "pp": "offered"},
-    "remember": {"ger": "remembering", "pp": "remembered"},
-    "love": {"ger": "loving", "pp": "loved"},
-    "consider": {"ger": "considering", "pp": "considered"},
-    "appear": {"ger": "appearing", "pp": "appeared"},
-    "buy": {"ger": "buying", "pp": "bought"},
-    "wait": {"ger": "waiting", "pp": "waited"},
-    "serve": {"ger": "serving", "pp": "served"},
-    "die": {"ger": "dying", "pp": "died"},
-    "send": {"ger": "sending", "pp": "sent"},
-    "expect": {"ger": "expecting", "pp": "expected"},
-    "build": {"ger": "building", "pp": "built"},
-    "stay": {"ger": "staying", "pp": "stayed"},
-    "fall": {"ger": "falling", "pp": "fallen"},
-    "cut": {"ger": "cutting", "pp": "cut"},
-    "reach": {"ger": "reaching", "pp": "reached"},
-    "kill": {"ger": "killing", "pp": "killed"},
-    "remain": {"ger": "remaining", "pp": "remained"},
-    "suggest": {"ger": "suggesting", "pp": "suggested"},
-    "raise": {"ger": "raising", "pp": "raised"},
-    "pass": {"ger": "passing", "pp": "passed"},
-    "sell": {"ger": "selling", "pp": "sold"},
-    "require": {"ger": "requiring", "pp": "required"},
-    "report": {"ger": "reporting", "pp": "reported"},
-    "decide": {"ger": "deciding", "pp": "decided"},
-    "pull": {"ger": "pulling", "pp": "pulled"},
-    "break": {"ger": "breaking", "pp": "broken"},
-    "teach": {"ger": "teaching", "pp": "taught"},
-    "eat": {"ger": "eating", "pp": "eaten"},
-    "drive": {"ger": "driving", "pp": "driven"},
-    "drink": {"ger": "drinking", "pp": "drunk"},
-    "sing": {"ger": "singing", "pp": "sung"},
-    "swim": {"ger": "swimming", "pp": "swum"},
-    "fly": {"ger": "flying", "pp": "flown"},
-    "draw": {"ger": "drawing", "pp": "drawn"},
-    "forget": {"ger": "forgetting", "pp": "forgotten"},
-    "hit": {"ger": "hitting", "pp": "hit"},
-    "catch": {"ger": "catching", "pp": "caught"},
-    "sleep": {"ger": "sleeping", "pp": "slept"},
-    "throw": {"ger": "throwing", "pp": "thrown"},
-    "wake": {"ger": "waking", "pp": "woken"},
-    "wear": {"ger": "wearing", "pp": "worn"},
-    "choose": {"ger": "choosing", "pp": "chosen"},
-    "hide": {"ger": "hiding", "pp": "hidden"},
-}
-
-PERSONS_DICT = {
-    "1s": "1st person singular (I)",
-    "2s": "2nd person singular (You)",
-    "3s": "3rd person singular (He/She/It)",
-    "1p": "1st person plural (We)",
-    "2p": "2nd person plural (You)",
-    "3p": "3rd person plural (They)"
-}
-
-@st.cache_resource
-def load_nlp():
-    try: return spacy.load("en_core_web_sm")
-    except: return None
-
-nlp = load_nlp()
-
-def generate_english_forms(lemma: str):
-    """Generates Gerund and Past Participle using dictionary + heuristic rules."""
-    lemma = lemma.lower().strip()
-    
-    if lemma in IRREGULARS:
-        return IRREGULARS[lemma]["ger"], IRREGULARS[lemma]["pp"]
-    
-    # Gerund
-    if lemma.endswith("ie"):
-        ger = lemma[:-2] + "ying"
-    elif lemma.endswith("e") and not lemma.endswith("ee"):
-        ger = lemma[:-1] + "ing"
-    else:
-        is_cvc = (len(lemma) > 2 
-                  and lemma[-1] not in "aeiouwyx" 
-                  and lemma[-2] in "aeiou" 
-                  and lemma[-3] not in "aeiou")
-        is_unstressed_ending = lemma.endswith(("er", "en", "el", "it"))
-        if is_cvc and not is_unstressed_ending:
-            ger = lemma + lemma[-1] + "ing"
-        else:
-            ger = lemma + "ing"
-    
-    # Past Participle (Regular)
-    if lemma.endswith("e"):
-        pp = lemma + "d"
-    else:
-        is_cvc = (len(lemma) > 2 
-                  and lemma[-1] not in "aeiouwyx" 
-                  and lemma[-2] in "aeiou" 
-                  and lemma[-3] not in "aeiou")
-        is_unstressed_ending = lemma.endswith(("er", "en", "el", "it"))
-        if is_cvc and not is_unstressed_ending:
-            pp = lemma + lemma[-1] + "ed"
-        else:
-            pp = lemma + "ed"
-    
-    return ger, pp
-
-def detect_person_number(doc, verb_token, idx):
-    """Deduces Person/Number based on the Subject found by spaCy."""
-    subj_token = None
-    for token in doc:
-        if token.head == verb_token and "subj" in token.dep_:
-            subj_token = token
-            break
-    
-    if not subj_token:
-        return "3s"
-    
-    text = subj_token.text.lower()
-    
-    if text == "i": return "1s"
-    if text == "you": return "2s"
-    if text == "we": return "1p"
-    if text == "they": return "3p"
-    if text in ["he", "she", "it"]: return "3s"
-    
-    morph = subj_token.morph.to_dict()
-    number = morph.get("Number", "Sing")
-    
-    if number == "Plur":
-        return "3p"
-    else:
-        return "3s"
-
-def analyze_automatically(clause, data):
-    """Uses spaCy to analyze the clause structure and morphology."""
-    if not nlp: return False, "", ""
-    
-    doc = nlp(clause)
-    verb_token = None
-    
-    for token in doc:
-        if token.dep_ == "ROOT" and token.pos_ in ["VERB", "AUX"]:
-            verb_token = token
-            break
-    
-    if not verb_token:
-        for token in doc:
-            if token.pos_ in ["VERB", "AUX"]:
-                verb_token = token
-                break
-    
-    if not verb_token and len(doc) <= 2:
-        for token in doc:
-            if token.pos_ not in ["DET", "PRON"]:
-                verb_token = token
-                break
-    
-    if not verb_token: return False, "", ""
-    
-    lemma = verb_token.lemma_.lower()
-    ger, pp = generate_english_forms(lemma)
-    
-    if not ger or not pp: return False, "", ""
-    
-    data.infinitive = lemma
-    data.gerund = ger
-    data.participle = pp
-    data.person_number = detect_person_number(doc, verb_token, verb_token.i)
-    
-    idx = verb_token.i
-    data.subject = doc[:idx].text.strip()
-    data.postverbal = doc[idx+1:].text.strip()
-    
-    return True, verb_token.text, lemma
-
-def build_prog(past: bool, data: ClauseData) -> str:
-    be = BE_PAST[data.person_number] if past else BE_PRESENT[data.person_number]
-    parts = [data.subject, f"{be} {data.gerund}", data.postverbal]
-    return " ".join(p for p in parts if p)
-
-def build_perfect(data: ClauseData) -> str:
-    have = HAVE_PRESENT[data.person_number]
-    parts = [data.subject, f"{have} {data.participle}", data.postverbal]
-    return " ".join(p for p in parts if p)
-
-def build_stop(data: ClauseData) -> str:
-    parts = [data.subject or "(subject)", f"stopped {data.gerund}", data.postverbal]
-    return " ".join(p for p in parts if p)
+# The logic lives in nucleo/aktionsart_en.py; this module is only the interface
+from nucleo.aktionsart_en import (
+    ClauseData, Features, PERSONS_DICT, analyze_automatically, compute_aktionsart,
+    test_sentences,
+)
 
 # --- NAVIGATION ---
 def go_to(step):
@@ -318,14 +11,20 @@ def go_to(step):
     st.session_state.akt_step = step
     st.rerun()
 
+def go_to_tests():
+    """Moves on to the diagnostic tests: one per screen, or all together in expert mode."""
+    st.session_state.tests = test_sentences(st.session_state.data)
+    go_to('matrix' if st.session_state.get('expert_mode') else 'stativity')
+
 def go_back():
     if st.session_state.history:
         current_step = st.session_state.akt_step
         if current_step == 'cleanup':
             st.session_state.features.causative = None
             st.session_state.non_causative_variant = ""
-        elif current_step == 'stativity':
+        elif current_step in ('stativity', 'matrix'):
             st.session_state.data = ClauseData()
+            st.session_state.pop('tests', None)
         elif current_step == 'punctuality':
             st.session_state.features.stative = None
         elif current_step == 'telicity':
@@ -339,7 +38,7 @@ def go_back():
         st.rerun()
 
 def restart_analysis():
-    for key in ['akt_step', 'history', 'features', 'data', 'original_clause', 'current_clause', 'clean_clause', 'non_causative_variant', 'paraphrase']:
+    for key in ['akt_step', 'history', 'features', 'data', 'original_clause', 'current_clause', 'clean_clause', 'non_causative_variant', 'paraphrase', 'tests']:
         if key in st.session_state:
             del st.session_state[key]
     st.rerun()
@@ -421,15 +120,7 @@ def mostrar_detector_en():
 
     label_result = ""
     if st.session_state.akt_step == 'result':
-        f = st.session_state.features
-        if f.stative: sub = "state"
-        elif f.punctual and f.telic: sub = "achievement"
-        elif f.punctual and not f.telic: sub = "semelfactive"
-        elif not f.punctual and f.telic and f.dynamic: sub = "active accomplishment"
-        elif not f.punctual and not f.telic and f.dynamic: sub = "activity"
-        elif not f.punctual and f.telic and not f.dynamic: sub = "accomplishment"
-        else: sub = "process"
-        label_result = f"causative {sub}" if f.causative else sub
+        label_result = compute_aktionsart(st.session_state.features)
 
     col_left, col_spacer, col_right = st.columns([0.6, 0.02, 0.38])
 
@@ -440,7 +131,9 @@ def mostrar_detector_en():
             st.write("If it sounds very odd, type it in **present** (e.g., *Mary knows English*).")
             with st.form(key="form_start_en"):
                 clause = st.text_input("Clause:")
+                expert = st.checkbox("Expert mode: answer all the diagnostic tests on a single screen", value=st.session_state.get('expert_mode', False))
                 if st.form_submit_button("Start the analysis"):
+                    st.session_state.expert_mode = expert
                     if clause:
                         clause_limpia = clause.strip().rstrip('.')
                         st.session_state.original_clause = clause_limpia
@@ -554,7 +247,7 @@ def mostrar_detector_en():
                 st.markdown(html_table, unsafe_allow_html=True)
                 st.write("Is this analysis correct?")
                 c1, c2 = st.columns(2)
-                if c1.button("Yes", use_container_width=True): go_to('stativity')
+                if c1.button("Yes", use_container_width=True): go_to_tests()
                 if c2.button("No", use_container_width=True): go_to('manual_morph')
                 navigation_buttons()
             else:
@@ -577,7 +270,47 @@ def mostrar_detector_en():
                     index=idx_current
                 )
                 if st.form_submit_button("Save"):
-                    go_to('stativity')
+                    go_to_tests()
+            navigation_buttons()
+
+        elif st.session_state.akt_step == 'matrix':
+            st.markdown("#### **Diagnostic tests**")
+            st.write("Answer all the tests and press **Compute aktionsart**.")
+            clause = st.session_state.current_clause[0].upper() + st.session_state.current_clause[1:]
+            prog_past = st.session_state.tests['prog_past']
+            prog = st.session_state.tests['prog']
+            stop_expr = st.session_state.tests['stop']
+            perfect = st.session_state.tests['perfect']
+            with st.form(key="form_matrix_en"):
+                st.markdown("**Stativity.**")
+                for col, question in zip(st.columns(3), ["What happened a moment ago?", "What happened yesterday?", "What happened last month?"]):
+                    col.markdown(f"— {question}<br>— <i>{clause}</i>.", unsafe_allow_html=True)
+                a_sta = st.radio(f"Do you think *{st.session_state.current_clause}* is a good answer to at least one of these questions?", ["Yes", "No"], index=None, horizontal=True, key="mx_stativity")
+                st.markdown("**Punctuality.**")
+                elegant_list([f"<i>{prog_past[0].upper() + prog_past[1:]} for an hour.</i>", f"<i>{prog_past[0].upper() + prog_past[1:]} for a month.</i>"])
+                a_pun = st.radio("Is any of these a valid expression (**without** forcing an iterative or imminent reading)?", ["Yes", "No"], index=None, horizontal=True, key="mx_punctuality")
+                st.markdown("**Telicity.**")
+                st.write(f"Imagine that {prog} and suddenly {stop_expr}.")
+                a_tel = st.radio(f"Would it then be true to say: *{perfect}*?", ["Yes", "No"], index=None, horizontal=True, key="mx_telicity")
+                st.markdown("**Dynamicity.**")
+                elegant_list([f"<i>{prog[0].upper() + prog[1:]} vigorously</i>.", f"<i>{prog[0].upper() + prog[1:]} forcefully</i>.", f"<i>{prog[0].upper() + prog[1:]} with effort</i>."])
+                a_dyn = st.radio("Would any of these expressions sound natural to you?", ["Yes", "No"], index=None, horizontal=True, key="mx_dynamicity")
+                if st.form_submit_button("Compute aktionsart", use_container_width=True):
+                    if a_sta is None:
+                        st.warning("Please answer the stativity test.")
+                    elif a_sta == "No":
+                        f = st.session_state.features
+                        f.stative, f.punctual, f.telic, f.dynamic = True, None, None, None
+                        go_to('result')
+                    elif None in (a_pun, a_tel, a_dyn):
+                        st.warning("Please answer all the tests.")
+                    else:
+                        f = st.session_state.features
+                        f.stative = False
+                        f.punctual = a_pun == "No"
+                        f.telic = a_tel == "No"
+                        f.dynamic = a_dyn == "Yes"
+                        go_to('result')
             navigation_buttons()
 
         elif st.session_state.akt_step == 'stativity':
@@ -604,7 +337,7 @@ def mostrar_detector_en():
 
         elif st.session_state.akt_step == 'punctuality':
             st.markdown("#### **Punctuality test**")
-            prog_past = build_prog(True, st.session_state.data)
+            prog_past = st.session_state.tests['prog_past']
             st.write("Consider these expressions:")
             elegant_list([
                 f"<i>{prog_past[0].upper() + prog_past[1:]} for an hour.</i>",
@@ -622,9 +355,9 @@ def mostrar_detector_en():
 
         elif st.session_state.akt_step == 'telicity':
             st.markdown("#### **Telicity test**")
-            prog = build_prog(False, st.session_state.data)
-            stop_expr = build_stop(st.session_state.data)
-            perfect = build_perfect(st.session_state.data)
+            prog = st.session_state.tests['prog']
+            stop_expr = st.session_state.tests['stop']
+            perfect = st.session_state.tests['perfect']
             st.write(f"Imagine that {prog} and suddenly {stop_expr}.")
             st.write(f"Would it then be true to say: *{perfect}*?")
             c1, c2 = st.columns(2)
@@ -638,7 +371,7 @@ def mostrar_detector_en():
 
         elif st.session_state.akt_step == 'dynamicity':
             st.markdown("#### **Dynamicity test**")
-            prog = build_prog(False, st.session_state.data)
+            prog = st.session_state.tests['prog']
             st.write("Consider these expressions:")
             elegant_list([
                 f"<i>{prog[0].upper() + prog[1:]} vigorously</i>.",
@@ -1,147 +1,9 @@
 import streamlit as st
-import spacy
-from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
-
-# --- 1. CLASES Y ENUMS ---
-
-class Aktionsart(Enum):
-    ESTADO = "estado"
-    ESTADO_CAUSATIVO = "estado causativo"
-    LOGRO = "logro"
-    LOGRO_CAUSATIVO = "logro causativo"
-    SEMELFACTIVO = "semelfactivo"
-    SEMELFACTIVO_CAUSATIVO = "semelfactivo causativo"
-    REALIZACION_ACTIVA = "realización activa"
-    REALIZACION_ACTIVA_CAUSATIVA = "realización activa causativa"
-    REALIZACION = "realización"
-    REALIZACION_CAUSATIVA = "realización causativa"
-    ACTIVIDAD = "actividad"
-    ACTIVIDAD_CAUSATIVA = "actividad causativa"
-    PROCESO = "proceso"
-    PROCESO_CAUSATIVO = "proceso causativo"
-
-@dataclass
-class RasgosPred:
-    causativo: Optional[bool] = None
-    estativo: Optional[bool] = None
-    puntual: Optional[bool] = None
-    telico: Optional[bool] = None
-    dinamico: Optional[bool] = None
-
-@dataclass
-class DatosClause:
-    gerundio: str = ""
-    participio: str = ""
-    infinitivo: str = ""
-    sujeto: str = ""
-    complementos: str = ""
-    persona_numero: str = "3s"
-
-# --- 2. DICCIONARIOS Y AUXILIARES ---
-
-IRREGULARES = {
-    "abrir": {"pp": "abierto"}, "cubrir": {"pp": "cubierto"},
-    "decir": {"ger": "diciendo", "pp": "dicho"}, "descubrir": {"pp": "descubierto"}, "escribir": {"pp": "escrito"},
-    "hacer": {"pp": "hecho"}, "freír": {"pp": "frito"},
-    "imprimir": {"pp": "impreso"}, "morir": {"ger": "muriendo", "pp": "muerto"},
-    "poner": {"pp": "puesto"}, "proveer": {"pp": "provisto"},
-    "romper": {"pp": "roto"}, "satisfacer": {"pp": "satisfecho"},
-    "soltar": {"pp": "suelto"}, "ver": {"pp": "visto"},
-    "volver": {"pp": "vuelto"}, "ir": {"ger": "yendo", "pp": "ido"},
-    "ser": {"ger": "siendo", "pp": "sido"}, "pudrir": {"pp": "podrido"},
-    "leer": {"ger": "leyendo", "pp": "leído"}, "traer": {"ger": "trayendo", "pp": "traído"},
-    "caer": {"ger": "cayendo", "pp": "caído"}, "oír": {"ger": "oyendo", "pp": "oído"},
-    "pedir": {"ger": "pidiendo"}, "sentir": {"ger": "sintiendo"},
-    "mentir": {"ger": "mintiendo"}, "seguir": {"ger": "siguiendo"},
-    "conseguir": {"ger": "consiguiendo"}, "perseguir": {"ger": "persiguiendo"},
-    "servir": {"ger": "sirviendo"}, "vestir": {"ger": "vistiendo"},
-    "repetir": {"ger": "repitiendo"}, "elegir": {"ger": "elegiendo"},
-    "corregir": {"ger": "corrigiendo"}, "reír": {"ger": "riendo"},
-    "sonreír": {"ger": "sonriendo"}, "venir": {"ger": "viniendo"},
-    "competir": {"ger": "compitiendo"}, "medir": {"ger": "midiendo"},
-    "despedir": {"ger": "despidiendo"}, "impedir": {"ger": "impidiendo"},
-    "dormir": {"ger": "durmiendo"}, "poder": {"ger": "pudiendo"}
-  
-}
-
-ESTAR_PRETERITO = {'1s': "estuve", '2s': "estuviste", '3s': "estuvo", '1p': "estuvimos", '2p': "estuvieron", '3p': "estuvieron"}
-ESTAR = {'1s': "estoy", '2s': "estás", '3s': "está", '1p': "estamos", '2p': "están", '3p': "están"}
-ESTAR_SUBJUNTIVO = {'1s': "estuviera", '2s': "estuvieras", '3s': "estuviera", '1p': "estuviéramos", '2p': "estuvieran", '3p': "estuvieran"}
-HABER = {'1s': "he", '2s': "has", '3s': "ha", '1p': "hemos", '2p': "han", '3p': "han"}
-DEJAR = {'1s': "dejara", '2s': "dejaras", '3s': "dejara", '1p': "dejáramos", '2p': "dejaran", '3p': "dejaran"}
-
-PERSONAS_DICT = {
-    "1s": "Primera persona singular",
-    "2s": "Segunda persona singular",
-    "3s": "Tercera persona singular",
-    "1p": "Primera persona plural",
-    "2p": "Segunda persona plural",
-    "3p": "Tercera persona plural"
-}
-
-@st.cache_resource
-def load_nlp():
-    try: return spacy.load("es_core_news_sm")
-    except: return None
-
-nlp = load_nlp()
-
-def analizar_automaticamente(oracion, datos):
-    if not nlp: return False, "", ""
-    doc = nlp(oracion)
-    verbo_token = next((t for t in doc if t.dep_ == "ROOT" and t.pos_ in ["VERB", "AUX"]), None)
-    if not verbo_token:
-        verbo_token = next((t for t in doc if t.pos_ in ["VERB", "AUX"]), None)
-    if not verbo_token: return False, "", ""
-    
-    idx = verbo_token.i
-    cliticos = [doc[i].text.lower() for i in range(idx-1, max(idx-5, -1), -1) if doc[i].pos_ == "PRON" and doc[i].text.lower() in ["me", "te", "se", "nos", "os", "le", "les", "lo", "los", "la", "las"]]
-    cliticos.reverse()
-    lema_limpio = verbo_token.lemma_.lower()
-    texto_verbo = verbo_token.text.lower()
-    
-    PRETERITOS_FUERTES = {"estuv": "estar", "tuv": "tener", "anduv": "andar", "pud": "poder", "pus": "poner", "sup": "saber", "hic": "hacer", "hiz": "hacer", "quis": "querer", "vin": "venir", "dij": "decir", "traj": "traer"}
-    for raiz, inf_real in PRETERITOS_FUERTES.items():
-        if texto_verbo.startswith(raiz):
-            lema_limpio = inf_real
-            break
-            
-    suffix = "".join(cliticos)
-    datos.infinitivo = lema_limpio + suffix
-    ger, part = IRREGULARES.get(lema_limpio, {}).get("ger", ""), IRREGULARES.get(lema_limpio, {}).get("pp", "")
-    
-    if not ger:
-        if lema_limpio.endswith("uir") and not lema_limpio.endswith(("guir", "quir", "güir")): ger = lema_limpio[:-2] + "yendo"
-        elif lema_limpio.endswith("ar"): ger = lema_limpio[:-2] + "ando"
-        elif lema_limpio.endswith(("er", "ir")): ger = lema_limpio[:-2] + "iendo"
-    if not part:
-        if lema_limpio.endswith("ar"): part = lema_limpio[:-2] + "ado"
-        elif lema_limpio.endswith(("er", "ir")): part = lema_limpio[:-2] + "ido"
-        
-    datos.gerundio, datos.participio = ger, part
-    
-    if texto_verbo.endswith(("é", "í")): datos.persona_numero = "1s"
-    elif texto_verbo.endswith(("aste", "iste", "as", "es")): datos.persona_numero = "2s"
-    elif texto_verbo.endswith("ó"): datos.persona_numero = "3s"
-    else:
-        morph = verbo_token.morph.to_dict()
-        p, n = morph.get("Person", "3"), morph.get("Number", "Sing")
-        datos.persona_numero = {("1", "Sing"): "1s", ("2", "Sing"): "2s", ("3", "Sing"): "3s", ("1", "Plur"): "1p", ("2", "Plur"): "2p", ("3", "Plur"): "3p"}.get((p, n), "3s")
-        
-    datos.sujeto = doc[:idx].text.strip()
-    datos.complementos = doc[idx+1:].text.strip()
-    return True, verbo_token.text, lema_limpio
-
-def construir_perif(tipo, datos):
-    if tipo == 'gerundio_pret': v = ESTAR_PRETERITO.get(datos.persona_numero, "estuvo")
-    elif tipo == 'gerundio_pres': v = ESTAR.get(datos.persona_numero, "está")
-    elif tipo == 'gerundio_subj': v = ESTAR_SUBJUNTIVO.get(datos.persona_numero, "estuviera")
-    elif tipo == 'participio': v = HABER.get(datos.persona_numero, "ha")
-    elif tipo == 'infinitivo': return " ".join(p for p in [f"{DEJAR.get(datos.persona_numero, 'dejara')} de {datos.infinitivo}", datos.complementos] if p)
-    aux = f"{v} {datos.gerundio}" if 'gerundio' in tipo else f"{v} {datos.participio}"
-    return " ".join(p for p in [datos.sujeto, aux, datos.complementos] if p)
+# La lógica está en nucleo/aktionsart_es.py; este módulo es solo la interfaz
+from nucleo.aktionsart_es import (
+    DatosClause, PERSONAS_DICT, RasgosPred, analizar_automaticamente,
+    calcular_aktionsart, oraciones_prueba,
+)
 
 # --- NAVEGACIÓN ---
 def ir_a(paso):
@@ -149,14 +11,20 @@ def ir_a(paso):
     st.session_state.akt_paso = paso
     st.rerun()
 
+def ir_a_pruebas():
+    """Pasa a las pruebas diagnósticas: una por pantalla o todas juntas en modo experto."""
+    st.session_state.pruebas = oraciones_prueba(st.session_state.datos)
+    ir_a('matriz' if st.session_state.get('modo_experto') else 'estatividad')
+
 def volver():
     if st.session_state.historial:
         paso_actual = st.session_state.akt_paso
         if paso_actual == 'limpieza':
             st.session_state.rasgos.causativo = None
             st.session_state.variante_no_causativa = ""
-        elif paso_actual == 'estatividad':
+        elif paso_actual in ('estatividad', 'matriz'):
             st.session_state.datos = DatosClause()
+            st.session_state.pop('pruebas', None)
         elif paso_actual == 'puntualidad':
             st.session_state.rasgos.estativo = None
         elif paso_actual == 'telicidad':
@@ -170,7 +38,7 @@ def volver():
         st.rerun()
 
 def reiniciar_analisis():
-    for key in ['akt_paso', 'historial', 'rasgos', 'datos', 'oracion_original', 'oracion_actual', 'clausula_limpia', 'variante_no_causativa', 'reformulacion']:
+    for key in ['akt_paso', 'historial', 'rasgos', 'datos', 'oracion_original', 'oracion_actual', 'clausula_limpia', 'variante_no_causativa', 'reformulacion', 'pruebas']:
         if key in st.session_state:
             del st.session_state[key]
     st.rerun()
@@ -252,15 +120,7 @@ def mostrar_detector_es():
 
     label_resultado = ""
     if st.session_state.akt_paso == 'resultado':
-        res_r = st.session_state.rasgos
-        if res_r.estativo: sub = "estado"
-        elif res_r.puntual and res_r.telico: sub = "logro"
-        elif res_r.puntual and not res_r.telico: sub = "semelfactivo"    
-        elif not res_r.puntual and res_r.telico and res_r.dinamico: sub = "realización activa"
-        elif not res_r.puntual and not res_r.telico and res_r.dinamico: sub = "actividad"
-        elif not res_r.puntual and res_r.telico and not res_r.dinamico: sub = "realización"
-        else: sub = "proceso"
-        label_resultado = f"{sub} causativa" if res_r.causativo and sub in ["realización", "realización activa", "actividad"] else (f"{sub} causativo" if res_r.causativo else sub)
+        label_resultado = calcular_aktionsart(st.session_state.rasgos)
 
     col_izq, col_spacer, col_der = st.columns([0.6, 0.02, 0.38])
 
@@ -271,7 +131,9 @@ def mostrar_detector_es():
             st.write("Si suena muy extraña, escríbela en **presente** (ej.: *María sabe inglés*).")
             with st.form(key="form_inicio_es"):
                 oracion = st.text_input("Cláusula:")
+                experto = st.checkbox("Modo experto: responder todas las pruebas diagnósticas en una sola pantalla", value=st.session_state.get('modo_experto', False))
                 if st.form_submit_button("Comenzar el análisis"):
+                    st.session_state.modo_experto = experto
                     if oracion:
                         oracion_limpia = oracion.strip().rstrip('.')
                         st.session_state.oracion_original = oracion_limpia
@@ -385,7 +247,7 @@ def mostrar_detector_es():
                 st.markdown(html_tabla, unsafe_allow_html=True)
                 st.write("¿Es correcto este análisis?")
                 c1, c2 = st.columns(2)
-                if c1.button("Sí", use_container_width=True): ir_a('estatividad')
+                if c1.button("Sí", use_container_width=True): ir_a_pruebas()
                 if c2.button("No", use_container_width=True): ir_a('manual_morph')
                 botones_navegacion()
             else:
@@ -408,7 +270,48 @@ def mostrar_detector_es():
                     index=idx_actual
                 )
                 if st.form_submit_button("Guardar"):
-                    ir_a('estatividad')
+                    ir_a_pruebas()
+            botones_navegacion()
+
+        elif st.session_state.akt_paso == 'matriz':
+            st.markdown("#### **Pruebas diagnósticas**")
+            st.write("Responde todas las pruebas y presiona **Calcular aktionsart**.")
+            oracion = st.session_state.oracion_actual.capitalize()
+            p_pret = st.session_state.pruebas['gerundio_pret']
+            p_ger = st.session_state.pruebas['gerundio_subj']
+            p_inf = st.session_state.pruebas['infinitivo']
+            p_par = st.session_state.pruebas['participio']
+            p_pres = st.session_state.pruebas['gerundio_pres']
+            with st.form(key="form_matriz_es"):
+                st.markdown("**Estatividad.**")
+                for col, pregunta in zip(st.columns(3), ["¿Qué pasó hace un rato?", "¿Qué pasó ayer?", "¿Qué pasó el mes pasado?"]):
+                    col.markdown(f"— {pregunta}<br>— <i>{oracion}</i>.", unsafe_allow_html=True)
+                r_est = st.radio(f"¿Te parece que *{st.session_state.oracion_actual}* es una buena respuesta a, al menos, una de estas preguntas?", ["Sí", "No"], index=None, horizontal=True, key="mx_estatividad")
+                st.markdown("**Puntualidad.**")
+                lista_elegante([f"<i>{p_pret.capitalize()} durante una hora.</i>", f"<i>{p_pret.capitalize()} durante un mes.</i>"])
+                r_pun = st.radio("¿Es alguna de estas una expresión posible? **(Si la expresión tiene sentido iterativo o de inminencia, responde que no)**.", ["Sí", "No"], index=None, horizontal=True, key="mx_puntualidad")
+                st.markdown("**Telicidad.**")
+                st.write(f"Imagina que {p_ger} y de pronto {p_inf}.")
+                r_tel = st.radio(f"¿Se podría decir que *{p_par}*?", ["Sí", "No"], index=None, horizontal=True, key="mx_telicidad")
+                st.markdown("**Dinamicidad.**")
+                lista_elegante([f"<i>{p_pres.capitalize()} enérgicamente</i>.", f"<i>{p_pres.capitalize()} con fuerza</i>.", f"<i>{p_pres.capitalize()} con ganas</i>."])
+                r_din = st.radio("¿Te parecería natural decir algunas de estas expresiones?", ["Sí", "No"], index=None, horizontal=True, key="mx_dinamicidad")
+                if st.form_submit_button("Calcular aktionsart", use_container_width=True):
+                    if r_est is None:
+                        st.warning("Por favor, responde la prueba de estatividad.")
+                    elif r_est == "No":
+                        r = st.session_state.rasgos
+                        r.estativo, r.puntual, r.telico, r.dinamico = True, None, None, None
+                        ir_a('resultado')
+                    elif None in (r_pun, r_tel, r_din):
+                        st.warning("Por favor, responde todas las pruebas.")
+                    else:
+                        r = st.session_state.rasgos
+                        r.estativo = False
+                        r.puntual = r_pun == "No"
+                        r.telico = r_tel == "No"
+                        r.dinamico = r_din == "Sí"
+                        ir_a('resultado')
             botones_navegacion()
 
         elif st.session_state.akt_paso == 'estatividad':
@@ -435,7 +338,7 @@ def mostrar_detector_es():
 
         elif st.session_state.akt_paso == 'puntualidad':
             st.markdown("#### **Prueba de puntualidad**")
-            p = construir_perif('gerundio_pret', st.session_state.datos)
+            p = st.session_state.pruebas['gerundio_pret']
             st.write("Observa estas expresiones:")
             lista_elegante([
                 f"<i>{p.capitalize()} durante una hora.</i>",
@@ -453,9 +356,9 @@ def mostrar_detector_es():
 
         elif st.session_state.akt_paso == 'telicidad':
             st.markdown("#### **Prueba de telicidad**")
-            p_ger = construir_perif('gerundio_subj', st.session_state.datos)
-            p_inf = construir_perif('infinitivo', st.session_state.datos)
-            p_par = construir_perif('participio', st.session_state.datos)
+            p_ger = st.session_state.pruebas['gerundio_subj']
+            p_inf = st.session_state.pruebas['infinitivo']
+            p_par = st.session_state.pruebas['participio']
             st.write(f"Imagina que {p_ger} y de pronto {p_inf}.")
             st.write(f"¿Se podría decir que *{p_par}*?")
             c1, c2 = st.columns(2)
@@ -469,7 +372,7 @@ def mostrar_detector_es():
 
         elif st.session_state.akt_paso == 'dinamicidad':
             st.markdown("#### **Prueba de dinamicidad**")
-            p = construir_perif('gerundio_pres', st.session_state.datos)
+            p = st.session_state.pruebas['gerundio_pres']
             st.write("Observa estas expresiones:")
             lista_elegante([
                 f"<i>{p.capitalize()} enérgicamente</i>.",
@@ -0,0 +1,167 @@
+"""Analizador rápido por reglas para cláusulas simples del español.
+
+Busca el verbo sin análisis sintáctico: descarta las palabras funcionales, los
+nombres propios y las palabras precedidas de un determinante, analiza el resto con
+morfologia_es y puntúa cada candidato (forma finita, lema conocido, clítico o
+negación delante, concordancia con un pronombre sujeto). En las perífrasis (está
+cantando, ha comido, va a salir) el verbo es la forma no finita, no el auxiliar,
+como la raíz que elige spaCy. La confianza depende de
+la ventaja del mejor candidato sobre el segundo, y no llega al umbral si el lema no
+es un verbo conocido; el detector usa spaCy solo cuando no llega al umbral, y este
+análisis cuando el modelo no está instalado.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from conjugacion_es import lemas_irregulares
+from datos_lexicos import LexicoRecargable, ruta_datos
+from morfologia_es import CLITICOS, LEMAS_CONOCIDOS, AnalisisVerbal, analizar_forma, procliticos_contiguos
+
+TOKEN = re.compile(r"[^\W\d_]+")
+
+DETERMINANTES = frozenset({
+    "el", "la", "los", "las", "un", "una", "unos", "unas", "al", "del", "lo",
+    "este", "esta", "estos", "estas", "ese", "esa", "esos", "esas", "aquel", "aquella", "aquellos", "aquellas",
+    "mi", "mis", "tu", "tus", "su", "sus", "nuestro", "nuestra", "nuestros", "nuestras",
+    "vuestro", "vuestra", "vuestros", "vuestras", "algún", "alguna", "algunos", "algunas",
+    "ningún", "ninguna", "cada", "otro", "otra", "otros", "otras", "mucho", "mucha", "muchos", "muchas",
+    "poco", "poca", "pocos", "pocas", "varios", "varias", "todo", "toda", "todos", "todas",
+})
+
+PRONOMBRES_SUJETO = {
+    "yo": "1s", "tú": "2s", "vos": "2s", "él": "3s", "ella": "3s", "usted": "3s",
+    "nosotros": "1p", "nosotras": "1p", "vosotros": "2p", "vosotras": "2p",
+    "ustedes": "3p", "ellos": "3p", "ellas": "3p",
+}
+
+PALABRAS_FUNCIONALES = DETERMINANTES | frozenset(PRONOMBRES_SUJETO) | frozenset({
+    "a", "ante", "bajo", "con", "contra", "de", "desde", "durante", "en", "entre", "hacia", "hasta",
+    "para", "por", "según", "sin", "sobre", "tras", "y", "e", "o", "u", "ni", "pero", "sino",
+    "que", "si", "como", "cuando", "donde", "porque", "no", "ya", "muy", "más", "menos", "también",
+    "tampoco", "aquí", "allí", "ahí", "hoy", "ayer", "mañana", "siempre", "nunca", "bien", "mal",
+    "mí", "ti", "sí", "conmigo", "contigo", "consigo", "nada", "algo", "alguien", "nadie",
+    "tarde", "temprano", "pronto", "luego", "después", "antes", "ahora", "entonces", "todavía", "aún",
+})
+
+NO_FINITOS = frozenset({"infinitivo", "gerundio", "participio"})
+
+# Perífrasis cuyo verbo es la forma no finita: auxiliar -> (palabra de enlace, forma del verbo)
+PERIFRASIS = {"estar": ("", "gerundio"), "haber": ("", "participio"), "ir": ("a", "infinitivo")}
+
+# Confianza mínima para no consultar a spaCy
+UMBRAL_CONFIANZA = 0.75
+
+def _leer_verbos(ruta: str) -> FrozenSet[str]:
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            return frozenset(l.strip() for l in f if l.strip() and not l.startswith("#"))
+    except FileNotFoundError:
+        return frozenset()
+
+VERBOS = LexicoRecargable(ruta_datos("verbos_es.txt"), _leer_verbos)
+
+def verbos_conocidos() -> FrozenSet[str]:
+    """Lemas que el analizador da por verbos seguros (lista frecuente, irregulares y de cambio vocálico)."""
+    return _unir_verbos(VERBOS.actual(), lemas_irregulares())
+
+@lru_cache(maxsize=2)
+def _unir_verbos(frecuentes: FrozenSet[str], irregulares: FrozenSet[str]) -> FrozenSet[str]:
+    return frecuentes | irregulares | LEMAS_CONOCIDOS
+
+@dataclass(frozen=True)
+class AnalisisRapido:
+    palabras: Tuple[str, ...]
+    posiciones: Tuple[Tuple[int, int], ...]   # inicio y fin de cada palabra en la oración
+    indice: int                               # palabra del verbo
+    analisis: AnalisisVerbal
+    confianza: float
+
+def _auxiliado(palabras: List[str], i: int, analisis: AnalisisVerbal, lexico: FrozenSet[str]) -> Optional[int]:
+    """Índice del verbo principal si la palabra i es el auxiliar de una perífrasis
+    (está cantando, ha comido, va a salir); None si no lo es."""
+    if analisis.lema not in PERIFRASIS or analisis.tiempo in NO_FINITOS:
+        return None
+    enlace, forma = PERIFRASIS[analisis.lema]
+    j = i + 1
+    if enlace:
+        if j >= len(palabras) or palabras[j].lower() != enlace:
+            return None
+        j += 1
+    if j >= len(palabras):
+        return None
+    principal = analizar_forma(palabras[j], lexico=lexico)
+    return j if principal is not None and principal.tiempo == forma else None
+
+def _candidatos(palabras: List[str], lexico: FrozenSet[str]) -> List[Tuple[int, int, AnalisisVerbal]]:
+    sujeto = ""
+    candidatos = []
+    auxiliados = set()   # verbos principales de una perífrasis ya vista
+    for i, palabra in enumerate(palabras):
+        baja = palabra.lower()
+        anterior = palabras[i - 1].lower() if i else ""
+        if baja in PRONOMBRES_SUJETO:
+            sujeto = PRONOMBRES_SUJETO[baja]
+        if baja in PALABRAS_FUNCIONALES or baja in CLITICOS or anterior in DETERMINANTES:
+            continue
+        if i and palabra[0].isupper():
+            continue  # nombre propio
+        analisis = analizar_forma(palabra, lexico=lexico, persona_sugerida=sujeto,
+                                  procliticos=procliticos_contiguos(palabras, i))
+        if analisis is None:
+            continue
+        principal = _auxiliado(palabras, i, analisis, lexico)
+        if principal is not None:
+            auxiliados.add(principal)
+            continue  # el auxiliar no es el predicado
+        puntaje = 0
+        if i in auxiliados:
+            puntaje += 2
+        if analisis.tiempo not in NO_FINITOS:
+            puntaje += 2
+        if analisis.lema in lexico:
+            puntaje += 2
+        if anterior in CLITICOS or anterior == "no":
+            puntaje += 2
+        if sujeto and analisis.persona_numero == sujeto:
+            puntaje += 1
+        if i == 0 and palabra[0].isupper() and len(palabras) > 1:
+            puntaje -= 1  # al comienzo, una mayúscula suele ser el sujeto (Pedro, Ana)
+        candidatos.append((puntaje, i, analisis))
+    return candidatos
+
+def analizar_rapido(oracion: str, lexico: Optional[FrozenSet[str]] = None) -> Optional[AnalisisRapido]:
+    """Elige el verbo de una cláusula simple. Devuelve None si no encuentra ningún candidato."""
+    lexico = verbos_conocidos() if lexico is None else lexico
+    coincidencias = list(TOKEN.finditer(oracion))
+    palabras = [m.group() for m in coincidencias]
+    candidatos = _candidatos(palabras, lexico)
+    if not candidatos:
+        return None
+    candidatos.sort(key=lambda c: (-c[0], c[1]))
+    puntaje, indice, analisis = candidatos[0]
+    if len(candidatos) == 1:
+        confianza = 1.0 if puntaje >= 2 else 0.6
+    else:
+        # Con empate se elige el primero (orden SVO), pero con poca confianza
+        confianza = round(min(1.0, 0.4 + 0.2 * (puntaje - candidatos[1][0])), 2)
+    if analisis.lema not in lexico:
+        # Un lema que solo sale de las desinencias (hundió -> hunder) se deja a spaCy
+        confianza = min(confianza, 0.6)
+    return AnalisisRapido(
+        palabras=tuple(palabras),
+        posiciones=tuple(m.span() for m in coincidencias),
+        indice=indice,
+        analisis=analisis,
+        confianza=confianza,
+    )
+
+def lemas_por_palabra(palabras: Iterable[str], lexico: FrozenSet[str]) -> List[set]:
+    """Lemas posibles de cada palabra, para buscar predicados multipalabra sin spaCy."""
+    lemas = []
+    for palabra in palabras:
+        analisis = analizar_forma(palabra, lexico=lexico)
+        lemas.append({palabra.lower(), analisis.lema} if analisis else {palabra.lower()})
+    return lemas
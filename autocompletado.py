@@ -0,0 +1,134 @@
+"""Autocompletado de predicados: trie de prefijos e historial de frecuencias.
+
+Cada nodo del trie guarda ya ordenadas las MAXIMO_POR_NODO palabras más frecuentes
+que empiezan por su prefijo, así que completar un prefijo cuesta recorrer sus
+letras y copiar una lista corta. Las frecuencias solo crecen, de modo que una
+palabra que queda fuera de la lista de un nodo solo puede volver a entrar cuando
+se registra otra vez, y en ese momento se actualiza todo su camino.
+
+El historial guarda en un archivo JSON cuántas veces se usó cada predicado en los
+análisis, para que las sugerencias mejoren con el uso.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MAXIMO_POR_NODO = 10
+
+logger = logging.getLogger(__name__)
+
+class _Nodo:
+    __slots__ = ("hijos", "mejores")
+
+    def __init__(self):
+        self.hijos: Dict[str, "_Nodo"] = {}
+        self.mejores: List[Tuple[int, str]] = []
+
+class TriePrefijos:
+    """Palabras con frecuencia, consultables por prefijo en orden de frecuencia."""
+
+    def __init__(self, frecuencias: Optional[Dict[str, int]] = None, maximo_por_nodo: int = MAXIMO_POR_NODO):
+        self._maximo = maximo_por_nodo
+        self._raiz = _Nodo()
+        self._frecuencias: Dict[str, int] = {}
+        self._ranking: Optional[List[str]] = None
+        self._candado = threading.Lock()
+        for palabra, frecuencia in sorted((frecuencias or {}).items()):
+            self.agregar(palabra, frecuencia)
+
+    def __len__(self) -> int:
+        return len(self._frecuencias)
+
+    def __contains__(self, palabra: str) -> bool:
+        return palabra in self._frecuencias
+
+    def frecuencia(self, palabra: str) -> int:
+        return self._frecuencias.get(palabra, 0)
+
+    def agregar(self, palabra: str, frecuencia: int = 0) -> None:
+        """Añade la palabra o sube su frecuencia (nunca la baja)."""
+        with self._candado:
+            frecuencia = max(frecuencia, self._frecuencias.get(palabra, 0))
+            self._frecuencias[palabra] = frecuencia
+            self._ranking = None
+            entrada = (-frecuencia, palabra)
+            nodo = self._raiz
+            self._actualizar(nodo, palabra, entrada)
+            for letra in palabra:
+                nodo = nodo.hijos.setdefault(letra, _Nodo())
+                self._actualizar(nodo, palabra, entrada)
+
+    def _actualizar(self, nodo: _Nodo, palabra: str, entrada: Tuple[int, str]) -> None:
+        # Se arma una lista nueva y se reemplaza de una vez: las consultas no toman el candado
+        mejores = [e for e in nodo.mejores if e[1] != palabra]
+        mejores.append(entrada)
+        mejores.sort()
+        nodo.mejores = mejores[:self._maximo]
+
+    def completar(self, prefijo: str, maximo: int = MAXIMO_POR_NODO) -> List[str]:
+        """Palabras que empiezan por el prefijo, de la más a la menos frecuente."""
+        nodo = self._raiz
+        for letra in prefijo:
+            nodo = nodo.hijos.get(letra)
+            if nodo is None:
+                return []
+        return [palabra for _, palabra in nodo.mejores[:maximo]]
+
+    def ranking(self) -> List[str]:
+        """Todas las palabras, de la más a la menos frecuente (y en orden alfabético si empatan)."""
+        ranking = self._ranking
+        if ranking is None:
+            ranking = [palabra for _, palabra in sorted((-f, p) for p, f in self._frecuencias.items())]
+            self._ranking = ranking
+        return ranking
+
+class HistorialFrecuencias:
+    """Contador persistente de usos. Si el archivo no se puede escribir, sigue solo en memoria."""
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self._candado = threading.Lock()
+        self._conteos: Dict[str, int] = self._leer()
+
+    def _leer(self) -> Dict[str, int]:
+        try:
+            with open(self.ruta, encoding="utf-8") as f:
+                datos = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("No se pudo leer el historial %s: %s", self.ruta, e)
+            return {}
+        return {str(p): int(n) for p, n in datos.items()}
+
+    def conteos(self) -> Dict[str, int]:
+        with self._candado:
+            return dict(self._conteos)
+
+    def registrar(self, palabras: Iterable[str]) -> Dict[str, int]:
+        """Suma un uso a cada palabra, guarda el archivo y devuelve los conteos nuevos."""
+        with self._candado:
+            nuevos = {}
+            for palabra in palabras:
+                self._conteos[palabra] = nuevos[palabra] = self._conteos.get(palabra, 0) + 1
+            self._guardar()
+            return nuevos
+
+    def _guardar(self) -> None:
+        # Se escribe en un temporal y se reemplaza, para no dejar nunca un archivo a medias
+        temporal = None
+        try:
+            carpeta = os.path.dirname(self.ruta) or "."
+            os.makedirs(carpeta, exist_ok=True)
+            descriptor, temporal = tempfile.mkstemp(dir=carpeta, suffix=".tmp")
+            with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+                json.dump(self._conteos, f, ensure_ascii=False, indent=0, sort_keys=True)
+            os.replace(temporal, self.ruta)
+        except OSError as e:
+            logger.warning("No se pudo guardar el historial %s: %s", self.ruta, e)
+            if temporal and os.path.exists(temporal):
+                os.remove(temporal)
@@ -0,0 +1,126 @@
+"""Evalúa los analizadores rápidos por reglas (analisis_rapido_es, quick_parse_en) frente a spaCy.
+
+Para cada umbral de confianza informa qué parte de las cláusulas resuelve la vía rápida
+(cobertura), cuántas de esas aciertan el verbo y el lema anotados a mano y cuántas coinciden con el
+verbo que elige spaCy (si el modelo está instalado). También compara la latencia.
+
+Con --sinteticas N, en lugar de las cláusulas anotadas a mano usa N por idioma de
+generador_clausulas.py (el verbo y el lema anotados son los de la plantilla).
+
+Uso: python benchmarks/bench_analisis_rapido.py [--sinteticas 10000] [--semilla 0]
+"""
+
+import argparse
+
+from comun import cargar_spacy, imprimir_tabla, medir
+
+from analisis_rapido_es import UMBRAL_CONFIANZA, analizar_rapido
+from quick_parse_en import CONFIDENCE_THRESHOLD, quick_analyze
+
+from generador_clausulas import generar
+
+UMBRALES = (0.4, 0.6, 0.75, 0.8, 1.0)
+MAXIMO_FALLOS = 30
+MUESTRA_LATENCIA = 200   # cláusulas con que se mide la latencia
+
+# (cláusula, palabra del verbo, lema)
+CLAUSULAS_ES = [
+    ("Pedro corre", "corre", "correr"), ("Los niños comen manzanas", "comen", "comer"),
+    ("Juan rompió el vaso", "rompió", "romper"), ("El hielo se derritió", "derritió", "derretir"),
+    ("Yo canto una canción", "canto", "cantar"), ("La puerta se abrió", "abrió", "abrir"),
+    ("María escribe cartas a su abuela", "escribe", "escribir"), ("Ana está feliz", "está", "estar"),
+    ("El agua hierve", "hierve", "hervir"), ("Nosotros llegamos tarde", "llegamos", "llegar"),
+    ("Mi hermano no come carne", "come", "comer"), ("El niño cuenta cuentos", "cuenta", "contar"),
+    ("Pedro se dio cuenta del error", "dio", "dar"), ("Juan le hizo caso a María", "hizo", "hacer"),
+    ("Los pájaros vuelan", "vuelan", "volar"), ("La niña duerme en su cama", "duerme", "dormir"),
+    ("El perro ladró toda la noche", "ladró", "ladrar"), ("Ellos construyeron una casa", "construyeron", "construir"),
+    ("El sol brilla", "brilla", "brillar"), ("Mi madre cocinó la cena", "cocinó", "cocinar"),
+    ("Ustedes tienen razón", "tienen", "tener"), ("Tú sabes la respuesta", "sabes", "saber"),
+    ("El tren llegó tarde", "llegó", "llegar"), ("La profesora explicó la lección", "explicó", "explicar"),
+    # Verbos en -ir y cambios de raíz que las desinencias solas confunden
+    ("El barco se hundió", "hundió", "hundir"), ("El herrero fundió el metal", "fundió", "fundir"),
+    ("Ellos unieron las piezas", "unieron", "unir"), ("El buzo se sumergió", "sumergió", "sumergir"),
+    ("Juan se rio", "rio", "reír"), ("La nieve se derrite", "derrite", "derretir"),
+    ("Ana sonrió", "sonrió", "sonreír"), ("El camarero pidió la cuenta", "pidió", "pedir"),
+    # Perífrasis: el verbo es la forma no finita; estar con participio o adjetivo sigue siendo estar
+    ("Juan está cantando", "cantando", "cantar"), ("Juan ha comido una manzana", "comido", "comer"),
+    ("Yo estoy leyendo un libro", "leyendo", "leer"), ("Los niños se han dormido", "dormido", "dormir"),
+    ("Ellos van a salir", "salir", "salir"), ("Juan no ha llegado", "llegado", "llegar"),
+    ("Ana está cansada", "está", "estar"),
+]
+
+CLAUSES_EN = [
+    ("John runs", "runs", "run"), ("The children ate the cake", "ate", "eat"),
+    ("John broke the glass", "broke", "break"), ("The ice melted", "melted", "melt"),
+    ("I sing a song", "sing", "sing"), ("The door opened", "opened", "open"),
+    ("Mary writes letters to her grandmother", "writes", "write"), ("Ann is happy", "is", "be"),
+    ("The water boils", "boils", "boil"), ("We arrived late", "arrived", "arrive"),
+    ("My brother does not eat meat", "eat", "eat"), ("The boy reads a book", "reads", "read"),
+    ("John gave up smoking", "gave", "give"), ("The meeting took place yesterday", "took", "take"),
+    ("Birds fly", "fly", "fly"), ("The girl sleeps in her bed", "sleeps", "sleep"),
+    ("The dog barked all night", "barked", "bark"), ("They built a house", "built", "build"),
+    ("The sun shines", "shines", "shine"), ("My mother cooked dinner", "cooked", "cook"),
+    ("You are right", "are", "be"), ("She knows the answer", "knows", "know"),
+    ("Mary is running", "running", "run"), ("They have eaten", "eaten", "eat"),
+]
+
+def verbo_spacy(nlp, oracion: str) -> str:
+    """Verbo que elige el detector con spaCy: la raíz verbal o, si no, el primer verbo."""
+    doc = nlp(oracion)
+    token = next((t for t in doc if t.dep_ == "ROOT" and t.pos_ in ("VERB", "AUX")), None)
+    token = token or next((t for t in doc if t.pos_ in ("VERB", "AUX")), None)
+    return token.text if token else ""
+
+def evaluar(nombre, clausulas, rapido, confianza, palabra, lema, nlp, umbral_actual):
+    resultados = []
+    for oracion, esperado, lema_esperado in clausulas:
+        r = rapido(oracion)
+        acierto = r is not None and palabra(r) == esperado and lema(r) == lema_esperado
+        resultados.append((oracion, f"{esperado} ({lema_esperado})", r, acierto,
+                           verbo_spacy(nlp, oracion) if nlp else None))
+
+    print(f"\n{nombre}: {len(clausulas)} cláusulas; spaCy {'cargado' if nlp else 'no instalado'}")
+    filas = []
+    for umbral in UMBRALES:
+        cubiertas = [(r, a, s) for _, _, r, a, s in resultados if r and confianza(r) >= umbral]
+        aciertos = sum(a for _, a, _ in cubiertas)
+        acuerdo = f"{sum(palabra(r) == s for r, _, s in cubiertas)}/{len(cubiertas)}" if nlp else "-"
+        marca = " (actual)" if umbral == umbral_actual else ""
+        filas.append((f"{umbral:.2f}{marca}", f"{len(cubiertas)}/{len(clausulas)}", f"{aciertos}/{len(cubiertas)}", acuerdo))
+    imprimir_tabla(("umbral", "cobertura", "aciertos", "acuerdo con spaCy"), filas)
+
+    total = sum(a for _, _, _, a, _ in resultados)
+    print(f"Sin umbral (sin spaCy, todo por reglas): {total}/{len(clausulas)} aciertos")
+    fallos = [(o, e, f"{palabra(r)} ({lema(r)}, {confianza(r):.2f})" if r else "-")
+              for o, e, r, a, _ in resultados if not a]
+    for oracion, esperado, obtenido in fallos[:MAXIMO_FALLOS]:
+        print(f"  {oracion!r}: se esperaba {esperado!r}, se obtuvo {obtenido!r}")
+    if len(fallos) > MAXIMO_FALLOS:
+        print(f"  ... y {len(fallos) - MAXIMO_FALLOS} más")
+
+    oraciones = [o for o, _, _ in clausulas[:MUESTRA_LATENCIA]]
+    latencias = [("reglas", f"{medir(lambda: [rapido(o) for o in oraciones], numero=50) / len(oraciones):.1f}")]
+    if nlp:
+        latencias.append(("spaCy", f"{medir(lambda: [nlp(o) for o in oraciones], numero=5) / len(oraciones):.1f}"))
+    imprimir_tabla(("analizador", "µs por cláusula"), latencias)
+
+def sinteticas(idioma: str, cantidad: int, semilla: int) -> list:
+    return [(f["oracion"], f["verbo"], f["lema"]) for f in generar(cantidad, semilla, idioma)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sinteticas", type=int, help="cláusulas generadas por idioma, en lugar de las anotadas")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    clausulas_es, clauses_en = CLAUSULAS_ES, CLAUSES_EN
+    if args.sinteticas:
+        clausulas_es = sinteticas("es", args.sinteticas, args.semilla)
+        clauses_en = sinteticas("en", args.sinteticas, args.semilla)
+    evaluar("Español", clausulas_es, analizar_rapido, lambda r: r.confianza,
+            lambda r: r.palabras[r.indice], lambda r: r.analisis.lema, cargar_spacy("es_core_news_sm"), UMBRAL_CONFIANZA)
+    evaluar("Inglés", clauses_en, quick_analyze, lambda r: r.confidence,
+            lambda r: r.words[r.index], lambda r: r.lemma, cargar_spacy("en_core_web_sm"), CONFIDENCE_THRESHOLD)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Mide el arranque en frío: importación de los módulos y primer render de cada sección.
+
+Cada prueba corre en un proceso nuevo, repetida --repeticiones veces:
+- importación: tiempo de `import modulo`, memoria residente máxima y, con
+  -X importtime, los módulos que más tardan (tiempo acumulado de la mejor repetición);
+- primer render: tiempo de la primera ejecución de vendler.py con AppTest, con la
+  sección y el idioma fijados de antemano en el estado de la sesión. AppTest
+  devuelve la página completa, así que es el tiempo hasta el último elemento.
+
+Los resultados se guardan en JSON (por defecto en benchmarks/resultados/, uno por
+commit) y --comparar muestra la diferencia con una ejecución anterior.
+
+Uso: python benchmarks/bench_arranque.py [--repeticiones 5] [--salida archivo.json] [--comparar anterior.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from comun import RAIZ, commit_actual, imprimir_tabla
+
+MODULOS = [
+    "nucleo", "nucleo.ls", "nucleo.aktionsart_es", "nucleo.aktionsart_en",
+    "ls", "aktionsart_es", "aktionsart_en", "vendler",
+]
+
+# (sección, idioma)
+SECCIONES = [("home", "EN"), ("akt", "EN"), ("akt", "ES"), ("ls", "ES"), ("info", "ES")]
+
+MEMORIA_MAXIMA = """
+import resource, sys
+maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print("MEMORIA", maximo / 1024 / (1024 if sys.platform == "darwin" else 1))
+"""
+
+HIJO_IMPORTACION = """
+import sys, time
+sys.path.insert(0, {raiz!r})
+sys.stderr.write("INICIO\\n")
+inicio = time.perf_counter()
+import {modulo}
+print("TIEMPO", (time.perf_counter() - inicio) * 1e3)
+sys.stderr.write("FIN\\n")
+""" + MEMORIA_MAXIMA
+
+HIJO_RENDER = """
+import sys, time
+sys.path.insert(0, {raiz!r})
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.session_state["seccion"] = {seccion!r}
+at.session_state["lang"] = {idioma!r}
+inicio = time.perf_counter()
+at.run()
+print("TIEMPO", (time.perf_counter() - inicio) * 1e3)
+print("ELEMENTOS", len(list(at.main)))
+print("ERROR", bool(at.exception))
+""" + MEMORIA_MAXIMA
+
+def ejecutar(codigo: str, importtime: bool = False) -> dict:
+    entorno = {**os.environ, "VENDLER_CALENTAR": "0"}
+    opciones = ["-X", "importtime"] if importtime else []
+    salida = subprocess.run([sys.executable, *opciones, "-c", codigo], capture_output=True, text=True,
+                            cwd=RAIZ, env=entorno)
+    if salida.returncode != 0:
+        raise RuntimeError(salida.stderr.strip().splitlines()[-1] if salida.stderr.strip() else "falló el proceso")
+    valores = {}
+    for linea in salida.stdout.splitlines():
+        clave, _, valor = linea.partition(" ")
+        if clave in ("TIEMPO", "MEMORIA", "ELEMENTOS", "ERROR"):
+            valores[clave.lower()] = valor
+    valores["stderr"] = salida.stderr
+    return valores
+
+def modulos_mas_lentos(stderr: str, cantidad: int = 8) -> list:
+    """Módulos con mayor tiempo acumulado según -X importtime (en ms), sin los del arranque del intérprete."""
+    filas = []
+    for linea in stderr.partition("INICIO\n")[2].partition("FIN\n")[0].splitlines():
+        partes = linea[len("import time:"):].split("|") if linea.startswith("import time:") else []
+        if len(partes) != 3 or not partes[1].strip().isdigit():
+            continue  # otras líneas y el encabezado
+        filas.append((int(partes[1]) / 1e3, partes[2].strip()))
+    return [{"modulo": n, "ms": round(t, 1)} for t, n in sorted(filas, reverse=True)[:cantidad]]
+
+def medir_importacion(modulo: str, repeticiones: int) -> dict:
+    tiempos, memorias, mejor = [], [], None
+    for _ in range(repeticiones):
+        r = ejecutar(HIJO_IMPORTACION.format(raiz=RAIZ, modulo=modulo), importtime=True)
+        tiempo = float(r["tiempo"])
+        tiempos.append(tiempo)
+        memorias.append(float(r["memoria"]))
+        if mejor is None or tiempo < mejor[0]:
+            mejor = (tiempo, r["stderr"])
+    return {
+        "mediana_ms": round(statistics.median(tiempos), 1),
+        "minimo_ms": round(min(tiempos), 1),
+        "memoria_max_mb": round(max(memorias), 1),
+        "mas_lentos": modulos_mas_lentos(mejor[1]),
+    }
+
+def medir_render(seccion: str, idioma: str, repeticiones: int) -> dict:
+    tiempos, memorias, elementos, errores = [], [], 0, False
+    app = os.path.join(RAIZ, "vendler.py")
+    for _ in range(repeticiones):
+        r = ejecutar(HIJO_RENDER.format(raiz=RAIZ, app=app, seccion=seccion, idioma=idioma))
+        tiempos.append(float(r["tiempo"]))
+        memorias.append(float(r["memoria"]))
+        elementos = int(r["elementos"])
+        errores = errores or r["error"] == "True"
+    return {
+        "mediana_ms": round(statistics.median(tiempos), 1),
+        "minimo_ms": round(min(tiempos), 1),
+        "memoria_max_mb": round(max(memorias), 1),
+        "elementos": elementos,
+        "excepcion": errores,
+    }
+
+def diferencia(actual: float, anterior: dict, clave: str) -> str:
+    if not anterior or clave not in anterior:
+        return "-"
+    delta = actual - anterior[clave]["mediana_ms"]
+    return f"{delta:+.1f}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--salida", help="archivo JSON de resultados")
+    parser.add_argument("--comparar", help="resultados JSON de una ejecución anterior")
+    args = parser.parse_args()
+
+    commit = commit_actual()
+    anterior = {}
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            anterior = json.load(f)
+
+    resultados = {
+        "commit": commit,
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "repeticiones": args.repeticiones,
+        "importacion": {m: medir_importacion(m, args.repeticiones) for m in MODULOS},
+        "render": {f"{s}/{i}": medir_render(s, i, args.repeticiones) for s, i in SECCIONES},
+    }
+
+    print(f"Commit {commit}, {args.repeticiones} repeticiones por prueba\n")
+    imprimir_tabla(
+        ("módulo", "mediana ms", "mínimo ms", "MB máx.", "Δ ms", "más lento"),
+        [(m, r["mediana_ms"], r["minimo_ms"], r["memoria_max_mb"],
+          diferencia(r["mediana_ms"], anterior.get("importacion"), m),
+          next((x["modulo"] for x in r["mas_lentos"] if x["modulo"] != m), "-"))
+         for m, r in resultados["importacion"].items()],
+    )
+    print()
+    imprimir_tabla(
+        ("sección", "mediana ms", "mínimo ms", "MB máx.", "Δ ms", "elementos", "excepción"),
+        [(s, r["mediana_ms"], r["minimo_ms"], r["memoria_max_mb"],
+          diferencia(r["mediana_ms"], anterior.get("render"), s), r["elementos"], "sí" if r["excepcion"] else "no")
+         for s, r in resultados["render"].items()],
+    )
+
+    salida = args.salida or os.path.join(RAIZ, "benchmarks", "resultados", f"arranque_{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump(resultados, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados en {salida}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+"""Prueba de carga: cuántas sesiones simultáneas atiende un proceso de Streamlit.
+
+Levanta `streamlit run vendler.py` (o usa uno ya en marcha con --url y --pid) y abre
+sesiones por websocket, como el navegador. Cada sesión repite los recorridos de
+CAMINOS, con una pausa entre acción y acción (el tiempo que el estudiante lee y responde):
+
+- es_ls: detector en español hasta el resultado, paso al asistente de estructuras
+  lógicas (se comprueba que llegó el aktionsart detectado, ls_akt) y LS final;
+- en: detector en inglés en modo experto hasta el resultado;
+- operadores: formulario experto de LS con operadores, hasta la exportación (texto,
+  LaTeX e imagen), descargando el PNG.
+
+Cada acción que en el navegador provoca una reejecución (un clic, un cambio fuera de
+un formulario) es una reejecución aquí. Se mide su latencia (del envío a
+script_finished), las reejecuciones por análisis completo, y la CPU y la memoria
+residente del proceso del servidor. Las sesiones suben por niveles (--sesiones) y se
+informa el mayor nivel con p95 por debajo de --limite-ms y sin recorridos fallidos.
+
+AppTest no sirve aquí: usa un Runtime global y no admite sesiones simultáneas en un
+mismo proceso. Además, por websocket se mide también el trabajo del propio servidor
+(protobuf, envío de deltas, archivos de medios).
+
+El servidor que se levanta usa VENDLER_TRADUCIR=0 (sin consultas a Google Translate,
+que medirían la red; --traducir las deja) y un historial de predicados temporal.
+
+Uso: python benchmarks/bench_carga.py [--sesiones 1,2,4,8,16] [--duracion 60] [--pausa 1.0]
+                                      [--limite-ms 500] [--url ws://host:puerto --pid PID] [--salida archivo.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from comun import RAIZ, commit_actual, imprimir_tabla
+
+from lanzador import memoria_proceso
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+try:
+    import websockets
+except ImportError:  # Streamlit lo instala desde que sirve con Starlette
+    websockets = None
+
+ESPERA_MAXIMA_SEG = 120   # por reejecución
+WIDGETS = ("button", "download_button", "text_input", "checkbox", "radio", "selectbox")
+
+# Sin proxies: el servidor está en localhost
+_abridor = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+class ErrorCamino(Exception):
+    """La página no tiene lo que el recorrido esperaba, o la aplicación lanzó una excepción."""
+
+class SesionWeb:
+    """Una pestaña del navegador: el websocket, los widgets de la última ejecución y las
+    acciones del usuario sobre ellos."""
+
+    def __init__(self, url: str, latencias: List[float], pensar: Callable[[], float]):
+        self.url = url
+        self.latencias = latencias
+        self.pensar = pensar
+        self.reejecuciones = 0
+        self.widgets: List[tuple] = []
+        self.textos: List[str] = []
+        self._excepciones: List[str] = []
+        self._pendientes: Dict[str, WidgetState] = {}
+        self._ws = None
+
+    async def abrir(self) -> None:
+        self._ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        await self.ejecutar([])
+
+    async def cerrar(self) -> None:
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def ejecutar(self, estados: List[WidgetState]) -> None:
+        mensaje = BackMsg()
+        mensaje.rerun_script.query_string = ""
+        mensaje.rerun_script.widget_states.widgets.extend(estados)
+        inicio = time.perf_counter()
+        await self._ws.send(mensaje.SerializeToString())
+        while True:
+            respuesta = ForwardMsg()
+            respuesta.ParseFromString(await asyncio.wait_for(self._ws.recv(), ESPERA_MAXIMA_SEG))
+            tipo = respuesta.WhichOneof("type")
+            if tipo == "new_session":  # empieza una ejecución (también tras st.rerun)
+                self.widgets, self.textos, self._excepciones = [], [], []
+            elif tipo == "delta" and respuesta.delta.WhichOneof("type") == "new_element":
+                self._registrar(respuesta.delta.new_element)
+            elif tipo == "script_finished" and respuesta.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+        self.latencias.append((time.perf_counter() - inicio) * 1e3)
+        self.reejecuciones += 1
+        if self._excepciones:
+            raise ErrorCamino(f"excepción en la aplicación: {self._excepciones[0]}")
+
+    def _registrar(self, elemento) -> None:
+        tipo = elemento.WhichOneof("type")
+        proto = getattr(elemento, tipo)
+        if tipo in WIDGETS:
+            self.widgets.append((tipo, proto))
+        elif tipo in ("markdown", "alert"):
+            self.textos.append(proto.body)
+        elif tipo == "exception":
+            self._excepciones.append(f"{proto.type}: {proto.message}")
+
+    def buscar(self, tipo: str, etiqueta: Optional[str] = None, clave: Optional[str] = None):
+        for t, proto in self.widgets:
+            if t == tipo and ((clave is not None and proto.id.endswith(f"-{clave}"))
+                              or (etiqueta is not None and proto.label == etiqueta)):
+                return proto
+        return None
+
+    def widget(self, tipo: str, etiqueta: Optional[str] = None, clave: Optional[str] = None):
+        proto = self.buscar(tipo, etiqueta, clave)
+        if proto is None:
+            botones = ", ".join(repr(p.label) for t, p in self.widgets if t == "button")
+            raise ErrorCamino(f"no hay {tipo} {clave or etiqueta!r} en la página (botones: {botones})")
+        return proto
+
+    def exigir(self, fragmento: str) -> None:
+        if not any(fragmento in texto for texto in self.textos):
+            raise ErrorCamino(f"la página no dice {fragmento!r}")
+
+    async def clic(self, etiqueta: Optional[str] = None, clave: Optional[str] = None) -> None:
+        boton = self.widget("button", etiqueta, clave)
+        await asyncio.sleep(self.pensar())
+        estados = [*self._pendientes.values(), WidgetState(id=boton.id, trigger_value=True)]
+        self._pendientes.clear()
+        await self.ejecutar(estados)
+
+    async def fijar(self, tipo: str, valor, etiqueta: Optional[str] = None, clave: Optional[str] = None,
+                    posicion: Optional[int] = None) -> None:
+        """Cambia el valor de un widget. Fuera de un formulario el navegador reejecuta en el
+        acto; dentro de uno, el valor viaja con el botón de envío."""
+        if posicion is not None:
+            candidatos = [p for t, p in self.widgets if t == tipo]
+            if posicion >= len(candidatos):
+                raise ErrorCamino(f"no hay {tipo} número {posicion} en la página")
+            proto = candidatos[posicion]
+        else:
+            proto = self.widget(tipo, etiqueta, clave)
+        estado = WidgetState(id=proto.id)
+        if tipo == "checkbox":
+            estado.bool_value = valor
+        else:
+            # radio y selectbox viajan como la opción ya formateada
+            if tipo in ("radio", "selectbox") and valor not in proto.options and not getattr(proto, "accept_new_options", False):
+                raise ErrorCamino(f"{tipo} {clave or etiqueta!r} no tiene la opción {valor!r}")
+            estado.string_value = valor
+        self._pendientes[proto.id] = estado
+        if not proto.form_id:
+            await asyncio.sleep(self.pensar())
+            estados = list(self._pendientes.values())
+            self._pendientes.clear()
+            await self.ejecutar(estados)
+
+    async def descargar(self, etiqueta: str) -> float:
+        """Pide el archivo de un st.download_button como el navegador; devuelve los ms."""
+        boton = self.widget("download_button", etiqueta)
+        base = self.url.replace("ws://", "http://", 1).replace("wss://", "https://", 1).rsplit("/_stcore/", 1)[0]
+        inicio = time.perf_counter()
+        await asyncio.to_thread(lambda: _abridor.open(base + boton.url, timeout=ESPERA_MAXIMA_SEG).read())
+        return (time.perf_counter() - inicio) * 1e3
+
+# --- RECORRIDOS ---
+
+async def camino_es_ls(s: SesionWeb) -> None:
+    await s.clic(clave="lang_btn")  # la portada abre en inglés
+    await s.clic(clave="go_akt_es")
+    await s.fijar("text_input", "Juan escribió una carta", etiqueta="Cláusula:")
+    await s.fijar("checkbox", True, etiqueta="Modo experto: responder todas las pruebas diagnósticas en una sola pantalla")
+    await s.clic("Comenzar el análisis")
+    await s.clic("No es posible reformularla")
+    await s.clic("No")  # no hay elementos que limpiar
+    if s.buscar("button", "Guardar"):  # ni reglas ni spaCy: formas a mano
+        for i, valor in enumerate(("escribir", "escribiendo", "escrito", "Juan", "una carta")):
+            await s.fijar("text_input", valor, posicion=i)
+        await s.clic("Guardar")
+    else:
+        await s.clic("Sí")  # confirma el análisis morfológico
+    for clave, valor in (("mx_estatividad", "Sí"), ("mx_puntualidad", "Sí"), ("mx_telicidad", "No"), ("mx_dinamicidad", "Sí")):
+        await s.fijar("radio", valor, clave=clave)
+    await s.clic("Calcular aktionsart")
+    await s.clic("Obtener Estructura Lógica")
+    s.exigir("El aktionsart detectado")  # ls_akt pasó del detector al asistente
+    await s.clic("Usar estos datos")
+    await s.fijar("checkbox", True, clave="chk_sujeto")
+    await s.fijar("radio", "La información se expresa en un constituyente sintáctico", clave="radio_sujeto")
+    await s.fijar("text_input", "Juan", clave="input_sujeto")
+    await s.clic(clave="btn_args_siguiente")
+    await s.clic("No")  # sin locativo
+    await s.fijar("selectbox", "escribir", etiqueta="Infinitivo")
+    await s.clic("Siguiente")
+    await s.fijar("radio", "Creación", etiqueta="Tipo de verbo")
+    await s.clic("Siguiente")
+    await s.clic("Sí")  # Juan actúa intencionalmente
+    await s.clic("No, continuar")
+    await s.clic("No, finalizar")
+    s.exigir("Resultado final")
+
+async def camino_en(s: SesionWeb) -> None:
+    await s.clic(clave="go_akt_en")
+    await s.fijar("text_input", "Peter ran home", etiqueta="Clause:")
+    await s.fijar("checkbox", True, etiqueta="Expert mode: answer all the diagnostic tests on a single screen")
+    await s.clic("Start the analysis")
+    await s.clic("Not possible to paraphrase")
+    await s.clic("No")
+    if s.buscar("button", "Save"):
+        for i, valor in enumerate(("run", "running", "run", "Peter", "home")):
+            await s.fijar("text_input", valor, posicion=i)
+        await s.clic("Save")
+    else:
+        await s.clic("Yes")
+    for clave in ("mx_stativity", "mx_punctuality", "mx_telicity", "mx_dynamicity"):
+        await s.fijar("radio", "Yes", clave=clave)
+    await s.clic("Compute aktionsart")
+    s.exigir("Analysis complete")
+
+async def camino_operadores(s: SesionWeb) -> List[float]:
+    await s.clic(clave="lang_btn")
+    await s.clic(clave="go_ls_es")
+    await s.clic(clave="ir_experto")
+    await s.fijar("selectbox", "Actividad", clave="exp_akt")
+    await s.fijar("text_input", "Pepe no corre", clave="exp_oracion")
+    await s.fijar("text_input", "Pepe", clave="exp_x")
+    await s.fijar("text_input", "correr", clave="exp_predicado")
+    await s.fijar("radio", "No", clave="exp_preg_locativo")
+    await s.clic("Generar estructura lógica")
+    await s.fijar("radio", "No", clave="exp_preg_regimen")
+    await s.clic("Generar estructura lógica")
+    await s.fijar("radio", "Sí", clave="exp_preg_intencional")
+    await s.fijar("checkbox", True, clave="exp_op_check_0")
+    await s.fijar("text_input", "DECL", clave="exp_op_val_0")
+    await s.fijar("checkbox", True, clave="exp_op_check_3")
+    await s.fijar("text_input", "PRES", clave="exp_op_val_3")
+    await s.fijar("checkbox", True, clave="exp_op_check_10")
+    await s.clic("Generar estructura lógica")
+    s.exigir("Resultado final")
+    return [await s.descargar("Descargar como PNG")]
+
+CAMINOS = {"es_ls": camino_es_ls, "en": camino_en, "operadores": camino_operadores}
+
+# --- MEDICIÓN ---
+
+@dataclass
+class Registro:
+    latencias: Dict[str, List[float]] = field(default_factory=lambda: {c: [] for c in CAMINOS})
+    completos: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(CAMINOS, 0))
+    reejecuciones: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(CAMINOS, 0))  # de los completos
+    fallos: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(CAMINOS, 0))
+    errores: List[str] = field(default_factory=list)
+    descargas: List[float] = field(default_factory=list)
+
+async def recorrer(url: str, nombre: str, registro: Registro, pensar: Callable[[], float]) -> None:
+    sesion = SesionWeb(url, registro.latencias[nombre], pensar)
+    try:
+        await sesion.abrir()
+        descargas = await CAMINOS[nombre](sesion)
+    except (ErrorCamino, asyncio.TimeoutError, OSError, websockets.exceptions.WebSocketException) as error:
+        registro.fallos[nombre] += 1
+        if len(registro.errores) < 20:
+            registro.errores.append(f"{nombre}: {type(error).__name__}: {error}")
+    else:
+        registro.completos[nombre] += 1
+        registro.reejecuciones[nombre] += sesion.reejecuciones
+        registro.descargas.extend(descargas or [])
+    finally:
+        try:
+            await sesion.cerrar()
+        except Exception:
+            pass
+
+def cpu_proceso(pid: int) -> Optional[float]:
+    """Segundos de CPU (usuario + sistema) que lleva el proceso, de /proc/<pid>/stat."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            campos = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(campos[11]) + int(campos[12])) / os.sysconf("SC_CLK_TCK")
+
+async def vigilar_memoria(pid: Optional[int], maximos: List[float]) -> None:
+    while pid is not None:
+        memoria = memoria_proceso(pid)
+        if memoria is not None:
+            maximos.append(memoria.rss)
+        await asyncio.sleep(0.5)
+
+def percentil(valores: List[float], p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+async def correr_nivel(url: str, pid: Optional[int], sesiones: int, duracion: float, pausa: float,
+                       semilla: int) -> dict:
+    registro = Registro()
+    fin = time.monotonic() + duracion
+
+    async def estudiante(numero: int) -> None:
+        azar = random.Random(semilla * 1000 + numero)
+        pensar = lambda: pausa * azar.uniform(0.5, 1.5)
+        await asyncio.sleep(azar.uniform(0, pausa))  # que no lleguen todos a la vez
+        nombres = list(CAMINOS)
+        vuelta = numero
+        while time.monotonic() < fin:
+            await recorrer(url, nombres[vuelta % len(nombres)], registro, pensar)
+            vuelta += 1
+
+    memorias: List[float] = []
+    vigia = asyncio.create_task(vigilar_memoria(pid, memorias))
+    cpu_antes, cpu_cliente_antes = cpu_proceso(pid) if pid else None, time.process_time()
+    inicio = time.perf_counter()
+    await asyncio.gather(*(estudiante(n) for n in range(sesiones)))
+    pared = time.perf_counter() - inicio
+    cpu_despues = cpu_proceso(pid) if pid else None
+    vigia.cancel()
+
+    todas = [x for lista in registro.latencias.values() for x in lista]
+    completos = sum(registro.completos.values())
+    resumen = {
+        "sesiones": sesiones,
+        "segundos": round(pared, 1),
+        "completos": completos,
+        "fallos": sum(registro.fallos.values()),
+        "analisis_por_minuto": round(completos / pared * 60, 1),
+        "reejecuciones": len(todas),
+        "p50_ms": round(statistics.median(todas), 1) if todas else None,
+        "p95_ms": round(percentil(todas, 95), 1) if todas else None,
+        "p99_ms": round(percentil(todas, 99), 1) if todas else None,
+        "max_ms": round(max(todas), 1) if todas else None,
+        "reejecuciones_por_analisis": round(sum(registro.reejecuciones.values()) / completos, 1) if completos else None,
+        "cpu_servidor_pct": round((cpu_despues - cpu_antes) / pared * 100, 1) if cpu_antes is not None and cpu_despues is not None else None,
+        "cpu_cliente_pct": round((time.process_time() - cpu_cliente_antes) / pared * 100, 1),
+        "rss_max_mb": round(max(memorias), 1) if memorias else None,
+        "descarga_p95_ms": round(percentil(registro.descargas, 95), 1) if registro.descargas else None,
+        "caminos": {
+            nombre: {
+                "completos": registro.completos[nombre],
+                "fallos": registro.fallos[nombre],
+                "p95_ms": round(percentil(registro.latencias[nombre], 95), 1) if registro.latencias[nombre] else None,
+                "reejecuciones_por_analisis": round(registro.reejecuciones[nombre] / registro.completos[nombre], 1)
+                                              if registro.completos[nombre] else None,
+            }
+            for nombre in CAMINOS
+        },
+        "errores": registro.errores,
+    }
+    return resumen
+
+# --- SERVIDOR ---
+
+def levantar_servidor(puerto: int, traducir: bool, directorio: str) -> subprocess.Popen:
+    entorno = {**os.environ, "VENDLER_HISTORIAL": os.path.join(directorio, "historial_predicados.json")}
+    entorno.pop("VENDLER_TRAZAS", None)  # las sesiones sintéticas no se graban
+    if not traducir:
+        entorno["VENDLER_TRADUCIR"] = "0"
+    with open(os.path.join(directorio, "servidor.log"), "w") as registro:
+        proceso = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", os.path.join(RAIZ, "vendler.py"),
+             "--server.port", str(puerto), "--server.headless", "true",
+             "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+            cwd=RAIZ, env=entorno, stdout=registro, stderr=subprocess.STDOUT,
+        )
+    limite = time.monotonic() + 60
+    while time.monotonic() < limite:
+        if proceso.poll() is not None:
+            break
+        try:
+            if _abridor.open(f"http://127.0.0.1:{puerto}/_stcore/health", timeout=2).read() == b"ok":
+                return proceso
+        except OSError:
+            time.sleep(0.5)
+    proceso.kill()
+    raise RuntimeError(f"el servidor no arrancó; ver {os.path.join(directorio, 'servidor.log')}")
+
+def valor(x) -> str:
+    return "-" if x is None else str(x)
+
+async def medir(args, url: str, pid: Optional[int]) -> dict:
+    # Calentamiento: un recorrido de cada camino, sin pausas, fuera de la medición
+    inicio = time.perf_counter()
+    previo = Registro()
+    for nombre in CAMINOS:
+        await recorrer(url, nombre, previo, lambda: 0.0)
+    if any(previo.fallos.values()):
+        raise RuntimeError("los recorridos fallan incluso con una sola sesión:\n  " + "\n  ".join(previo.errores))
+    print(f"Calentamiento: {time.perf_counter() - inicio:.1f} s\n")
+
+    niveles = []
+    for sesiones in args.sesiones:
+        resumen = await correr_nivel(url, pid, sesiones, args.duracion, args.pausa, args.semilla)
+        niveles.append(resumen)
+        print(f"{sesiones} sesiones: {resumen['completos']} análisis, p95 {valor(resumen['p95_ms'])} ms, "
+              f"CPU {valor(resumen['cpu_servidor_pct'])} %", flush=True)
+    return {"niveles": niveles}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sesiones", default="1,2,4,8,16", help="niveles de sesiones simultáneas, separados por comas")
+    parser.add_argument("--duracion", type=float, default=60, help="segundos por nivel")
+    parser.add_argument("--pausa", type=float, default=1.0, help="pausa media entre acciones, en segundos")
+    parser.add_argument("--limite-ms", type=float, default=500, help="p95 aceptable por reejecución")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--url", help="websocket de un servidor ya en marcha (ws://host:puerto/_stcore/stream)")
+    parser.add_argument("--pid", type=int, help="proceso de ese servidor, para medir su CPU y memoria")
+    parser.add_argument("--puerto", type=int, default=8599, help="puerto del servidor que se levanta")
+    parser.add_argument("--traducir", action="store_true", help="dejar activas las traducciones en línea")
+    parser.add_argument("--salida", help="archivo JSON de resultados")
+    args = parser.parse_args()
+    args.sesiones = [int(x) for x in args.sesiones.split(",")]
+    if websockets is None:
+        sys.exit("Hace falta el paquete websockets (pip install websockets)")
+
+    directorio = tempfile.mkdtemp(prefix="vendler_carga_")
+    proceso = None
+    if args.url:
+        url, pid = args.url, args.pid
+    else:
+        proceso = levantar_servidor(args.puerto, args.traducir, directorio)
+        url, pid = f"ws://127.0.0.1:{args.puerto}/_stcore/stream", proceso.pid
+    try:
+        resultados = asyncio.run(medir(args, url, pid))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait(10)
+
+    niveles = resultados["niveles"]
+    print()
+    imprimir_tabla(
+        ("sesiones", "análisis", "fallos", "análisis/min", "p50 ms", "p95 ms", "p99 ms", "reejec./análisis",
+         "CPU servidor %", "CPU cliente %", "RSS máx. MB"),
+        [(n["sesiones"], n["completos"], n["fallos"], n["analisis_por_minuto"], valor(n["p50_ms"]), valor(n["p95_ms"]),
+          valor(n["p99_ms"]), valor(n["reejecuciones_por_analisis"]), valor(n["cpu_servidor_pct"]),
+          n["cpu_cliente_pct"], valor(n["rss_max_mb"]))
+         for n in niveles],
+    )
+    print()
+    imprimir_tabla(
+        ("sesiones", "camino", "completos", "fallos", "p95 ms", "reejec./análisis"),
+        [(n["sesiones"], nombre, c["completos"], c["fallos"], valor(c["p95_ms"]), valor(c["reejecuciones_por_analisis"]))
+         for n in niveles for nombre, c in n["caminos"].items()],
+    )
+    for n in niveles:
+        for error in n["errores"][:3]:
+            print(f"  [{n['sesiones']} sesiones] {error}")
+
+    aceptables = [n["sesiones"] for n in niveles
+                  if n["fallos"] == 0 and n["p95_ms"] is not None and n["p95_ms"] <= args.limite_ms]
+    capacidad = max(aceptables, default=0)
+    if capacidad:
+        print(f"\nCon p95 ≤ {args.limite_ms:.0f} ms y una pausa media de {args.pausa} s, "
+              f"un proceso atiende hasta {capacidad} {'sesión' if capacidad == 1 else 'sesiones simultáneas'} "
+              "(de los niveles probados).")
+    else:
+        print(f"\nNingún nivel probado cumple p95 ≤ {args.limite_ms:.0f} ms sin fallos.")
+
+    commit = commit_actual()
+    resultados.update({
+        "commit": commit,
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "pausa_seg": args.pausa,
+        "duracion_seg": args.duracion,
+        "limite_ms": args.limite_ms,
+        "capacidad": capacidad,
+    })
+    salida = args.salida or os.path.join(RAIZ, "benchmarks", "resultados", f"carga_{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump(resultados, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados en {salida}")
+
+if __name__ == "__main__":
+    main()
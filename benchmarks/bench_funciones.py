@@ -0,0 +1,177 @@
+"""Microbenchmarks de las funciones puras de los caminos calientes, con línea base.
+
+Cada función recorre un corpus fijo. Primero se calienta (cachés, expresiones
+regulares compiladas, fuentes de matplotlib) y después se toman muestras: cada
+muestra es una pasada completa por el corpus, dividida por su tamaño. Se informan
+operaciones por segundo (según la mediana) y los percentiles 50, 90 y 99 en µs.
+
+traducir_ls_a_ingles usa un traductor falso (sin red) y vacía su caché en cada
+llamada, así que se mide el recorrido completo de la estructura.
+
+--guardar-base guarda los resultados como línea base; --base compara con una
+línea base guardada y marca como regresión toda función cuya mediana empeore
+más de --tolerancia (15 % por defecto). Con regresiones, el script termina con
+código 1. Las líneas base dependen de la máquina: compárese siempre en la misma.
+
+Uso: python benchmarks/bench_funciones.py [--solo nombre] [--base archivo.json] [--guardar-base archivo.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from comun import RAIZ, imprimir_tabla
+
+from nucleo import aktionsart_en, aktionsart_es
+from nucleo import ls as nucleo_ls
+from analisis_rapido_es import analizar_rapido
+
+BASE_POR_DEFECTO = os.path.join(RAIZ, "benchmarks", "resultados", "base_funciones.json")
+
+PRESUPUESTO_SEG = 0.5      # tiempo de muestreo por función
+CALENTAMIENTO_SEG = 0.1
+MUESTRAS_MINIMAS = 5
+MUESTRAS_MAXIMAS = 500
+
+LEMAS_EN = ["run", "eat", "break", "go", "write", "swim", "melt", "give", "make", "stop",
+            "lie", "die", "panic", "visit", "arrive", "build", "sing", "fly", "read", "be"]
+
+CLAUSULAS_ES = ["Pedro corre", "Los niños comen manzanas", "Juan rompió el vaso", "Yo canto una canción",
+                "María escribe cartas a su abuela", "Nosotros llegamos tarde", "Mi hermano no come carne",
+                "Pedro se dio cuenta del error", "Ellos construyeron una casa", "Tú sabes la respuesta"]
+
+DATOS_ES = [
+    aktionsart_es.DatosClause("corriendo", "corrido", "correr", "Pedro", "", "3s"),
+    aktionsart_es.DatosClause("comiendo", "comido", "comer", "Los niños", "manzanas", "3p"),
+    aktionsart_es.DatosClause("rompiendo", "roto", "romper", "Juan", "el vaso", "3s"),
+    aktionsart_es.DatosClause("dándose cuenta", "dado cuenta", "darse cuenta", "", "del error", "1s"),
+]
+
+ESTRUCTURAS = [
+    "[<b>saber'</b> (Ana, respuesta)]",
+    "[<b>do'</b> (Pepe, [<b>correr'</b> (Pepe)])]",
+    "BECOME <b>roto'</b> (vaso)",
+    "[<b>do'</b> (Juan, Ø)] CAUSE [BECOME <b>roto'</b> (vaso)]",
+    "&lt;<sub>NEG.NUC</sub> <i>+</i> [DO (<b>do'</b> (Pepe, [<b>correr'</b> (Pepe)]))]&gt;",
+    "&lt;<sub>IF</sub> <i>DECL</i> &lt;<sub>TNS</sub> <i>PAST</i> [[<b>do'</b> (María, [<b>escribir'</b> (María, carta)])]"
+    " &amp; INGR <b>existir'</b> (carta)]&gt;&gt;",
+]
+
+OPERADORES = [
+    [("TNS", "PAST")],
+    [("IF", "DECL"), ("TNS", "PRES")],
+    [("IF", "INT"), ("STA", "NEG +"), ("TNS", "FUT"), ("NEG.INT +", None)],
+]
+
+class TraductorFalso:
+    """Sustituye a GoogleTranslator: devuelve el mismo texto, sin red."""
+
+    def __init__(self, source: str, target: str):
+        pass
+
+    def translate(self, texto: str) -> str:
+        return texto
+
+def traducir_sin_red(estructura: str) -> str:
+    nucleo_ls.CACHE_TRADUCCION.clear()
+    return nucleo_ls.traducir_ls_a_ingles(estructura)
+
+def reglas_es(oracion: str):
+    rapido = analizar_rapido(oracion)
+    return aktionsart_es._analizar_con_reglas(oracion, rapido, aktionsart_es.DatosClause()) if rapido else None
+
+# nombre -> (función, corpus de argumentos)
+CASOS = {
+    "generate_english_forms": (aktionsart_en.generate_english_forms, [(l,) for l in LEMAS_EN]),
+    "analizar_automaticamente (reglas)": (reglas_es, [(o,) for o in CLAUSULAS_ES]),
+    "construir_perif": (aktionsart_es.construir_perif,
+                        [(t, d) for d in DATOS_ES for t in aktionsart_es.TIPOS_PERIF]),
+    "traducir_ls_a_ingles": (traducir_sin_red, [(e,) for e in ESTRUCTURAS]),
+    "añadir_operadores_a_ls": (nucleo_ls.añadir_operadores_a_ls,
+                               [(e, o) for e in ESTRUCTURAS[:4] for o in OPERADORES]),
+    "extraer_predicados_de_ls": (nucleo_ls.extraer_predicados_de_ls, [(e,) for e in ESTRUCTURAS]),
+    "reemplazar_predicado_en_ls": (nucleo_ls.reemplazar_predicado_en_ls,
+                                   [(e, "do", "hacer") for e in ESTRUCTURAS]),
+    "limpiar_html_ls": (nucleo_ls.limpiar_html_ls, [(e,) for e in ESTRUCTURAS]),
+    "convertir_ls_a_latex": (nucleo_ls.convertir_ls_a_latex, [(e,) for e in ESTRUCTURAS]),
+    "generar_imagen_ls": (nucleo_ls.generar_imagen_ls, [(e,) for e in ESTRUCTURAS[-2:]]),
+}
+
+def percentil(valores, p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+def medir_caso(funcion, corpus) -> dict:
+    def pasada() -> float:
+        inicio = time.perf_counter()
+        for argumentos in corpus:
+            funcion(*argumentos)
+        return (time.perf_counter() - inicio) / len(corpus) * 1e6
+
+    limite = time.perf_counter() + CALENTAMIENTO_SEG
+    pasada()
+    while time.perf_counter() < limite:
+        pasada()
+
+    muestras = []
+    limite = time.perf_counter() + PRESUPUESTO_SEG
+    while len(muestras) < MUESTRAS_MINIMAS or (time.perf_counter() < limite and len(muestras) < MUESTRAS_MAXIMAS):
+        muestras.append(pasada())
+    mediana = statistics.median(muestras)
+    return {
+        "ops_seg": round(1e6 / mediana, 1),
+        "p50_us": round(mediana, 2),
+        "p90_us": round(percentil(muestras, 90), 2),
+        "p99_us": round(percentil(muestras, 99), 2),
+        "muestras": len(muestras),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--solo", action="append", help="medir solo esta función (se puede repetir)")
+    parser.add_argument("--base", nargs="?", const=BASE_POR_DEFECTO, help="comparar con esta línea base")
+    parser.add_argument("--guardar-base", nargs="?", const=BASE_POR_DEFECTO, help="guardar los resultados como línea base")
+    parser.add_argument("--tolerancia", type=float, default=0.15)
+    args = parser.parse_args()
+
+    import matplotlib
+    matplotlib.use("Agg")
+    nucleo_ls._clase_traductor = lambda: TraductorFalso
+
+    base = {}
+    if args.base:
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f)
+
+    resultados, filas, regresiones = {}, [], []
+    for nombre, (funcion, corpus) in CASOS.items():
+        if args.solo and nombre not in args.solo:
+            continue
+        r = resultados[nombre] = medir_caso(funcion, corpus)
+        cambio, estado = "-", ""
+        if nombre in base:
+            relativo = r["p50_us"] / base[nombre]["p50_us"] - 1
+            cambio = f"{relativo:+.0%}"
+            if relativo > args.tolerancia:
+                estado = "REGRESIÓN"
+                regresiones.append(nombre)
+            elif relativo < -args.tolerancia:
+                estado = "mejora"
+        filas.append((nombre, f"{r['ops_seg']:,.0f}", r["p50_us"], r["p90_us"], r["p99_us"], cambio, estado))
+
+    imprimir_tabla(("función", "ops/s", "p50 µs", "p90 µs", "p99 µs", "vs. base", "estado"), filas)
+
+    if args.guardar_base:
+        os.makedirs(os.path.dirname(os.path.abspath(args.guardar_base)), exist_ok=True)
+        with open(args.guardar_base, "w", encoding="utf-8") as f:
+            json.dump({**base, **resultados}, f, ensure_ascii=False, indent=2)
+        print(f"\nLínea base guardada en {args.guardar_base}")
+    if regresiones:
+        print(f"\nRegresiones (más de {args.tolerancia:.0%}): {', '.join(regresiones)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Compara la tabla de inflection_en con las heurísticas que generate_english_forms aplicaba en cada llamada.
+
+Uso: python benchmarks/bench_inflection_en.py
+"""
+
+from comun import imprimir_tabla, medir
+
+from inflection_en import TABLE_STORE, inflect, inflect_many
+
+def heuristica_anterior(lemma: str):
+    """Réplica de las reglas ortográficas anteriores (sin el diccionario IRREGULARS)."""
+    if lemma.endswith("ie"): ger = lemma[:-2] + "ying"
+    elif lemma.endswith("e") and not lemma.endswith("ee"): ger = lemma[:-1] + "ing"
+    else:
+        is_cvc = len(lemma) > 2 and lemma[-1] not in "aeiouwyx" and lemma[-2] in "aeiou" and lemma[-3] not in "aeiou"
+        ger = lemma + lemma[-1] + "ing" if is_cvc and not lemma.endswith(("er", "en", "el", "it")) else lemma + "ing"
+    if lemma.endswith("e"): pp = lemma + "d"
+    else:
+        is_cvc = len(lemma) > 2 and lemma[-1] not in "aeiouwyx" and lemma[-2] in "aeiou" and lemma[-3] not in "aeiou"
+        pp = lemma + lemma[-1] + "ed" if is_cvc and not lemma.endswith(("er", "en", "el", "it")) else lemma + "ed"
+    return ger, pp
+
+def main():
+    tabla = TABLE_STORE.actual()
+    lemas = sorted(tabla)
+    diferentes = sum(heuristica_anterior(l) != (tabla[l].gerund, tabla[l].participle) for l in lemas)
+    filas = [
+        ("heurísticas anteriores", f"{medir(lambda: [heuristica_anterior(l) for l in lemas], numero=20) / len(lemas):.3f}"),
+        ("tabla (inflect)", f"{medir(lambda: [inflect(l) for l in lemas], numero=20) / len(lemas):.3f}"),
+        ("tabla (inflect_many)", f"{medir(lambda: inflect_many(lemas), numero=20) / len(lemas):.3f}"),
+    ]
+    print(f"Lemas en la tabla: {len(lemas)}; lemas en que la tabla difiere de las reglas: {diferentes}\n")
+    imprimir_tabla(("versión", "µs por lema"), filas)
+
+if __name__ == "__main__":
+    main()
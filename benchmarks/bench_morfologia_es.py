@@ -0,0 +1,140 @@
+"""Compara el analizador de morfologia_es con las heurísticas anteriores de analizar_automaticamente.
+
+Uso: python benchmarks/bench_morfologia_es.py
+
+Si es_core_news_sm está instalado, ambas versiones reciben el lema y los rasgos de spaCy.
+Si no, las heurísticas anteriores reciben el lema correcto como si spaCy nunca fallara
+(cota superior para ellas) y el analizador nuevo se mide sin ninguna pista.
+"""
+
+from comun import cargar_spacy, imprimir_tabla, medir
+
+import morfologia_es
+from morfologia_es import analizar_forma
+
+# forma, lema, persona_numero ('' para formas no personales)
+CORPUS = [
+    ("corrió", "correr", "3s"), ("caminaba", "caminar", "3s"), ("hablamos", "hablar", "1p"),
+    ("cantaría", "cantar", "3s"), ("comieron", "comer", "3p"), ("vivimos", "vivir", "1p"),
+    ("llegué", "llegar", "1s"), ("busqué", "buscar", "1s"), ("empecé", "empezar", "1s"),
+    ("conozco", "conocer", "1s"), ("duerme", "dormir", "3s"), ("pidió", "pedir", "3s"),
+    ("piensas", "pensar", "2s"), ("juega", "jugar", "3s"), ("vuelven", "volver", "3p"),
+    ("construyó", "construir", "3s"), ("leyeron", "leer", "3p"), ("sigue", "seguir", "3s"),
+    ("estuvo", "estar", "3s"), ("tuvimos", "tener", "1p"), ("anduve", "andar", "1s"),
+    ("pudo", "poder", "3s"), ("puso", "poner", "3s"), ("supe", "saber", "1s"),
+    ("hizo", "hacer", "3s"), ("hicieron", "hacer", "3p"), ("quisiste", "querer", "2s"),
+    ("vino", "venir", "3s"), ("dijeron", "decir", "3p"), ("trajo", "traer", "3s"),
+    ("supuso", "suponer", "3s"), ("compuse", "componer", "1s"), ("propusieron", "proponer", "3p"),
+    ("mantuvo", "mantener", "3s"), ("detuvieron", "detener", "3p"), ("obtuvo", "obtener", "3s"),
+    ("previno", "prevenir", "3s"), ("predijo", "predecir", "3s"), ("atrajo", "atraer", "3s"),
+    ("condujo", "conducir", "3s"), ("tradujeron", "traducir", "3p"), ("deshizo", "deshacer", "3s"),
+    ("vinculó", "vincular", "3s"), ("pudrió", "pudrir", "3s"), ("supervisó", "supervisar", "3s"),
+    ("superó", "superar", "3s"), ("suplicó", "suplicar", "3s"), ("tuteó", "tutear", "3s"),
+    ("fue", "ser", "3s"), ("es", "ser", "3s"), ("va", "ir", "3s"), ("dio", "dar", "3s"),
+    ("vio", "ver", "3s"), ("tengo", "tener", "1s"), ("salgo", "salir", "1s"), ("hago", "hacer", "1s"),
+    ("tendremos", "tener", "1p"), ("dirá", "decir", "3s"), ("podría", "poder", "3s"),
+    ("rompió", "romper", "3s"), ("escribió", "escribir", "3s"), ("abrieron", "abrir", "3p"),
+    ("comiera", "comer", "3s"), ("hablase", "hablar", "3s"), ("llegues", "llegar", "2s"),
+    ("corriendo", "correr", ""), ("comerlo", "comer", ""), ("dándoselo", "dar", ""),
+]
+
+# Formas que no se usaron al ajustar las tablas: miden cuánto generaliza el analizador (sin pistas)
+FORMAS_NUEVAS = [
+    ("dice", "decir", "3s"), ("dicen", "decir", "3p"), ("huele", "oler", "3s"), ("huelo", "oler", "1s"),
+    ("leo", "leer", "1s"), ("crees", "creer", "2s"), ("conduce", "conducir", "3s"), ("produce", "producir", "3s"),
+    ("traduce", "traducir", "3s"), ("reduzco", "reducir", "1s"), ("introduce", "introducir", "3s"),
+    ("cuece", "cocer", "3s"), ("tuerce", "torcer", "3s"), ("continúa", "continuar", "3s"),
+    ("envían", "enviar", "3p"), ("reúne", "reunir", "3s"), ("oyó", "oír", "3s"), ("cayó", "caer", "3s"),
+    ("huyeron", "huir", "3p"), ("sirve", "servir", "3s"), ("riegan", "regar", "3p"), ("juegas", "jugar", "2s"),
+    ("vistió", "vestir", "3s"), ("mintieron", "mentir", "3p"), ("eligió", "elegir", "3s"),
+    ("distingue", "distinguir", "3s"), ("protege", "proteger", "3s"), ("venció", "vencer", "3s"),
+    ("averigüé", "averiguar", "1s"), ("pagué", "pagar", "1s"), ("almorcé", "almorzar", "1s"),
+    ("caben", "caber", "3p"), ("quepo", "caber", "1s"), ("valdrá", "valer", "3s"),
+    ("satisfizo", "satisfacer", "3s"), ("deshacen", "deshacer", "3p"), ("predijeron", "predecir", "3p"),
+    ("bendice", "bendecir", "3s"), ("apareció", "aparecer", "3s"), ("ofrezco", "ofrecer", "1s"),
+    ("dormía", "dormir", "3s"), ("iremos", "ir", "1p"), ("seamos", "ser", "1p"), ("estén", "estar", "3p"),
+    ("habría", "haber", "3s"), ("sonríe", "sonreír", "3s"), ("ríen", "reír", "3p"),
+    ("diciendo", "decir", ""), ("yendo", "ir", ""), ("pidiendo", "pedir", ""), ("durmiendo", "dormir", ""),
+    ("leyendo", "leer", ""), ("oyendo", "oír", ""), ("vuelto", "volver", ""), ("cubierto", "cubrir", ""),
+    ("devuelto", "devolver", ""), ("escritos", "escribir", ""),
+]
+
+PRETERITOS_FUERTES = {"estuv": "estar", "tuv": "tener", "anduv": "andar", "pud": "poder", "pus": "poner", "sup": "saber", "hic": "hacer", "hiz": "hacer", "quis": "querer", "vin": "venir", "dij": "decir", "traj": "traer"}
+
+def heuristica_anterior(texto_verbo, lema_spacy, persona_spacy):
+    """Réplica de la corrección de lema y persona que hacía analizar_automaticamente."""
+    lema = lema_spacy
+    for raiz, inf_real in PRETERITOS_FUERTES.items():
+        if texto_verbo.startswith(raiz):
+            lema = inf_real
+            break
+    if texto_verbo.endswith(("é", "í")): pn = "1s"
+    elif texto_verbo.endswith(("aste", "iste", "as", "es")): pn = "2s"
+    elif texto_verbo.endswith("ó"): pn = "3s"
+    else: pn = persona_spacy or "3s"
+    return lema, pn
+
+def main():
+    nlp = cargar_spacy("es_core_news_sm")
+    pistas = {}
+    for forma, lema, pn in CORPUS:
+        if nlp:
+            token = nlp(forma)[0]
+            morph = token.morph.to_dict()
+            persona = {("1", "Sing"): "1s", ("2", "Sing"): "2s", ("3", "Sing"): "3s", ("1", "Plur"): "1p", ("2", "Plur"): "2p", ("3", "Plur"): "3p"}.get((morph.get("Person"), morph.get("Number")), "")
+            pistas[forma] = (token.lemma_.lower(), persona)
+        else:
+            pistas[forma] = (lema, "")
+
+    def evaluar(analizar):
+        lemas = personas = 0
+        for forma, lema, pn in CORPUS:
+            l, p = analizar(forma)
+            lemas += l == lema
+            personas += (p == pn) or not pn
+        return lemas / len(CORPUS), personas / len(CORPUS)
+
+    def anterior(forma):
+        return heuristica_anterior(forma, *pistas[forma])
+
+    def nuevo_sin_pistas(forma):
+        a = analizar_forma(forma)
+        return (a.lema, a.persona_numero) if a else ("", "")
+
+    def nuevo_con_pistas(forma):
+        lema, persona = pistas[forma]
+        a = analizar_forma(forma, lema_sugerido=lema, persona_sugerida=persona)
+        return (a.lema, a.persona_numero) if a else ("", "")
+
+    def nuevo_en_frio(forma):
+        morfologia_es._candidatos.cache_clear()
+        return nuevo_sin_pistas(forma)
+
+    filas = []
+    for nombre, funcion in [("heurísticas anteriores", anterior), ("analizador (sin pistas)", nuevo_sin_pistas),
+                            ("analizador (con pistas)", nuevo_con_pistas), ("analizador (sin caché)", nuevo_en_frio)]:
+        acierto_lema, acierto_pn = evaluar(funcion)
+        tiempo = medir(lambda: [funcion(f) for f, _, _ in CORPUS], numero=50) / len(CORPUS)
+        filas.append((nombre, f"{acierto_lema:.1%}", f"{acierto_pn:.1%}", f"{tiempo:.2f}"))
+
+    print(f"Pistas de lema: {'spaCy (es_core_news_sm)' if nlp else 'lema correcto (spaCy no instalado)'}")
+    print(f"Formas: {len(CORPUS)}\n")
+    imprimir_tabla(("versión", "lema", "persona/número", "µs por forma"), filas)
+
+    errores = [(f, l, anterior(f)[0], nuevo_sin_pistas(f)[0]) for f, l, _ in CORPUS if anterior(f)[0] != l or nuevo_sin_pistas(f)[0] != l]
+    if errores:
+        print("\nDiscrepancias (forma, esperado, anterior, analizador sin pistas):")
+        for fila in errores:
+            print("  " + ", ".join(fila))
+
+    nuevas = [(f, l, pn, *nuevo_sin_pistas(f)) for f, l, pn in FORMAS_NUEVAS]
+    aciertos_lema = sum(lema == l for _, l, _, lema, _ in nuevas)
+    aciertos_pn = sum(p == pn or not pn for _, _, pn, _, p in nuevas)
+    print(f"\nFormas nuevas (no usadas al ajustar), analizador sin pistas: lema {aciertos_lema}/{len(nuevas)}, "
+          f"persona/número {aciertos_pn}/{len(nuevas)}")
+    for f, l, _, lema, _ in nuevas:
+        if lema != l:
+            print(f"  {f}, {l}, {lema}")
+
+if __name__ == "__main__":
+    main()
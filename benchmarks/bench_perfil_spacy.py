@@ -0,0 +1,67 @@
+"""Compara el modelo completo de spaCy con el perfil reducido de perfiles_spacy.
+
+Cada carga se mide en un proceso aparte, para que la memoria de un modelo no se
+sume a la del otro: tiempo de carga, memoria residente que añade el modelo
+(VmRSS antes y después de cargarlo) y latencia por cláusula con las cláusulas
+de bench_analisis_rapido.
+
+Uso: python benchmarks/bench_perfil_spacy.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+from comun import imprimir_tabla, medir
+
+from bench_analisis_rapido import CLAUSES_EN, CLAUSULAS_ES
+
+MODELOS = {"es_core_news_sm": CLAUSULAS_ES, "en_core_web_sm": CLAUSES_EN}
+
+def medir_carga(modelo: str, completo: bool) -> dict:
+    """Se ejecuta en el proceso hijo: carga el modelo y mide."""
+    from perfiles_spacy import cargar_modelo, memoria_residente
+
+    antes = memoria_residente()
+    inicio = time.perf_counter()
+    nlp = cargar_modelo(modelo, completo=completo)
+    carga = (time.perf_counter() - inicio) * 1e3
+    if nlp is None:
+        return {"instalado": False}
+    oraciones = [o for o, _ in MODELOS[modelo]]
+    latencia = medir(lambda: [nlp(o) for o in oraciones], numero=5) / len(oraciones)
+    return {
+        "instalado": True,
+        "componentes": nlp.pipe_names,
+        "carga_ms": carga,
+        "rss_mb": memoria_residente() - antes,
+        "latencia_us": latencia,
+    }
+
+def en_proceso_aparte(modelo: str, completo: bool) -> dict:
+    salida = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--hijo", modelo, "completo" if completo else "perfil"],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+def main():
+    filas = []
+    for modelo in MODELOS:
+        for completo in (True, False):
+            r = en_proceso_aparte(modelo, completo)
+            perfil = "completo" if completo else "perfil"
+            if not r["instalado"]:
+                filas.append((modelo, perfil, "no instalado", "-", "-", "-"))
+                continue
+            filas.append((modelo, perfil, ",".join(r["componentes"]), f"{r['carga_ms']:.0f}",
+                          f"{r['rss_mb']:.1f}", f"{r['latencia_us']:.0f}"))
+    imprimir_tabla(("modelo", "carga", "componentes", "ms de carga", "MB residentes", "µs por cláusula"), filas)
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--hijo":
+        print(json.dumps(medir_carga(sys.argv[2], sys.argv[3] == "completo")))
+    else:
+        main()
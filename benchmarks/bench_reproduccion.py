@@ -0,0 +1,237 @@
+"""Reproduce sesiones grabadas (VENDLER_TRAZAS, ver trazas.py) contra un servidor de Streamlit.
+
+Cada sesión del archivo se abre por websocket, como en bench_carga.py, y repite sus
+acciones con los mismos widgets y valores. Las sesiones empiezan con el desfase con
+que empezaron de verdad y esperan entre acción y acción lo que esperó el usuario,
+dividido por --aceleracion (10 por defecto; 0 es sin esperas). Así, un día de uso
+real se convierte en una prueba de regresión con la mezcla de ramas que de verdad
+recorren los estudiantes, en unos minutos.
+
+Los id de los widgets dependen del código: si una acción nombra un widget que no
+está en la página, la sesión se da por divergente y se detiene (se informa cuántas
+y dónde). Si la huella del archivo no coincide con el código actual, se avisa antes
+de empezar.
+
+Se informan los percentiles de latencia por reejecución, en total y por el paso en
+que quedó la página (según la grabación), las sesiones completas y divergentes, y
+la CPU y la memoria residente del servidor. --resumen solo cuenta los pasos y las
+ramas del archivo, sin reproducir nada.
+
+Uso: python benchmarks/bench_reproduccion.py trazas.jsonl [--aceleracion 10] [--resumen]
+                                             [--url ws://host:puerto --pid PID] [--salida archivo.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from comun import RAIZ, commit_actual, imprimir_tabla
+
+from bench_carga import (ErrorCamino, SesionWeb, cpu_proceso, levantar_servidor, percentil, valor,
+                         vigilar_memoria, websockets)
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from trazas import version_aplicacion
+
+ARREGLOS = ("int_array_value", "double_array_value", "string_array_value")
+
+@dataclass
+class SesionGrabada:
+    id: str
+    desfase: float            # segundos desde la primera sesión del archivo
+    version: Optional[str]
+    eventos: List[dict]
+
+@dataclass
+class Registro:
+    latencias: Dict[str, List[float]] = field(default_factory=dict)   # por paso
+    completas: int = 0
+    divergentes: Counter = field(default_factory=Counter)             # por paso en que divergieron
+    errores: List[str] = field(default_factory=list)
+
+def nombre_paso(p: list) -> str:
+    return "/".join(str(x) for x in p if x is not None) or "-"
+
+def leer_trazas(ruta: str) -> List[SesionGrabada]:
+    """Agrupa las líneas del archivo por sesión, en orden de tiempo."""
+    eventos: Dict[str, List[dict]] = {}
+    with open(ruta, encoding="utf-8") as f:
+        for numero, linea in enumerate(f, 1):
+            if not linea.strip():
+                continue
+            try:
+                evento = json.loads(linea)
+            except json.JSONDecodeError:
+                print(f"Línea {numero} ilegible; se omite", file=sys.stderr)
+                continue
+            eventos.setdefault(evento["s"], []).append(evento)
+
+    inicios = {s: next((e["inicio"] for e in lista if "inicio" in e), None) for s, lista in eventos.items()}
+    primero = min((i for i in inicios.values() if i is not None), default=0)
+    sesiones = []
+    for s, lista in eventos.items():
+        lista.sort(key=lambda e: e["t"])
+        version = next((e["version"] for e in lista if "version" in e), None)
+        desfase = inicios[s] - primero if inicios[s] is not None else 0
+        sesiones.append(SesionGrabada(s, desfase, version, lista))
+    return sorted(sesiones, key=lambda s: s.desfase)
+
+def estado_widget(id_widget: str, campo: str, dato) -> WidgetState:
+    estado = WidgetState(id=id_widget)
+    if campo in ARREGLOS:
+        getattr(estado, campo).data.extend(dato)
+    else:
+        setattr(estado, campo, dato)
+    return estado
+
+def resumir(sesiones: List[SesionGrabada]) -> None:
+    pasos = Counter(nombre_paso(e["p"]) for s in sesiones for e in s.eventos)
+    finales = Counter(nombre_paso(s.eventos[-1]["p"]) for s in sesiones)
+    acciones = sum(len(e["a"]) for s in sesiones for e in s.eventos)
+    print(f"{len(sesiones)} sesiones, {sum(len(s.eventos) for s in sesiones)} reejecuciones, {acciones} acciones\n")
+    imprimir_tabla(("paso", "reejecuciones", "sesiones que terminan ahí"),
+                   [(p, n, finales.get(p, 0)) for p, n in pasos.most_common()])
+
+async def reproducir(url: str, grabada: SesionGrabada, aceleracion: float, registro: Registro) -> None:
+    esperar = (lambda seg: asyncio.sleep(seg / aceleracion)) if aceleracion > 0 else (lambda seg: asyncio.sleep(0))
+    await esperar(grabada.desfase)
+    sesion = SesionWeb(url, [], lambda: 0.0)
+    paso = "-"
+    try:
+        await sesion.abrir()  # la primera ejecución, la de abrir la página
+        anterior = grabada.eventos[0]["t"]
+        for evento in grabada.eventos:
+            if not evento["a"]:
+                continue
+            await esperar(max(0, evento["t"] - anterior) / 1000)
+            anterior = evento["t"]
+            presentes = {proto.id for _, proto in sesion.widgets}
+            faltan = [id_widget for id_widget, _, _ in evento["a"] if id_widget not in presentes]
+            if faltan:
+                raise ErrorCamino(f"no está en la página: {faltan[0]}")
+            await sesion.ejecutar([estado_widget(*accion) for accion in evento["a"]])
+            paso = nombre_paso(evento["p"])
+            registro.latencias.setdefault(paso, []).append(sesion.latencias[-1])
+        registro.completas += 1
+    except (ErrorCamino, asyncio.TimeoutError, OSError, websockets.exceptions.WebSocketException) as error:
+        registro.divergentes[paso] += 1
+        if len(registro.errores) < 20:
+            registro.errores.append(f"{grabada.id} tras {paso}: {type(error).__name__}: {error}")
+    finally:
+        try:
+            await sesion.cerrar()
+        except Exception:
+            pass
+
+async def medir(url: str, pid: Optional[int], sesiones: List[SesionGrabada], aceleracion: float) -> dict:
+    registro = Registro()
+    memorias: List[float] = []
+    vigia = asyncio.create_task(vigilar_memoria(pid, memorias))
+    cpu_antes = cpu_proceso(pid) if pid else None
+    inicio = time.perf_counter()
+    await asyncio.gather(*(reproducir(url, s, aceleracion, registro) for s in sesiones))
+    pared = time.perf_counter() - inicio
+    cpu_despues = cpu_proceso(pid) if pid else None
+    vigia.cancel()
+
+    def percentiles(latencias: List[float]) -> dict:
+        return {
+            "reejecuciones": len(latencias),
+            "p50_ms": round(statistics.median(latencias), 1) if latencias else None,
+            "p95_ms": round(percentil(latencias, 95), 1) if latencias else None,
+            "p99_ms": round(percentil(latencias, 99), 1) if latencias else None,
+        }
+
+    todas = [x for lista in registro.latencias.values() for x in lista]
+    return {
+        "sesiones": len(sesiones),
+        "completas": registro.completas,
+        "divergentes": sum(registro.divergentes.values()),
+        "divergencias_por_paso": dict(registro.divergentes),
+        "segundos": round(pared, 1),
+        **percentiles(todas),
+        "cpu_servidor_pct": round((cpu_despues - cpu_antes) / pared * 100, 1)
+                            if cpu_antes is not None and cpu_despues is not None else None,
+        "rss_max_mb": round(max(memorias), 1) if memorias else None,
+        "pasos": {paso: percentiles(lista) for paso, lista in sorted(registro.latencias.items())},
+        "errores": registro.errores,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("trazas", help="archivo grabado con VENDLER_TRAZAS")
+    parser.add_argument("--aceleracion", type=float, default=10, help="divide las esperas grabadas (0: sin esperas)")
+    parser.add_argument("--resumen", action="store_true", help="solo contar pasos y ramas, sin reproducir")
+    parser.add_argument("--url", help="websocket de un servidor ya en marcha (ws://host:puerto/_stcore/stream)")
+    parser.add_argument("--pid", type=int, help="proceso de ese servidor, para medir su CPU y memoria")
+    parser.add_argument("--puerto", type=int, default=8599, help="puerto del servidor que se levanta")
+    parser.add_argument("--traducir", action="store_true", help="dejar activas las traducciones en línea")
+    parser.add_argument("--salida", help="archivo JSON de resultados")
+    args = parser.parse_args()
+
+    sesiones = leer_trazas(args.trazas)
+    if not sesiones:
+        sys.exit(f"{args.trazas} no tiene sesiones")
+    if args.resumen:
+        resumir(sesiones)
+        return
+    if websockets is None:
+        sys.exit("Hace falta el paquete websockets (pip install websockets)")
+
+    actual = version_aplicacion()
+    otras = Counter(s.version for s in sesiones if s.version != actual)
+    if otras:
+        print(f"Aviso: {sum(otras.values())} sesiones se grabaron con otro código "
+              f"({', '.join(str(v) for v in otras)}; el actual es {actual}). Es probable que diverjan.\n")
+
+    directorio = tempfile.mkdtemp(prefix="vendler_reproduccion_")
+    proceso = None
+    if args.url:
+        url, pid = args.url, args.pid
+    else:
+        proceso = levantar_servidor(args.puerto, args.traducir, directorio)
+        url, pid = f"ws://127.0.0.1:{args.puerto}/_stcore/stream", proceso.pid
+    try:
+        resultados = asyncio.run(medir(url, pid, sesiones, args.aceleracion))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait(10)
+
+    r = resultados
+    print(f"{r['sesiones']} sesiones en {r['segundos']} s (aceleración {args.aceleracion:g}): "
+          f"{r['completas']} completas, {r['divergentes']} divergentes\n")
+    imprimir_tabla(
+        ("paso", "reejecuciones", "p50 ms", "p95 ms", "p99 ms"),
+        [*[(paso, p["reejecuciones"], valor(p["p50_ms"]), valor(p["p95_ms"]), valor(p["p99_ms"]))
+           for paso, p in r["pasos"].items()],
+         ("total", r["reejecuciones"], valor(r["p50_ms"]), valor(r["p95_ms"]), valor(r["p99_ms"]))],
+    )
+    print(f"\nCPU servidor {valor(r['cpu_servidor_pct'])} %, RSS máx. {valor(r['rss_max_mb'])} MB")
+    for paso, n in r["divergencias_por_paso"].items():
+        print(f"  {n} sesiones divergen tras {paso}")
+    for error in r["errores"][:5]:
+        print(f"  {error}")
+
+    commit = commit_actual()
+    resultados.update({
+        "commit": commit,
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "trazas": os.path.abspath(args.trazas),
+        "aceleracion": args.aceleracion,
+    })
+    salida = args.salida or os.path.join(RAIZ, "benchmarks", "resultados", f"reproduccion_{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump(resultados, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados en {salida}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Simula una ráfaga de clase: muchos hilos envían cláusulas a la vez, llamando al
+modelo directamente o a través de ServicioAnalisis.
+
+Se prueban dos ráfagas: todos con la misma cláusula (el mismo ejercicio) y cada uno
+con una distinta. Si es_core_news_sm no está instalado se usa un modelo vacío,
+que solo tokeniza: sirve para ver la agrupación, no los tiempos reales.
+
+Uso: python benchmarks/bench_servicio_analisis.py [hilos]
+"""
+
+import sys
+import threading
+import time
+
+from comun import cargar_spacy, imprimir_tabla
+
+from bench_analisis_rapido import CLAUSULAS_ES
+from servicio_analisis import ServicioAnalisis
+
+def rafaga(analizar, textos) -> float:
+    """Lanza un hilo por texto, todos a la vez, y devuelve el tiempo total en ms."""
+    salida = threading.Barrier(len(textos) + 1)
+    hilos = [threading.Thread(target=lambda t=t: (salida.wait(), analizar(t))) for t in textos]
+    for hilo in hilos:
+        hilo.start()
+    salida.wait()
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.join()
+    return (time.perf_counter() - inicio) * 1e3
+
+def main():
+    hilos = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    nlp = cargar_spacy("es_core_news_sm")
+    if nlp is None:
+        import spacy
+        nlp = spacy.blank("es")
+        print("es_core_news_sm no está instalado: se usa un modelo vacío\n")
+    oraciones = [o for o, _ in CLAUSULAS_ES]
+    rafagas = {
+        "misma cláusula": [oraciones[0]] * hilos,
+        "cláusulas distintas": [oraciones[i % len(oraciones)] + f" {i}" for i in range(hilos)],
+    }
+    filas = []
+    for nombre, textos in rafagas.items():
+        directo = rafaga(nlp, textos)
+        servicio = ServicioAnalisis(nlp)
+        agrupado = rafaga(servicio, textos)
+        e = servicio.estadisticas()
+        filas.append((nombre, hilos, f"{directo:.1f}", f"{agrupado:.1f}", e["lotes"], e["analizadas"]))
+    imprimir_tabla(("ráfaga", "hilos", "ms directo", "ms servicio", "lotes", "cláusulas analizadas"), filas)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compara el índice de borrados de sugerir_predicados y el trie de completar_predicado
+con recorrer todo el vocabulario, y comprueba que cada errata sugiera el verbo correcto
+(con el historial vacío: así empieza un servidor nuevo).
+
+Uso: python benchmarks/bench_sugerencias.py
+"""
+
+import os
+import tempfile
+import time
+
+from comun import imprimir_tabla, medir
+
+# Historial vacío, como en un servidor nuevo: las sugerencias no dependen de usos anteriores
+os.environ["VENDLER_HISTORIAL"] = os.path.join(tempfile.mkdtemp(prefix="vendler_sugerencias_"), "historial.json")
+
+from indice_borrados import IndiceBorrados, distancia_edicion
+from nucleo.ls import sugerir_predicados, trie_predicados, vocabulario
+
+PREFIJOS = ["d", "des", "desapar", "tras", "co", "sent", "per", "a"]
+# errata -> verbo que debe estar entre las sugerencias
+ERRATAS = {
+    "desaparezer": "desaparecer", "caminr": "caminar", "corer": "correr", "sentirce": "sentir",
+    "salier": "salir", "permaneser": "permanecer", "trasladr": "trasladar", "hablr": "hablar",
+    "dcir": "decir", "compar": "comprar",
+}
+
+def lineal(lemas, palabra: str, tolerancia: int):
+    return sorted((d, lema) for lema in lemas if (d := distancia_edicion(palabra, lema)) <= tolerancia)
+
+def prefijo_lineal(frecuencias, prefijo: str, maximo: int = 8):
+    return [p for _, p in sorted((-f, p) for p, f in frecuencias.items() if p.startswith(prefijo))[:maximo]]
+
+def main():
+    lemas, indice = vocabulario()
+    inicio = time.perf_counter()
+    IndiceBorrados(lemas)
+    construccion = (time.perf_counter() - inicio) * 1e3
+    tolerancia = lambda p: 1 if len(p) <= 6 else 2
+    filas = [
+        ("recorrido lineal", f"{medir(lambda: [lineal(lemas, p, tolerancia(p)) for p in ERRATAS], numero=20) / len(ERRATAS):.1f}"),
+        ("índice de borrados", f"{medir(lambda: [indice.buscar(p, tolerancia(p)) for p in ERRATAS], numero=200) / len(ERRATAS):.1f}"),
+    ]
+    trie = trie_predicados()
+    frecuencias = {p: trie.frecuencia(p) for p in trie.ranking()}
+    filas_prefijos = [
+        ("recorrido lineal", f"{medir(lambda: [prefijo_lineal(frecuencias, p) for p in PREFIJOS], numero=20) / len(PREFIJOS):.1f}"),
+        ("trie de prefijos", f"{medir(lambda: [trie.completar(p, 8) for p in PREFIJOS], numero=2000) / len(PREFIJOS):.1f}"),
+    ]
+    print(f"Verbos en el vocabulario: {len(lemas)}; claves del índice: {len(indice)}; construcción: {construccion:.1f} ms\n")
+    print("¿Quisiste decir...? (erratas)")
+    imprimir_tabla(("versión", "µs por consulta"), filas)
+    print("\nAutocompletado (prefijos)")
+    imprimir_tabla(("versión", "µs por consulta"), filas_prefijos)
+
+    sugerencias = {errata: sugerir_predicados(errata) for errata in ERRATAS}
+    fallos = [(e, v, sugerencias[e]) for e, v in ERRATAS.items() if v not in sugerencias[e]]
+    print(f"\nErratas con el verbo correcto entre las sugerencias: {len(ERRATAS) - len(fallos)}/{len(ERRATAS)}")
+    for errata, verbo, obtenidas in fallos:
+        print(f"  {errata!r}: se esperaba {verbo!r}, se obtuvo {obtenidas}")
+    assert not fallos, "hay erratas sin la sugerencia correcta"
+
+if __name__ == "__main__":
+    main()
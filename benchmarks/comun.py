@@ -0,0 +1,35 @@
+"""Utilidades compartidas por los scripts de benchmarks."""
+
+import os
+import subprocess
+import sys
+import timeit
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+def medir(funcion, numero: int = 2000, repeticiones: int = 5) -> float:
+    """Devuelve el mejor tiempo por llamada, en microsegundos."""
+    tiempos = timeit.repeat(funcion, number=numero, repeat=repeticiones)
+    return min(tiempos) / numero * 1e6
+
+def cargar_spacy(modelo: str):
+    """Carga un modelo de spaCy si está instalado; si no, devuelve None."""
+    try:
+        import spacy
+        return spacy.load(modelo)
+    except Exception:
+        return None
+
+def commit_actual() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=RAIZ, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "sin-git"
+
+def imprimir_tabla(encabezados, filas):
+    anchos = [max(len(str(x)) for x in columna) for columna in zip(encabezados, *filas)]
+    for fila in [encabezados, ['-' * a for a in anchos], *filas]:
+        print("  ".join(str(x).ljust(a) for x, a in zip(fila, anchos)))
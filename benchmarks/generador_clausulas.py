@@ -0,0 +1,343 @@
+"""Generador de cláusulas sintéticas con las respuestas esperadas, para pruebas a escala.
+
+Arma cláusulas del español y del inglés con los léxicos de la aplicación (los verbos de
+analisis_rapido_es, con los irregulares de conjugacion_es; la tabla de inflection_en) y
+plantillas de sujeto (pronombre, nombre propio, frase nominal o sujeto tácito), tiempo,
+negación, clíticos, complemento directo, indirecto y locativo. Cada fila trae lo que el
+detector debería encontrar (verbo, lema, persona, sujeto, complementos, formas no
+personales), que sale de la plantilla y es exacto.
+
+También trae unos rasgos de la matriz con su aktionsart y, en español, las respuestas del
+formulario experto de LS (RespuestasLS). Se fijan por lema, así que un verbo recibe siempre
+los mismos. Los verbos del léxico de LS (data/ls_verbos.json) los toman de su clase: los
+de transferencia llevan complemento directo e indirecto, los de movimiento un lugar de
+origen o destino, los de dicción un interlocutor, etc. Para el resto (y para todo el
+inglés) el perfil es un sorteo estable por lema. Sirve para medir la coherencia y el
+costo, no como aktionsart real del verbo.
+
+Las filas salen de a una, así que sirven para millones. Son reproducibles: cada fila
+usa su propio Random(semilla, número), de modo que la misma semilla con los mismos
+archivos de data/ da las mismas filas, y --desde permite repartir la generación.
+
+    {"n": 0, "idioma": "es", "oracion": "Pedro no le escribió una carta a Ana", "verbo": "escribió",
+     "lema": "escribir", "tiempo": "pretérito", "persona_numero": "3s", ..., "rasgos": {...},
+     "aktionsart": "realización activa", "ls": {campos de RespuestasLS}}
+
+Uso: python benchmarks/generador_clausulas.py [--filas 1000] [--semilla 0] [--idioma es|en|ambos]
+                                              [--desde 0] [--salida archivo.jsonl]
+"""
+
+import argparse
+import json
+import random
+import sys
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+
+import comun  # noqa: F401  (pone la raíz del repositorio en sys.path)
+
+from analisis_rapido_es import verbos_conocidos
+from conjugacion_es import conjugar, formas_no_finitas
+from inflection_en import TABLE_STORE, inflect
+from morfologia_es import PERSONAS
+from nucleo.aktionsart_en import BE_PAST, BE_PRESENT, HAVE_PRESENT, Features
+from nucleo.aktionsart_es import RasgosPred
+from nucleo.ls import PREGUNTAS_LS, RespuestasLS, lexico_ls
+from quick_parse_en import third_person
+
+# --- PLANTILLAS DEL ESPAÑOL ---
+
+TIEMPOS_ES = ("presente", "pretérito", "imperfecto", "futuro")
+
+PRONOMBRES_ES = {"1s": ("yo",), "2s": ("tú",), "3s": ("él", "ella"), "1p": ("nosotros", "nosotras"),
+                 "2p": ("vosotros",), "3p": ("ellos", "ellas")}
+NOMBRES_ES = ("Pedro", "María", "Juan", "Ana", "Lucía", "Diego", "Carmen", "Tomás")
+FRASES_3S_ES = ("el niño", "la profesora", "mi hermano", "el perro", "la vecina", "el tren")
+FRASES_3P_ES = ("los niños", "las alumnas", "mis padres", "los pájaros", "las vecinas")
+OBJETOS_ES = ("una carta", "el libro", "la puerta", "pan", "la cena", "un regalo", "las manzanas",
+              "el vaso", "una canción", "la respuesta", "los platos", "un cuento")
+# (preposición, lugar, lugar_tipo de RespuestasLS: "1" procedencia, "2" destino o ubicación)
+LOCATIVOS_ES = (("en", "la casa", "2"), ("en", "el parque", "2"), ("a", "la escuela", "2"),
+                ("hacia", "el río", "2"), ("desde", "la ciudad", "1"), ("de", "la oficina", "1"))
+CLITICOS_OBJETO_ES = ("lo", "la", "los", "las")
+
+# --- PLANTILLAS DEL INGLÉS ---
+
+TIEMPOS_EN = ("present", "past", "progressive", "past progressive", "perfect")
+
+PRONOUNS_EN = {"1s": ("I",), "2s": ("you",), "3s": ("he", "she"), "1p": ("we",), "3p": ("they",)}
+NAMES_EN = ("John", "Mary", "Peter", "Ann", "Lucy", "David", "Sarah", "Tom")
+PHRASES_3S_EN = ("the boy", "the teacher", "my brother", "the dog", "the neighbor", "the train")
+PHRASES_3P_EN = ("the children", "the students", "my parents", "the birds", "the neighbors")
+OBJECTS_EN = ("a letter", "the book", "the door", "bread", "dinner", "a present", "the apples",
+              "the glass", "a song", "the answer", "the dishes", "a story")
+LOCATIVES_EN = (("in", "the house"), ("in", "the park"), ("to", "school"), ("toward", "the river"),
+                ("from", "the city"), ("at", "home"))
+# Verbos que el detector trata aparte (auxiliares) y que no sirven como predicado de plantilla
+AUXILIARES_EN = frozenset({"be", "have", "do", "can", "will", "shall", "may", "must"})
+
+# --- RASGOS DE LA MATRIZ ---
+
+# (subclase, en inglés, estativo, puntual, télico, dinámico): la tabla de Vendler que siguen los detectores
+PERFILES = (
+    ("estado", "state", True, False, False, False),
+    ("logro", "achievement", False, True, True, False),
+    ("semelfactivo", "semelfactive", False, True, False, True),
+    ("realización activa", "active accomplishment", False, False, True, True),
+    ("actividad", "activity", False, False, False, True),
+    ("realización", "accomplishment", False, False, True, False),
+    ("proceso", "process", False, False, False, False),
+)
+SUBCLASES_FEMENINAS = ("realización", "realización activa", "actividad")
+
+@dataclass(frozen=True)
+class PerfilVerbo:
+    subclase: str                # entrada de PERFILES (sin "causativo")
+    causativo: bool
+    objeto: Optional[bool]       # complemento directo: siempre, nunca o a veces (None)
+    indirecto: Optional[bool]
+    clase: str = ""              # familia o clase del léxico de LS
+
+# Familia o clase del léxico de LS -> (subclase, causativo, objeto, indirecto); en este orden
+# se elige cuando el verbo está en varias (ofrecer: transferencia antes que posesión).
+# La transferencia ya trae su CAUSE en la estructura del motor: se anota como logro
+PERFILES_CLASE = {
+    "transferencia": ("logro", False, True, True),
+    "tri_neg": ("logro", False, True, True),
+    "diccion": ("actividad", False, False, True),
+    "movimiento": ("logro", False, False, False),
+    "posesion.obtener": ("logro", False, True, False),
+    "posesion.perder": ("logro", False, True, False),
+    "posesion.tener": ("estado", False, True, False),
+    "percepcion": ("estado", False, True, False),
+    "percepcion_impersonal": ("estado", False, False, False),
+    "existencia": ("estado", False, False, False),
+}
+
+# Clase de realización activa de los verbos que no son de desplazamiento
+CLASES_RA_LEMA = {
+    "Creación": frozenset({"escribir", "construir", "pintar", "dibujar", "componer", "cocinar", "crear"}),
+    "Consumo": frozenset({"comer", "beber", "tomar", "devorar", "consumir"}),
+}
+
+def _clase_ls(lema: str) -> str:
+    clases = lexico_ls().indice.get(lema, frozenset())
+    for clave in PERFILES_CLASE:
+        for clase in sorted(clases):
+            if clase == clave or clase.startswith(clave + "."):
+                return clase
+    return ""
+
+def _perfil_sorteado(lema: str) -> PerfilVerbo:
+    """Perfil estable de un verbo sin clase: el mismo lema da siempre el mismo."""
+    azar = random.Random(f"lema:{lema}")
+    causativo = azar.random() < 0.25
+    return PerfilVerbo(azar.choice(PERFILES)[0], causativo, True if causativo else None, None)
+
+@lru_cache(maxsize=None)
+def perfil_es(lema: str) -> PerfilVerbo:
+    clase = _clase_ls(lema)
+    if not clase:
+        return _perfil_sorteado(lema)
+    clave = next(c for c in PERFILES_CLASE if clase == c or clase.startswith(c + "."))
+    return PerfilVerbo(*PERFILES_CLASE[clave], clase=clase)
+
+@lru_cache(maxsize=None)
+def perfil_en(lema: str) -> PerfilVerbo:
+    return _perfil_sorteado(lema)
+
+def _clase_ra(lema: str, perfil: PerfilVerbo) -> str:
+    if perfil.clase.startswith("movimiento"):
+        return "Desplazamiento"
+    return next((clase for clase, lemas in CLASES_RA_LEMA.items() if lema in lemas), "Ninguno de estos")
+
+def _presente(regla: Optional[bool], azar: random.Random, probabilidad: float) -> bool:
+    return regla if regla is not None else azar.random() < probabilidad
+
+@lru_cache(maxsize=1)
+def lemas_es() -> Tuple[str, ...]:
+    """Lemas del léxico vigente que se pueden conjugar en todos los tiempos de las plantillas."""
+    lemas = []
+    for lema in sorted(verbos_conocidos()):
+        if lema.endswith("se") or not formas_no_finitas(lema):
+            continue  # los pronominales llevan su clítico en el léxico de expresiones
+        try:
+            for tiempo in TIEMPOS_ES:
+                conjugar(lema, tiempo)
+        except ValueError:
+            continue  # cambio vocálico sin paradigma completo
+        lemas.append(lema)
+    return tuple(lemas)
+
+@lru_cache(maxsize=1)
+def lemas_en() -> Tuple[str, ...]:
+    return tuple(sorted(l for l in TABLE_STORE.actual() if l not in AUXILIARES_EN and l.isalpha()))
+
+def _rasgos(perfil_verbo: PerfilVerbo) -> Tuple[tuple, str, str]:
+    """Los rasgos de la matriz del verbo y sus etiquetas en español e inglés."""
+    perfil = next(p for p in PERFILES if p[0] == perfil_verbo.subclase)
+    sub_es, sub_en = perfil[0], perfil[1]
+    if not perfil_verbo.causativo:
+        return perfil[2:], sub_es, sub_en
+    sufijo = "causativa" if sub_es in SUBCLASES_FEMENINAS else "causativo"
+    return perfil[2:], f"{sub_es} {sufijo}", f"causative {sub_en}"
+
+def _nucleo(frase: str) -> str:
+    """El argumento como se escribe en la estructura lógica: el nombre sin determinante."""
+    return frase.split()[-1]
+
+def clausula_es(azar: random.Random) -> dict:
+    lema = azar.choice(lemas_es())
+    tiempo = azar.choice(TIEMPOS_ES)
+    persona = azar.choice(PERSONAS)
+    verbo = conjugar(lema, tiempo)[PERSONAS.index(persona)]
+
+    if persona == "3s":
+        sujeto = azar.choice((azar.choice(PRONOMBRES_ES["3s"]), azar.choice(NOMBRES_ES), azar.choice(FRASES_3S_ES)))
+    elif persona == "3p":
+        sujeto = azar.choice((azar.choice(PRONOMBRES_ES["3p"]), azar.choice(FRASES_3P_ES)))
+    else:
+        sujeto = azar.choice(PRONOMBRES_ES[persona])
+    tacito = persona not in ("3s", "3p") and azar.random() < 0.4
+    negacion = azar.random() < 0.15
+
+    perfil = perfil_es(lema)
+    movimiento = perfil.clase.startswith("movimiento")
+    objeto = azar.choice(OBJETOS_ES) if _presente(perfil.objeto, azar, 0.5) else ""
+    clitico_objeto = (azar.choice(CLITICOS_OBJETO_ES) if not objeto and perfil.objeto is None
+                      and azar.random() < 0.15 else "")
+    indirecto = azar.choice(NOMBRES_ES) if _presente(perfil.indirecto, azar, 0.2) else ""
+    if movimiento:
+        # Alejarse sale de un lugar; subir y bajar llegan a uno
+        tipo = "1" if perfil.clase.endswith("away.from.reference.point") else "2"
+        locativo = azar.choice([l for l in LOCATIVOS_ES if l[2] == tipo and l[0] != "en"])
+    elif perfil.clase != "percepcion_impersonal":
+        locativo = azar.choice(LOCATIVOS_ES) if azar.random() < 0.25 else None  # periférico
+    else:
+        locativo = None
+    # Un solo clítico: el de objeto o el que dobla al indirecto (sin "se lo")
+    cliticos = [clitico_objeto] if clitico_objeto else (["le"] if indirecto and azar.random() < 0.5 else [])
+
+    # La percepción impersonal lleva su cualidad (la sopa sabe bien)
+    atributo = "bien" if perfil.clase == "percepcion_impersonal" else ""
+    complementos = " ".join(p for p in (objeto, f"a {indirecto}" if indirecto else "",
+                                        f"{locativo[0]} {locativo[1]}" if locativo else "", atributo) if p)
+    antes = [p for p in ("" if tacito else sujeto, "no" if negacion else "", *cliticos) if p]
+    if not antes:
+        verbo = verbo[0].upper() + verbo[1:]  # el verbo anotado es la palabra tal como se escribe
+    oracion = " ".join(p for p in (*antes, verbo, complementos) if p)
+    oracion = oracion[0].upper() + oracion[1:]
+
+    causativo = perfil.causativo
+    (estativo, puntual, telico, dinamico), akt, _ = _rasgos(perfil)
+    formas = formas_no_finitas(lema)
+
+    x = _nucleo(sujeto)
+    y = _nucleo(objeto) if objeto else (clitico_objeto or "Ø")
+    z = indirecto or "Ø"
+    respuestas = dict.fromkeys(PREGUNTAS_LS, False)
+    respuestas.update(
+        dinamico=dinamico,
+        locativo=movimiento,  # el lugar de los demás verbos es periférico
+        resultado_loc=movimiento,
+        transferencia=perfil.clase.startswith(("transferencia", "tri_neg")),
+        diccion=perfil.clase.startswith("diccion"),
+        percepcion=perfil.clase.startswith("percepcion"),
+        intencional=dinamico and x != "Ø",
+    )
+    ls = RespuestasLS(
+        akt=akt, oracion=oracion, x=x, y=y, z=z, predicado=lema, predicado_es_atributo=False,
+        actividad=lema if causativo else "", atributo=atributo,
+        locus=_nucleo(locativo[1]) if movimiento else "", lugar_tipo=locativo[2] if movimiento else "2",
+        clase_ra=_clase_ra(lema, perfil) if akt.startswith("realización activa") else "",
+        respuestas=respuestas,
+    )
+    return {
+        "idioma": "es", "oracion": oracion, "verbo": verbo, "lema": lema, "tiempo": tiempo,
+        "persona_numero": persona, "sujeto": "" if tacito else sujeto, "complementos": complementos,
+        "negacion": negacion, "cliticos": cliticos,
+        "formas": {"infinitivo": lema, "gerundio": formas.gerundio, "participio": formas.participio},
+        "rasgos": asdict(RasgosPred(causativo, estativo, puntual, telico, dinamico)),
+        "aktionsart": akt, "ls": asdict(ls),
+    }
+
+def clausula_en(azar: random.Random) -> dict:
+    lema = azar.choice(lemas_en())
+    formas = inflect(lema)
+    tiempo = azar.choice(TIEMPOS_EN)
+    persona = azar.choice(tuple(PRONOUNS_EN))
+
+    if persona == "3s":
+        sujeto = azar.choice((azar.choice(PRONOUNS_EN["3s"]), azar.choice(NAMES_EN), azar.choice(PHRASES_3S_EN)))
+    elif persona == "3p":
+        sujeto = azar.choice((azar.choice(PRONOUNS_EN["3p"]), azar.choice(PHRASES_3P_EN)))
+    else:
+        sujeto = azar.choice(PRONOUNS_EN[persona])
+    negacion = azar.random() < 0.15
+    no = ["not"] if negacion else []
+
+    # El verbo anotado es el léxico, no el auxiliar (como en bench_analisis_rapido)
+    if tiempo == "present":
+        verbo = lema if negacion or persona != "3s" else third_person(lema)
+        grupo = ["does" if persona == "3s" else "do", *no, verbo] if negacion else [verbo]
+    elif tiempo == "past":
+        verbo = lema if negacion else formas.past
+        grupo = ["did", *no, verbo] if negacion else [verbo]
+    elif tiempo in ("progressive", "past progressive"):
+        verbo = formas.gerund
+        grupo = [(BE_PAST if tiempo == "past progressive" else BE_PRESENT)[persona], *no, verbo]
+    else:
+        verbo = formas.participle
+        grupo = [HAVE_PRESENT[persona], *no, verbo]
+
+    perfil = perfil_en(lema)
+    objeto = azar.choice(OBJECTS_EN) if _presente(perfil.objeto, azar, 0.5) else ""
+    indirecto = azar.choice(NAMES_EN) if azar.random() < 0.2 else ""
+    locativo = azar.choice(LOCATIVES_EN) if azar.random() < 0.25 else None
+    complementos = " ".join(p for p in (objeto, f"to {indirecto}" if indirecto else "",
+                                        " ".join(locativo) if locativo else "") if p)
+    oracion = " ".join(p for p in (sujeto, *grupo, complementos) if p)
+    oracion = oracion[0].upper() + oracion[1:]
+
+    causativo = perfil.causativo
+    (estativo, puntual, telico, dinamico), _, akt = _rasgos(perfil)
+    return {
+        "idioma": "en", "oracion": oracion, "verbo": verbo, "lema": lema, "tiempo": tiempo,
+        "persona_numero": persona, "sujeto": sujeto, "complementos": complementos,
+        "negacion": negacion, "cliticos": [],
+        "formas": {"infinitivo": lema, "gerundio": formas.gerund, "participio": formas.participle},
+        "rasgos": asdict(Features(causativo, estativo, puntual, telico, dinamico)),
+        "aktionsart": akt, "ls": None,  # el asistente de LS es solo en español
+    }
+
+def generar(filas: Optional[int] = None, semilla: int = 0, idioma: str = "ambos", desde: int = 0) -> Iterator[dict]:
+    """Filas desde la número `desde`; sin `filas`, no se detiene."""
+    n = desde
+    while filas is None or n < desde + filas:
+        azar = random.Random(f"{semilla}:{n}")
+        fila = clausula_es(azar) if idioma == "es" or (idioma == "ambos" and n % 2 == 0) else clausula_en(azar)
+        yield {"n": n, **fila}
+        n += 1
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--filas", type=int, default=1000)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--idioma", choices=("es", "en", "ambos"), default="ambos")
+    parser.add_argument("--desde", type=int, default=0, help="número de la primera fila (para repartir la generación)")
+    parser.add_argument("--salida", help="archivo JSONL (por defecto, la salida estándar)")
+    args = parser.parse_args()
+
+    salida = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    try:
+        for fila in generar(args.filas, args.semilla, args.idioma, args.desde):
+            salida.write(json.dumps(fila, ensure_ascii=False, separators=(",", ":")) + "\n")
+    except BrokenPipeError:
+        pass  # generar ... | head
+    finally:
+        if args.salida:
+            salida.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Calentamiento en segundo plano de los modelos y las importaciones pesadas.
+
+Sin calentamiento, el primer usuario que entra a un detector o al asistente de
+estructuras lógicas después de un despliegue paga la carga del modelo de spaCy, el
+primer análisis, la importación de matplotlib y la compilación de las expresiones
+regulares. vendler.py llama a iniciar_calentamiento() al servir la portada: un hilo
+pasa unas cláusulas por los dos detectores y dibuja una estructura lógica mientras
+el usuario lee la presentación. calentamiento_listo() indica si ya terminó y
+estado_calentamiento() en qué va (la portada avisa mientras está en curso).
+VENDLER_CALENTAR=0 lo desactiva: entonces no se da por listo, salvo que el lanzador
+haya calentado antes del fork (calentar_ahora).
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+ACTIVADO = os.environ.get("VENDLER_CALENTAR", "1") != "0"
+
+CLAUSULAS_CALENTAMIENTO = {
+    "es": ["Pedro corre en el parque", "Juan se dio cuenta del error", "Los niños comieron manzanas"],
+    "en": ["John runs in the park", "The children ate apples", "Mary gave up smoking"],
+}
+
+ESTRUCTURA_EJEMPLO = "&lt;<sub>IF</sub> DECL &lt;<sub>TNS</sub> PRES [<b>do'</b> (x, [<b>correr'</b> (x)])]&gt;&gt;"
+
+_candado = threading.Lock()
+_hilo: Optional[threading.Thread] = None
+_listo = threading.Event()
+_duracion: Optional[float] = None
+
+def calentar() -> None:
+    """Importa y ejercita lo que necesita el primer análisis: modelos, detectores, LS y matplotlib."""
+    import matplotlib
+    matplotlib.use("Agg")
+    from cliente_modelos import servidor_configurado
+    from nucleo import aktionsart_en, aktionsart_es, ls
+
+    # Con servidor de modelos no se carga la copia local: los detectores le piden el análisis
+    if not servidor_configurado():
+        for modulo, idioma in ((aktionsart_es, "es"), (aktionsart_en, "en")):
+            modelo = modulo.load_nlp()
+            if modelo is not None:
+                for oracion in CLAUSULAS_CALENTAMIENTO[idioma]:
+                    modelo(oracion)
+    for oracion in CLAUSULAS_CALENTAMIENTO["es"]:
+        aktionsart_es.analizar_automaticamente(oracion, aktionsart_es.DatosClause())
+    for clause in CLAUSULAS_CALENTAMIENTO["en"]:
+        aktionsart_en.analyze_automatically(clause, aktionsart_en.ClauseData())
+    ls.sugerir_predicados("caminr")
+    ls.opciones_predicado()
+    ls.generar_imagen_ls(ESTRUCTURA_EJEMPLO)
+
+def _ejecutar() -> None:
+    global _duracion
+    inicio = time.perf_counter()
+    try:
+        calentar()
+    except Exception:
+        logger.exception("Falló el calentamiento; los recursos se cargarán con el primer uso")
+    finally:
+        _duracion = time.perf_counter() - inicio
+        _listo.set()
+        logger.info("Calentamiento terminado en %.1f s", _duracion)
+
+def calentar_ahora() -> None:
+    """Calienta en el hilo que llama, aunque VENDLER_CALENTAR=0. Lo usa el lanzador antes
+    del fork: los hijos heredan el calentamiento hecho y no lo repiten."""
+    with _candado:
+        if not _listo.is_set():
+            _ejecutar()
+
+def iniciar_calentamiento() -> None:
+    """Lanza el calentamiento una sola vez por proceso; las llamadas siguientes no hacen nada."""
+    global _hilo
+    if not ACTIVADO or _listo.is_set():
+        return
+    with _candado:
+        if _hilo is None:
+            _hilo = threading.Thread(target=_ejecutar, name="calentamiento", daemon=True)
+            _hilo.start()
+
+def calentamiento_listo() -> bool:
+    return _listo.is_set()
+
+def estado_calentamiento() -> str:
+    """'listo', 'en curso', 'pendiente' (aún no se pidió) o 'desactivado' (VENDLER_CALENTAR=0)."""
+    if _listo.is_set():
+        return "listo"
+    if _hilo is not None:
+        return "en curso"
+    return "pendiente" if ACTIVADO else "desactivado"
+
+def esperar_calentamiento(tiempo: Optional[float] = None) -> bool:
+    """Espera a que termine el calentamiento; devuelve False si se agotó el tiempo o si está
+    desactivado (no hay nada que esperar)."""
+    if estado_calentamiento() == "desactivado":
+        return False
+    return _listo.wait(tiempo)
+
+def duracion_calentamiento() -> Optional[float]:
+    """Segundos que tardó el calentamiento, o None si todavía no termina."""
+    return _duracion if _listo.is_set() else None
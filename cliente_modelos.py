@@ -0,0 +1,63 @@
+"""Cliente del servidor de modelos (servidor_modelos.py).
+
+Con VENDLER_SERVIDOR_MODELOS definido (p. ej., http://127.0.0.1:8765), los
+detectores piden al servidor el análisis automático de las cláusulas que el
+analizador por reglas no resuelve, en lugar de cargar su propia copia de los
+modelos de spaCy. Si el servidor no responde, se analiza localmente y no se le
+vuelve a preguntar durante PAUSA_TRAS_FALLO segundos.
+"""
+
+import json
+import logging
+import os
+import time
+import urllib.request
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SERVIDOR_MODELOS = os.environ.get("VENDLER_SERVIDOR_MODELOS", "").rstrip("/")
+TIEMPO_ESPERA = float(os.environ.get("VENDLER_SERVIDOR_ESPERA_SEG", "2"))
+PAUSA_TRAS_FALLO = 30.0
+
+# Sin proxies: el servidor siempre es local
+_abridor = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+_caido_hasta = 0.0
+
+@dataclass(frozen=True)
+class RespuestaServidor:
+    exito: bool
+    verbo: str
+    lema: str
+    campos: Dict[str, str]   # campos de DatosClause / ClauseData
+
+def servidor_configurado() -> bool:
+    return bool(SERVIDOR_MODELOS)
+
+def analizar_en_servidor(idioma: str, oracion: str) -> Optional[RespuestaServidor]:
+    """Pide el análisis al servidor. Devuelve None si no hay servidor o no responde."""
+    global _caido_hasta
+    if not SERVIDOR_MODELOS or time.monotonic() < _caido_hasta:
+        return None
+    pedido = urllib.request.Request(
+        f"{SERVIDOR_MODELOS}/analizar",
+        data=json.dumps({"idioma": idioma, "oracion": oracion}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with _abridor.open(pedido, timeout=TIEMPO_ESPERA) as respuesta:
+            cuerpo = json.load(respuesta)
+        return RespuestaServidor(bool(cuerpo["exito"]), cuerpo["verbo"], cuerpo["lema"], dict(cuerpo["datos"]))
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        logger.warning("El servidor de modelos no responde (%s); se analiza localmente", error)
+        _caido_hasta = time.monotonic() + PAUSA_TRAS_FALLO
+        return None
+
+def aplicar_respuesta(respuesta: RespuestaServidor, datos) -> tuple:
+    """Copia los campos devueltos en los datos de la cláusula y devuelve (éxito, verbo, lema)."""
+    if respuesta.exito:
+        for campo, valor in respuesta.campos.items():
+            if hasattr(datos, campo):
+                setattr(datos, campo, valor)
+    return respuesta.exito, respuesta.verbo, respuesta.lema
@@ -0,0 +1,233 @@
+"""Generador de formas verbales del español a partir de tablas de paradigmas.
+
+Usa las mismas tablas que el analizador de morfologia_es. Las formas no personales de
+los lemas conocidos se precalculan al cargar data/irregulares_es.json (y de nuevo si
+el archivo cambia); los auxiliares de las perífrasis, al importar el módulo. El resto
+se genera una vez y queda en caché.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+from datos_lexicos import LexicoRecargable, congelar, leer_json, ruta_datos
+from morfologia_es import (
+    DESINENCIAS, LEMAS_CONOCIDOS, PARADIGMAS_IRREGULARES, PERSONAS, PREFIJOS,
+    RAICES_IRREGULARES, RAICES_LIGADAS, cambia_vocal, separar_encliticos,
+)
+
+# --- 1. CLASES ---
+
+@dataclass(frozen=True)
+class FormasNoFinitas:
+    infinitivo: str
+    gerundio: str
+    participio: str
+
+# --- 2. TABLAS ---
+
+# Gerundios y participios que no siguen las reglas: data/irregulares_es.json
+
+# Terminación del infinitivo -> (gerundio, participio); se prueban en este orden
+REGLAS_NO_FINITAS = (
+    ("güir", "guyendo", "güido"), ("guir", "guiendo", "guido"), ("quir", "quiendo", "quido"),
+    ("uir", "uyendo", "uido"), ("eer", "eyendo", "eído"), ("aer", "ayendo", "aído"),
+    ("oer", "oyendo", "oído"), ("eír", "iendo", "eído"), ("oír", "oyendo", "oído"),
+    ("ñer", "ñendo", "ñido"), ("ñir", "ñendo", "ñido"), ("llir", "llendo", "llido"),
+    ("ar", "ando", "ado"), ("er", "iendo", "ido"), ("ir", "iendo", "ido"),
+)
+
+TERMINACIONES_PARTICIPIO = {('m', 's'): "o", ('f', 's'): "a", ('m', 'p'): "os", ('f', 'p'): "as"}
+
+# Terminación -> (con tilde, clíticos que la exigen): dándole, dárselo
+TILDES_ENCLITICOS = (
+    ("ando", "ándo", 1), ("iendo", "iéndo", 1), ("yendo", "yéndo", 1),
+    ("ar", "ár", 2), ("er", "ér", 2), ("ir", "ír", 2),
+)
+
+# Tiempos de los auxiliares que usan las perífrasis de las pruebas
+TIEMPOS_AUXILIARES = {
+    "estar": ('presente', 'pretérito', 'imperfecto de subjuntivo'),
+    "haber": ('presente',),
+    "dejar": ('imperfecto de subjuntivo',),
+}
+
+# En la aplicación, 2p corresponde a 'ustedes' y concuerda como la tercera plural
+PERSONA_CONCORDANCIA = {'2p': '3p'}
+
+_INDICE_PERSONA = {pn: i for i, pn in enumerate(PERSONAS)}
+_TILDE = str.maketrans("aeiou", "áéíóú")
+_SIN_TILDE = str.maketrans("áéíóú", "aeiou")
+_VOCALES = frozenset("aeiou")
+_TIEMPOS_PRESENTE = ('presente', 'presente de subjuntivo')
+
+# (lema, tiempo) -> formas de las raíces irregulares (tuv-e, tendr-é, teng-o)
+_FORMAS_RAICES: Dict[Tuple[str, str], list] = {}
+for _raiz, (_lema, _tiempos) in RAICES_IRREGULARES.items():
+    if _raiz in RAICES_LIGADAS:
+        continue
+    for _tiempo, _desinencias in _tiempos.items():
+        if _tiempo == 'participio':
+            continue
+        _formas = _FORMAS_RAICES.setdefault((_lema, _tiempo), [None] * len(PERSONAS))
+        for _i, _desinencia in enumerate(_desinencias):
+            if _desinencia is not None:
+                _formas[_i] = _raiz + _desinencia
+
+# --- 3. CONJUGACIÓN ---
+
+def _conjugacion(lema: str) -> str:
+    terminacion = lema[-2:].replace('ír', 'ir')
+    if terminacion not in DESINENCIAS or len(lema) < 2:
+        raise ValueError(f"«{lema}» no es un infinitivo")
+    return terminacion
+
+def _unir(raiz: str, desinencia: str, conj: str, tiempo: str) -> str:
+    """Une raíz y desinencia regular aplicando los cambios ortográficos (busqu-é, venz-o, constru-y-e)."""
+    inicial = desinencia[:1].translate(_SIN_TILDE)
+    if conj == 'ar' and inicial == 'e':
+        if raiz.endswith('gu'): raiz = raiz[:-1] + 'ü'
+        elif raiz.endswith('c'): raiz = raiz[:-1] + 'qu'
+        elif raiz.endswith('g'): raiz = raiz[:-1] + 'gu'
+        elif raiz.endswith('z'): raiz = raiz[:-1] + 'c'
+    elif conj != 'ar' and inicial in ('o', 'a'):
+        if raiz.endswith('gu'): raiz = raiz[:-1]
+        elif raiz.endswith('qu'): raiz = raiz[:-2] + 'c'
+        elif raiz.endswith('c'): raiz = raiz[:-1] + ('zc' if raiz[-2:-1] in _VOCALES else 'z')
+        elif raiz.endswith('g'): raiz = raiz[:-1] + 'j'
+    if raiz[-1:] in _VOCALES and conj != 'ar' and raiz[-2:] not in ('gu', 'qu'):
+        if desinencia[:1] == 'i' and desinencia[1:2].translate(_SIN_TILDE) in _VOCALES:
+            desinencia = 'y' + desinencia[1:]
+        elif desinencia[:1] == 'i' and raiz[-1] != 'u' and tiempo not in ('futuro', 'condicional'):
+            desinencia = 'í' + desinencia[1:]
+        elif raiz[-1] == 'u' and inicial in ('a', 'e', 'o'):
+            raiz += 'y'
+    return raiz + desinencia
+
+@lru_cache(maxsize=1024)
+def conjugar(lema: str, tiempo: str) -> Tuple[str, ...]:
+    """Conjuga un lema en un tiempo y devuelve las formas en el orden de PERSONAS.
+    No aplica los cambios vocálicos de la raíz (tienes, pidió): esos verbos necesitan su paradigma."""
+    conj = _conjugacion(lema)
+    if tiempo.startswith('imperfecto de subjuntivo') and (lema, tiempo) not in PARADIGMAS_IRREGULARES:
+        # Se forma sobre la tercera plural del pretérito: estuvie-ron -> estuvie-ra
+        base = conjugar(lema, 'pretérito')[-1][:-3]
+        sufijos = ('se', 'ses', 'se', 'semos', 'seis', 'sen') if '(-se)' in tiempo else ('ra', 'ras', 'ra', 'ramos', 'rais', 'ran')
+        return tuple((base[:-1] + base[-1].translate(_TILDE) if pn == '1p' else base) + sufijo
+                     for pn, sufijo in zip(PERSONAS, sufijos))
+    if tiempo not in DESINENCIAS[conj]:
+        raise ValueError(f"Tiempo desconocido: «{tiempo}»")
+    propias = PARADIGMAS_IRREGULARES.get((lema, tiempo)) or _FORMAS_RAICES.get((lema, tiempo)) or (None,) * len(PERSONAS)
+    cambia_raiz = tiempo in _TIEMPOS_PRESENTE or (conj == 'ir' and tiempo == 'pretérito')
+    if None in propias and cambia_raiz and cambia_vocal(lema):
+        raise ValueError(f"Falta el paradigma de «{lema}» en {tiempo}")
+    raiz = lema[:-2]
+    return tuple(propia or _unir(raiz, desinencia, conj, tiempo)
+                 for propia, desinencia in zip(propias, DESINENCIAS[conj][tiempo]))
+
+AUXILIARES = {(lema, tiempo): conjugar(lema, tiempo) for lema, tiempos in TIEMPOS_AUXILIARES.items() for tiempo in tiempos}
+
+def auxiliar(lema: str, tiempo: str, persona_numero: str) -> str:
+    """Forma del auxiliar de una perífrasis (estoy, estuviste, han, dejáramos)."""
+    formas = AUXILIARES.get((lema, tiempo)) or conjugar(lema, tiempo)
+    persona_numero = PERSONA_CONCORDANCIA.get(persona_numero, persona_numero)
+    return formas[_INDICE_PERSONA.get(persona_numero, _INDICE_PERSONA['3s'])]
+
+# --- 4. FORMAS NO PERSONALES ---
+
+def _cerrar_vocal(raiz: str) -> str:
+    """Cierra la última vocal media de la raíz (pid-, durm-) para el gerundio de los verbos en -ir."""
+    pos = max(raiz.rfind('e'), raiz.rfind('o'))
+    if pos < 0:
+        return raiz
+    return raiz[:pos] + ('i' if raiz[pos] == 'e' else 'u') + raiz[pos + 1:]
+
+def _irregulares_derivados(lema: str, irregulares: Mapping[str, Mapping[str, str]]) -> Mapping[str, str]:
+    """Formas irregulares heredadas de la base sin prefijo (sobreponer -> sobrepuesto)."""
+    for prefijo in PREFIJOS:
+        base = lema[len(prefijo):]
+        if lema.startswith(prefijo) and len(base) >= 3 and base in irregulares:
+            return {clave: prefijo + forma for clave, forma in irregulares[base].items()}
+    return {}
+
+def _generar(lema: str, irregulares: Mapping[str, Mapping[str, str]]) -> Optional[FormasNoFinitas]:
+    propias = irregulares.get(lema) or _irregulares_derivados(lema, irregulares)
+    for terminacion, gerundio, participio in REGLAS_NO_FINITAS:
+        if lema.endswith(terminacion) and len(lema) > len(terminacion):
+            raiz = lema[:-len(terminacion)]
+            raiz_gerundio = _cerrar_vocal(raiz) if terminacion.endswith('ir') and cambia_vocal(lema) else raiz
+            return FormasNoFinitas(lema, propias.get("ger", raiz_gerundio + gerundio), propias.get("pp", raiz + participio))
+    if propias:
+        return FormasNoFinitas(lema, propias.get("ger", ""), propias.get("pp", ""))
+    return None
+
+@dataclass(frozen=True, eq=False)
+class _LexicoNoFinitas:
+    irregulares: Mapping[str, Mapping[str, str]]
+    lemas: FrozenSet[str]
+    tabla: Mapping[str, FormasNoFinitas]
+
+def _construir_lexico(ruta: str) -> _LexicoNoFinitas:
+    """Lee los irregulares y precalcula las formas de todos los lemas conocidos."""
+    irregulares = congelar(leer_json(ruta))
+    lemas = frozenset(irregulares)
+    tabla = {}
+    for lema in sorted(lemas | LEMAS_CONOCIDOS):
+        formas = _generar(lema, irregulares)
+        if formas:
+            tabla[lema] = formas
+    return _LexicoNoFinitas(irregulares, lemas, MappingProxyType(tabla))
+
+# El contenedor recargable, no el léxico: se lee con LEXICO_IRREGULARES.actual()
+LEXICO_IRREGULARES = LexicoRecargable(ruta_datos("irregulares_es.json"), _construir_lexico)
+
+def lemas_irregulares() -> FrozenSet[str]:
+    """Lemas con gerundio o participio irregular registrados en el léxico vigente."""
+    return LEXICO_IRREGULARES.actual().lemas
+
+@lru_cache(maxsize=4096)
+def _generar_en_cache(lema: str, lexico: _LexicoNoFinitas) -> Optional[FormasNoFinitas]:
+    return _generar(lema, lexico.irregulares)
+
+def formas_no_finitas(lema: str) -> Optional[FormasNoFinitas]:
+    """Devuelve infinitivo, gerundio y participio del lema, o None si no es un infinitivo."""
+    lexico = LEXICO_IRREGULARES.actual()
+    formas = lexico.tabla.get(lema)
+    return formas if formas is not None else _generar_en_cache(lema, lexico)
+
+def expandir_lexico(lemas: Iterable[str]) -> Dict[str, FormasNoFinitas]:
+    """Genera de una vez las formas no personales de todo un léxico; omite lo que no es un infinitivo."""
+    lexico = LEXICO_IRREGULARES.actual()
+    tabla = {}
+    for lema in lemas:
+        formas = lexico.tabla.get(lema) or _generar_en_cache(lema, lexico)
+        if formas:
+            tabla[lema] = formas
+    return tabla
+
+def gerundio(lema: str, cliticos: Iterable[str] = ()) -> str:
+    formas = formas_no_finitas(lema)
+    return con_encliticos(formas.gerundio, tuple(cliticos)) if formas else ""
+
+def participio(lema: str, genero: str = 'm', numero: str = 's') -> str:
+    """Participio concordado en género ('m'/'f') y número ('s'/'p')."""
+    formas = formas_no_finitas(lema)
+    if not formas or not formas.participio:
+        return ""
+    return formas.participio[:-1] + TERMINACIONES_PARTICIPIO[(genero, numero)]
+
+def con_encliticos(forma: str, cliticos: Tuple[str, ...]) -> str:
+    """Añade clíticos pospuestos a un infinitivo o gerundio, con la tilde que corresponda."""
+    if not cliticos:
+        return forma
+    for terminacion, con_tilde, minimo in TILDES_ENCLITICOS:
+        if forma.endswith(terminacion) and len(cliticos) >= minimo:
+            forma = forma[:-len(terminacion)] + con_tilde
+            break
+    return forma + "".join(cliticos)
+
+def participio_de_infinitivo(infinitivo: str) -> str:
+    """Participio de un infinitivo con o sin clíticos (romperse -> roto); si no lo reconoce, lo devuelve tal cual."""
+    lema, _ = separar_encliticos(infinitivo.lower().strip())
+    return participio(lema) or lema
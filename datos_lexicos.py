@@ -0,0 +1,83 @@
+"""Carga de los léxicos externos (carpeta data/) con recarga en caliente.
+
+Cada léxico se lee una vez y se guarda como una instantánea inmutable. Si el
+archivo cambia, la siguiente consulta construye una instantánea nueva y la
+sustituye de una sola vez: quien ya tenga la anterior la sigue usando completa.
+Los cambios se comprueban como mucho cada INTERVALO_RECARGA segundos.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar
+
+DIR_DATOS = os.environ.get(
+    "VENDLER_DATOS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"),
+)
+INTERVALO_RECARGA = float(os.environ.get("VENDLER_RECARGA_SEG", "5"))
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+def ruta_datos(nombre: str) -> str:
+    return os.path.join(DIR_DATOS, nombre)
+
+def leer_json(ruta: str) -> Any:
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
+
+def congelar(valor: Any) -> Any:
+    """Convierte dicts en MappingProxyType y listas en frozenset, recursivamente."""
+    if isinstance(valor, dict):
+        return MappingProxyType({clave: congelar(v) for clave, v in valor.items()})
+    if isinstance(valor, (list, tuple, set)):
+        return frozenset(congelar(v) for v in valor)
+    return valor
+
+class LexicoRecargable(Generic[T]):
+    """Instantánea de un archivo de datos que se reconstruye cuando el archivo cambia."""
+
+    def __init__(self, ruta: str, construir: Callable[[str], T], intervalo: float = INTERVALO_RECARGA):
+        self.ruta = ruta
+        self._construir = construir
+        self._intervalo = intervalo
+        self._candado = threading.Lock()
+        self._firma: Optional[Tuple[int, int]] = None
+        self._revisado = 0.0
+        self._actual: T = construir(ruta)
+        self._firma = self._firma_archivo()
+        self._revisado = time.monotonic()
+
+    def _firma_archivo(self) -> Optional[Tuple[int, int]]:
+        try:
+            estado = os.stat(self.ruta)
+        except OSError:
+            return None
+        return estado.st_mtime_ns, estado.st_size
+
+    def actual(self) -> T:
+        """Devuelve la instantánea vigente, recargándola si el archivo cambió."""
+        if time.monotonic() - self._revisado >= self._intervalo:
+            self.recargar()
+        return self._actual
+
+    def recargar(self, forzar: bool = False) -> bool:
+        """Reconstruye la instantánea si el archivo cambió. Si el archivo nuevo no es
+        válido (p. ej., a medio guardar), conserva la anterior y lo vuelve a intentar luego."""
+        with self._candado:
+            self._revisado = time.monotonic()
+            firma = self._firma_archivo()
+            if firma is None or (firma == self._firma and not forzar):
+                return False
+            try:
+                nuevo = self._construir(self.ruta)
+            except Exception as e:
+                logger.warning("No se pudo recargar %s: %s", self.ruta, e)
+                return False
+            self._actual, self._firma = nuevo, firma
+            return True
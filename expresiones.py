@@ -0,0 +1,100 @@
+"""Reconocimiento de predicados multipalabra (darse cuenta, hacer caso, give up).
+
+Las expresiones de los archivos data/expresiones_es.txt y data/en_expressions.txt
+se compilan en un trie de palabras: el primer nivel se indexa por el lema del verbo
+y los siguientes por las palabras fijas que lo acompañan, en minúsculas. Desde cada
+token solo se recorren tantos tokens como tenga la expresión más larga, así que el
+costo crece con el largo de la cláusula y no con el número de expresiones.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+@dataclass(frozen=True)
+class ExpresionEncontrada:
+    inicio: int   # índice del token del verbo
+    fin: int      # índice siguiente al último token de la expresión
+    lema: str     # lema del verbo ("dar")
+    resto: str    # palabras fijas que siguen al verbo ("cuenta")
+
+    @property
+    def expresion(self) -> str:
+        return f"{self.lema} {self.resto}"
+
+class _Nodo:
+    __slots__ = ("hijos", "final")
+
+    def __init__(self):
+        self.hijos: Dict[str, "_Nodo"] = {}
+        self.final = False
+
+class AutomataExpresiones:
+    """Trie de expresiones multipalabra cuya primera palabra es el lema de un verbo."""
+
+    def __init__(self, expresiones: Iterable[str] = ()):
+        self._raiz = _Nodo()
+        self._largo_maximo = 0
+        self._total = 0
+        for expresion in expresiones:
+            self.agregar(expresion)
+
+    def __len__(self) -> int:
+        return self._total
+
+    def agregar(self, expresion: str) -> None:
+        palabras = expresion.lower().split()
+        if len(palabras) < 2:
+            return
+        nodo = self._raiz
+        for palabra in palabras:
+            nodo = nodo.hijos.setdefault(palabra, _Nodo())
+        if not nodo.final:
+            nodo.final = True
+            self._total += 1
+        self._largo_maximo = max(self._largo_maximo, len(palabras))
+
+    def buscar(self, palabras: Sequence[str], lemas: Sequence[Iterable[str]]) -> List[ExpresionEncontrada]:
+        """Expresiones presentes en una cláusula ya segmentada. `lemas[i]` son los lemas posibles
+        del token i (p. ej., el de spaCy y el del analizador). Desde cada verbo se devuelve
+        la expresión más larga."""
+        encontradas = []
+        minusculas = [p.lower() for p in palabras]
+        for i, candidatos in enumerate(lemas):
+            for lema in candidatos:
+                nodo = self._raiz.hijos.get(lema)
+                if nodo is None:
+                    continue
+                fin = None
+                j = i + 1
+                while j < len(minusculas) and j - i < self._largo_maximo:
+                    nodo = nodo.hijos.get(minusculas[j])
+                    if nodo is None:
+                        break
+                    j += 1
+                    if nodo.final:
+                        fin = j
+                if fin is not None:
+                    encontradas.append(ExpresionEncontrada(i, fin, lema, " ".join(palabras[i + 1:fin]).lower()))
+                    break
+        return encontradas
+
+def elegir_expresion(encontradas: List[ExpresionEncontrada], token_verbo: Optional[int]) -> Optional[ExpresionEncontrada]:
+    """La expresión que contiene el token elegido como verbo (que a veces es una de las
+    palabras fijas: "cuenta" en "se dio cuenta"). Si el parser no eligió ningún verbo,
+    la más larga y, entre iguales, la primera."""
+    if token_verbo is None:
+        return min(encontradas, key=lambda e: (e.inicio - e.fin, e.inicio), default=None)
+    return next((e for e in encontradas if e.inicio <= token_verbo < e.fin), None)
+
+def leer_expresiones(ruta: str) -> AutomataExpresiones:
+    """Compila un archivo con una expresión por línea (lema del verbo y palabras fijas)."""
+    expresiones = []
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            for linea in f:
+                linea = linea.strip()
+                if linea and not linea.startswith("#"):
+                    expresiones.append(linea)
+    except FileNotFoundError:
+        pass
+    return AutomataExpresiones(expresiones)
@@ -0,0 +1,89 @@
+"""Índice de borrados para buscar palabras parecidas ("¿Quisiste decir...?").
+
+Al construir el índice, cada palabra se registra bajo todas las cadenas que salen
+de borrarle hasta TOLERANCIA_MAXIMA letras. Dos palabras a distancia de edición k
+comparten al menos una de esas cadenas con k borrados o menos de cada lado, así
+que una consulta solo genera los borrados de la palabra buscada, los busca en el
+diccionario y comprueba con la distancia exacta los pocos candidatos que salen.
+La distancia (Levenshtein) se calcula con el algoritmo de vectores de bits de
+Myers/Hyyrö.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+TOLERANCIA_MAXIMA = 2
+
+def _mascaras(patron: str) -> Dict[str, int]:
+    """Posiciones de cada letra del patrón como máscara de bits."""
+    peq: Dict[str, int] = {}
+    for i, letra in enumerate(patron):
+        peq[letra] = peq.get(letra, 0) | (1 << i)
+    return peq
+
+def _distancia_bits(peq: Dict[str, int], largo: int, texto: str) -> int:
+    if not largo:
+        return len(texto)
+    todo = (1 << largo) - 1
+    alto = 1 << (largo - 1)
+    pv, mv, distancia = todo, 0, largo
+    for letra in texto:
+        eq = peq.get(letra, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & alto:
+            distancia += 1
+        elif mh & alto:
+            distancia -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & todo
+        mv = ph & xv & todo
+    return distancia
+
+def distancia_edicion(a: str, b: str) -> int:
+    """Distancia de Levenshtein (inserciones, borrados y sustituciones)."""
+    return _distancia_bits(_mascaras(a), len(a), b)
+
+def borrados(palabra: str, maximo: int) -> Set[str]:
+    """La palabra y todas las cadenas que resultan de borrarle hasta `maximo` letras."""
+    resultado = {palabra}
+    nivel = {palabra}
+    for _ in range(maximo):
+        nivel = {p[:i] + p[i + 1:] for p in nivel for i in range(len(p))}
+        resultado |= nivel
+    return resultado
+
+class IndiceBorrados:
+    """Índice de palabras para consultas por distancia de edición."""
+
+    def __init__(self, palabras: Iterable[str] = (), tolerancia_maxima: int = TOLERANCIA_MAXIMA):
+        self.tolerancia_maxima = tolerancia_maxima
+        indice: Dict[str, Set[str]] = {}
+        for palabra in palabras:
+            for borrado in borrados(palabra, tolerancia_maxima):
+                indice.setdefault(borrado, set()).add(palabra)
+        self._indice: Dict[str, FrozenSet[str]] = {b: frozenset(p) for b, p in indice.items()}
+
+    def __len__(self) -> int:
+        return len(self._indice)
+
+    def buscar(self, palabra: str, tolerancia: int) -> List[Tuple[int, str]]:
+        """Palabras a distancia <= tolerancia, como pares (distancia, palabra) ordenados."""
+        tolerancia = min(tolerancia, self.tolerancia_maxima)
+        peq, largo = _mascaras(palabra), len(palabra)
+        vistas: Set[str] = set()
+        encontradas = []
+        for borrado in borrados(palabra, tolerancia):
+            for candidata in self._indice.get(borrado, ()):
+                if candidata in vistas:
+                    continue
+                vistas.add(candidata)
+                if abs(len(candidata) - largo) > tolerancia:
+                    continue
+                d = _distancia_bits(peq, largo, candidata)
+                if d <= tolerancia:
+                    encontradas.append((d, candidata))
+        encontradas.sort()
+        return encontradas
@@ -0,0 +1,116 @@
+"""English verb inflection store.
+
+Gerunds, past tenses and past participles are precomputed offline by
+scripts/build_english_inflections.py into data/en_inflections.tsv and loaded
+once into a read-only dict, which is reloaded when the file changes. The
+spelling heuristics below only run for lemmas that are not in the table.
+
+Only the generated table is watched: after editing data/en_verbs.tsv, rerun the
+build script, and the running app picks up the new table on its own.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping
+
+from datos_lexicos import LexicoRecargable, ruta_datos
+
+TABLE_PATH = ruta_datos("en_inflections.tsv")
+
+VOWELS = frozenset("aeiou")
+
+# Final syllables that are usually unstressed, so the consonant is not doubled (visit, offer, travel)
+UNSTRESSED_ENDINGS = ("er", "en", "el", "it", "et", "al", "on", "om", "op", "ip", "or", "ar")
+
+@dataclass(frozen=True)
+class EnglishForms:
+    lemma: str
+    gerund: str
+    past: str
+    participle: str
+
+# --- HEURISTICS (out-of-vocabulary lemmas) ---
+
+def _syllables(lemma: str) -> int:
+    count, previous = 0, False
+    for ch in lemma:
+        vowel = ch in VOWELS
+        if vowel and not previous:
+            count += 1
+        previous = vowel
+    return count
+
+def _doubles_final(lemma: str) -> bool:
+    """True when the final consonant doubles before -ing/-ed (stop, occur; not visit, open)."""
+    is_cvc = (len(lemma) > 2
+              and lemma[-1] not in "aeiouwyx"
+              and lemma[-2] in VOWELS
+              and lemma[-3] not in VOWELS)
+    if not is_cvc:
+        return False
+    return _syllables(lemma) == 1 or not lemma.endswith(UNSTRESSED_ENDINGS)
+
+def regular_forms(lemma: str) -> EnglishForms:
+    """Applies the spelling rules for regular verbs."""
+    if lemma.endswith("ie"):
+        ger = lemma[:-2] + "ying"
+    elif lemma.endswith("e") and not lemma.endswith(("ee", "ye", "oe")) and len(lemma) > 2:
+        ger = lemma[:-1] + "ing"
+    elif lemma.endswith("ic") and _syllables(lemma) > 1:
+        ger = lemma + "king"
+    elif _doubles_final(lemma):
+        ger = lemma + lemma[-1] + "ing"
+    else:
+        ger = lemma + "ing"
+
+    if lemma.endswith("e"):
+        past = lemma + "d"
+    elif lemma.endswith("y") and len(lemma) > 1 and lemma[-2] not in VOWELS:
+        past = lemma[:-1] + "ied"
+    elif lemma.endswith("ic") and _syllables(lemma) > 1:
+        past = lemma + "ked"
+    elif _doubles_final(lemma):
+        past = lemma + lemma[-1] + "ed"
+    else:
+        past = lemma + "ed"
+    return EnglishForms(lemma, ger, past, past)
+
+# --- TABLE ---
+
+def load_table(path: str = TABLE_PATH) -> Mapping[str, EnglishForms]:
+    """Reads the precomputed table; a missing file leaves only the heuristics."""
+    table = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                lemma, ger, past, pp = line.rstrip("\n").split("\t")
+                table[lemma] = EnglishForms(lemma, ger, past, pp)
+    except FileNotFoundError:
+        pass
+    return MappingProxyType(table)
+
+# A holder, not the mapping itself: read it with TABLE_STORE.actual()
+TABLE_STORE = LexicoRecargable(TABLE_PATH, load_table)
+
+@lru_cache(maxsize=4096)
+def _fallback(lemma: str) -> EnglishForms:
+    return regular_forms(lemma)
+
+def inflect(lemma: str) -> EnglishForms:
+    """Returns gerund, past and past participle for a lemma."""
+    lemma = lemma.lower().strip()
+    forms = TABLE_STORE.actual().get(lemma)
+    return forms if forms is not None else _fallback(lemma)
+
+def inflect_many(lemmas: Iterable[str]) -> Dict[str, EnglishForms]:
+    """Bulk version of inflect() for batch jobs; the whole batch uses one snapshot of the table."""
+    table = TABLE_STORE.actual()
+    result = {}
+    for lemma in lemmas:
+        key = lemma.lower().strip()
+        forms = table.get(key)
+        result[lemma] = forms if forms is not None else _fallback(key)
+    return result
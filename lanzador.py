@@ -0,0 +1,143 @@
+"""Lanzador con pre-fork: carga los modelos una vez y los comparte entre procesos.
+
+Alternativa al servidor de modelos (servidor_modelos.py). El proceso padre importa
+Streamlit, las páginas de la aplicación, spaCy y matplotlib, los calienta (calentamiento.py)
+y congela el recolector de basura (gc.freeze), para que no vuelva a escribir en
+esos objetos. Después crea N procesos con fork, y cada uno sirve la aplicación en su puerto (puerto, puerto + 1,
+...). Los hijos comparten la memoria de los modelos por copia en escritura y
+arrancan casi al instante. Si un hijo muere, el padre lo reemplaza con otro fork.
+
+Delante hace falta un balanceador con sesiones persistentes (Streamlit usa
+websockets). Cada --informe-seg segundos se informa la memoria única y compartida de
+cada proceso, leída de /proc/<pid>/smaps_rollup (solo Linux).
+
+Uso: python lanzador.py [--procesos 4] [--puerto 8501] [--informe-seg 60]
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from calentamiento import calentar_ahora
+
+logger = logging.getLogger(__name__)
+
+APLICACION = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vendler.py")
+
+@dataclass(frozen=True)
+class MemoriaProceso:
+    rss: float         # MB
+    compartida: float  # páginas que también usa otro proceso
+    unica: float       # páginas solo de este proceso
+    pss: float         # RSS con las páginas compartidas repartidas entre quienes las usan
+
+def memoria_proceso(pid: int) -> Optional[MemoriaProceso]:
+    campos = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for linea in f:
+                partes = linea.split()
+                if len(partes) == 3 and partes[2] == "kB":
+                    campos[partes[0].rstrip(":")] = int(partes[1]) / 1024
+    except OSError:
+        return None
+    return MemoriaProceso(
+        rss=campos.get("Rss", 0.0),
+        compartida=campos.get("Shared_Clean", 0.0) + campos.get("Shared_Dirty", 0.0),
+        unica=campos.get("Private_Clean", 0.0) + campos.get("Private_Dirty", 0.0),
+        pss=campos.get("Pss", 0.0),
+    )
+
+def precargar() -> None:
+    """Importa en el padre Streamlit y las páginas de la aplicación, para que los hijos
+    no las importen cada uno por su cuenta después del fork."""
+    from streamlit.web import bootstrap  # noqa: F401
+    import aktionsart_en, aktionsart_es, info, ls, trazas  # noqa: F401
+
+def servir(puerto: int) -> None:
+    """Se ejecuta en el hijo: arranca Streamlit con los módulos ya importados."""
+    from streamlit import config
+    from streamlit.web import bootstrap
+
+    gc.enable()
+    opciones = {"server_port": puerto, "server_headless": True, "server_fileWatcherType": "none"}
+    config._main_script_path = APLICACION
+    bootstrap.load_config_options(flag_options=opciones)
+    bootstrap.run(APLICACION, False, [], opciones)
+
+def lanzar(puerto: int) -> int:
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            servir(puerto)
+        except Exception:
+            logger.exception("El proceso del puerto %d falló", puerto)
+            os._exit(1)
+        os._exit(0)
+    logger.info("Proceso %d sirve en el puerto %d", pid, puerto)
+    return pid
+
+def informar(hijos: Dict[int, int]) -> None:
+    print(f"{'pid':>8}  {'puerto':>6}  {'RSS MB':>8}  {'compartida MB':>13}  {'única MB':>8}  {'PSS MB':>8}")
+    for pid, puerto in sorted([(os.getpid(), 0), *hijos.items()], key=lambda x: x[1]):
+        memoria = memoria_proceso(pid)
+        if memoria is None:
+            continue
+        etiqueta = str(puerto) if puerto else "padre"
+        print(f"{pid:>8}  {etiqueta:>6}  {memoria.rss:>8.1f}  {memoria.compartida:>13.1f}  "
+              f"{memoria.unica:>8.1f}  {memoria.pss:>8.1f}", flush=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Lanza varios procesos de Vendler que comparten los modelos")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--puerto", type=int, default=8501)
+    parser.add_argument("--informe-seg", type=float, default=60, help="0: sin informes de memoria")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    if not hasattr(os, "fork"):
+        sys.exit("El lanzador necesita os.fork (Linux o macOS); use `streamlit run vendler.py`")
+
+    # Sin recolecciones mientras se carga todo: así los objetos quedan juntos y no se tocan
+    gc.disable()
+    inicio = time.perf_counter()
+    precargar()
+    calentar_ahora()  # aunque VENDLER_CALENTAR=0: aquí se hace una vez para todos los hijos
+    gc.collect()
+    gc.freeze()
+    logger.info("Modelos cargados y calentados en %.1f s", time.perf_counter() - inicio)
+
+    hijos = {lanzar(args.puerto + i): args.puerto + i for i in range(args.procesos)}
+
+    def terminar(numero, _marco):
+        for pid in hijos:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, terminar)
+    signal.signal(signal.SIGTERM, terminar)
+
+    proximo_informe: Optional[float] = time.monotonic() + min(10.0, args.informe_seg) if args.informe_seg else None
+    while True:
+        pid, estado = os.waitpid(-1, os.WNOHANG)
+        if pid in hijos:
+            puerto = hijos.pop(pid)
+            logger.warning("El proceso %d (puerto %d) terminó con estado %d; se reemplaza", pid, puerto, estado)
+            hijos[lanzar(puerto)] = puerto
+        if proximo_informe is not None and time.monotonic() >= proximo_informe:
+            informar(hijos)
+            proximo_informe = time.monotonic() + args.informe_seg
+        time.sleep(1)
+
+if __name__ == "__main__":
+    main()
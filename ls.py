@@ -1,581 +1,21 @@
 # -*- coding: utf-8 -*-
 """
 Logical Structure Generator (ES version) - Streamlit
-Versión con panel informativo lateral
+Versión con panel informativo lateral. La lógica está en nucleo/ls.py; este módulo es solo la interfaz.
 """
 import streamlit as st
-import typing
-import re
-from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
-
-try:
-    from deep_translator import GoogleTranslator
-    TRADUCTOR_DISPONIBLE = True
-except ImportError:
-    TRADUCTOR_DISPONIBLE = False
-
-# Caché para no consultar a Google repetidamente por la misma palabra
-CACHE_TRADUCCION = {}
-
-# --- DICCIONARIO DE CORRECCIONES MANUALES ---
-CORRECCIONES = {
-    "pintada": "painted", "pintado": "painted",
-    "comida": "eaten", "comido": "eaten",
-    "bebida": "drunk", "bebido": "drunk",
-    "parada": "stopped", "parado": "stopped",
-    "herida": "wounded", "herido": "wounded",
-    "llamada": "called", "llamado": "called",
-    "vista": "seen", "visto": "seen",
-    "hecha": "made", "hecho": "made",
-    "vuelta": "returned", "vuelto": "returned",
-    "puesta": "put", "puesto": "put",
-    "escrito": "written", "escrita": "written",
-    "abierto": "open", "abierta": "open", 
-    "rota": "broken", "roto": "broken",
-    "muerto": "dead", "muerta": "dead", 
-    "dicho": "said", "dicha": "said",
-    "alto": "tall", "alta": "tall", "altos": "tall", "altas": "tall",
-    "chico": "little", "chica": "little", "chicos": "little", "chicas": "little",
-    "asesinado": "dead", "asesinada": "dead", "asesinados": "dead", "asesinadas": "dead",
-}
-
-# --- DICCIONARIO DE PARTICIPIOS IRREGULARES ---
-PARTICIPIOS_IRREGULARES = {
-    "abrir": "abierto", "cubrir": "cubierto", "decir": "dicho",
-    "escribir": "escrito", "hacer": "hecho", "freír": "frito",
-    "imprimir": "impreso", "morir": "muerto", "poner": "puesto",
-    "proveer": "provisto", "romper": "roto", "satisfacer": "satisfecho",
-    "soltar": "suelto", "ver": "visto", "volver": "vuelto",
-    "ir": "ido", "ser": "sido", "pudrir": "podrido",
-    "leer": "leído", "traer": "traído", "caer": "caído", "oír": "oído",
-    # Derivados comunes
-    "descubrir": "descubierto", "encubrir": "encubierto", "recubrir": "recubierto",
-    "describir": "descrito", "inscribir": "inscrito", "prescribir": "prescrito",
-    "proscribir": "proscrito", "suscribir": "suscrito", "transcribir": "transcrito",
-    "deshacer": "deshecho", "rehacer": "rehecho",
-    "componer": "compuesto", "descomponer": "descompuesto", "disponer": "dispuesto",
-    "exponer": "expuesto", "imponer": "impuesto", "oponer": "opuesto",
-    "proponer": "propuesto", "reponer": "repuesto", "suponer": "supuesto",
-    "absolver": "absuelto", "disolver": "disuelto", "resolver": "resuelto",
-    "devolver": "devuelto", "envolver": "envuelto", "revolver": "revuelto",
-    "prever": "previsto", "entrever": "entrevisto",
-}
-
-# --- LISTA DE PROTECCIÓN: Palabras clave de RRG que NO deben traducirse ---
-RRG_KEYWORDS = {
-    "do", "cause", "become", "ingr", "proc", "seml", "fin", "exist", 
-    "be", "be-loc", "know", "have", "feel", "see", "hear", "smell", "taste", 
-    "covering.path.distance", "weather", "if", "evid", "sta", "tns", "mod", 
-    "asp", "not", "purp", "being.created", "being.consumed", "consumed",
-    "have.as.part", "have.as.kin", "have.enough.with", "express", "hit",
-    "move.away.from.reference.point", "move.up.from.reference.point", 
-    "move.down.from.reference.point", "not"
-}
-
-# --- 1. CLASES Y ESTRUCTURAS ---
-
-@dataclass
-class Operador:
-    codigo: str
-    descripcion: str
-    requiere_valor: bool
-    ejemplos: str
-
-OPERADORES = [
-    Operador('IF', 'Fuerza ilocutiva', True, "DECL, INT, IMP"),
-    Operador('EVID', 'Evidencialidad', True, "VIS, INF, HEARSAY"),
-    Operador('STA', 'Estatus', True, "REALIS, PSBL, NEG"),
-    Operador('TNS', 'Tiempo', True, "PAST, PRES, FUT"),
-    Operador('NEG.INT +', 'Negación interna', False, ""),
-    Operador('MOD', 'Modalidad deóntica', True, "OBLIG, PERMIS"),
-    Operador('EVQ', 'Cuantificación eventiva', True, "DISTR"),
-    Operador('DIR.CORE', 'Direccionalidad de centro', True, "HACIA.HABLANTE, DESDE.HABLANTE"),
-    Operador('DIR.NUC', 'Direccionalidad nuclear', True, "ARRIBA, AFUERA"),
-    Operador('ASP', 'Aspecto', True, "PFV, PERF, PROG"),
-    Operador('NEG.NUC +', 'Negación nuclear', False, "")
-]
-
-# Diccionario para obtener descripción completa de operadores
-OPERADORES_DESC = {op.codigo: op.descripcion for op in OPERADORES}
-
-AKTIONSART_OPCIONES = {
-    "estado": "estado",
-    "estado causativo": "estado causativo",
-    "logro": "logro",
-    "logro causativo": "logro causativo",
-    "realización": "realización",
-    "realización causativa": "realización causativa",
-    "semelfactivo": "semelfactivo",
-    "semelfactivo causativo": "semelfactivo causativo",
-    "proceso": "proceso",
-    "proceso causativo": "proceso causativo",
-    "actividad": "actividad",
-    "actividad causativa": "actividad causativa",
-    "realización activa": "realización activa",
-    "realización activa causativa": "realización activa causativa"
-}
-
-MODIFICADORES_AKT = {
-    "logro": "INGR",
-    "realización": "BECOME",
-    "proceso": "PROC",
-    "semelfactivo": "SEML",
-    "logro causativo": "INGR",
-    "realización causativa": "BECOME",
-    "proceso causativo": "PROC",
-    "semelfactivo causativo": "SEML"
-}
-
-# --- 2. DICCIONARIOS DE VERBOS ---
-
-VERBOS_MOVIMIENTO = {
-    "move.away.from.reference.point": [
-        "ir", "irse", "salir", "partir", "marchar", "escapar", "huir",
-        "largarse", "migrar", "retirarse", "alejarse", "ausentarse",
-        "desaparecer", "desvanecerse", "desplazarse", "evadirse", "esfumarse",
-        "fugarse", "trasladarse", "mudarse", "perderse", "marcharse", "venir",
-        "arrancar", "arrancarse", "cambiarse", "saltar"
-    ],
-    "move.up.from.reference.point": [
-        "subir", "subirse", "ascender", "escalar", "trepar", "elevarse", "remontar"
-    ],
-    "move.down.from.reference.point": [
-        "bajar", "bajarse", "caer", "caerse", "descender"
-    ]
-}
-
-VERBOS_METEOROLOGICOS = [
-    "llover", "nevar", "granizar", "tronar", "relampaguear", "diluviar",
-    "lloviznar", "escampar", "helar", "deshelar", "ventear", "anochecer",
-    "amanecer", "atardecer", "oscurecer", "aclarar", "nublar", "despejar",
-    "chispear", "orbayar", "orvallar", "chaparrear", "gotear", "garuar",
-    "chirimirear", "temblar", "nortear", "terremotear"
-]
-
-VERBOS_TRANSFERENCIA = {
-    "sacar": [
-        "sacar", "retirar", "tomar", "agarrar", "coger", "quitar", "apartar",
-        "desalojar", "separar", "desplazar", "exiliar", "remover", "descolgar",
-        "extraer", "rescatar", "liberar", "arrancar", "sustraer", "arrebatar",
-        "despojar", "confiscar", "desposeer", "usurpar", "desapropiar",
-        "decomisar", "expropiar", "robar", "hurtar", "birlar", "enajenar",
-        "pedir", "solicitar", "demandar", "exigir", "comprar", "cobrar",
-        "exigir", "facturar", "reclamar", "perceptuar", "expulsar", "desalojar",
-        "lanzar", "arrojar", "eliminar", "desterrar", "extraditar", "ahuyentar",
-        "desarraigar", "destituir", "desprender", "erradicar", "vaciar", "drenar",
-        "salvar"
-    ],
-    "dar_poner": [
-        "acercar", "acreditar", "adicionar", "adscribir", "agregar", "alcanzar",
-        "añadir", "aplicar", "arrimar", "asignar", "atribuir", "cargar", "ceder", "colocar",
-        "conceder", "conferir", "consignar", "cubrir", "dar", "delegar", "desparramar",
-        "destinar", "distribuir", "donar", "dotar", "echar", "encomendar", "endilgar",
-        "entregar", "enviar", "esparcir", "estipular", "expandir", "extender",
-        "facilitar", "fijar", "imputar", "incorporar", "instituir", "legar", "llevar",
-        "mandar", "nombrar", "obsequiar", "ofrecer", "otorgar", "pasar", "poner",
-        "prescribir", "prestar", "proporcionar", "reconocer", "repartir", "señalar",
-        "suministrar", "traer", "transferir", "trasferir", "traspasar", "untar",
-        "vender", "verter", "vertir"
-    ]
-}
-
-VERBOS_DICCION = {
-    "preguntar": [
-        "averiguar", "consultar", "cuestionar", "demandar", "indagar",
-        "inquirir", "interpelar", "interrogar", "pedir", "preguntar",
-        "recabar", "requerir", "sondear"
-    ],
-    "conversar": [
-        "charlar", "chismear", "chismorrear", "comentar", "conferenciar",
-        "conferir", "conversar", "cotillear", "cotorrear", "cuchichear",
-        "departir", "dialogar", "discutir", "gritar", "gritarse",
-        "hablar", "interlocutar", "parlar", "parlotear", "platicar", "tratar"
-    ],
-    "agradecer": {
-        "adular": "adulación", "advertir": "advertencia", "agradecer": "agradecimiento",
-        "alardear": "alarde", "amenazar": "amenaza", "brindar": "brindis",
-        "criticar": "crítica", "disculpar": "disculpa", "elogiar": "elogio",
-        "encomiar": "encomio", "exhortar": "exhortación", "felicitar": "felicitación",
-        "halagar": "halago", "implorar": "imploración", "insultar": "insulto",
-        "jurar": "juramento", "lamentar": "lamento", "lisonjear": "lisonja",
-        "pedir": "petición", "perdonar": "perdón", "protestar": "protesta",
-        "regañar": "regaño", "replicar": "réplica", "rogar": "ruego",
-        "saludar": "saludo", "suplicar": "súplica"
-    },
-    "bendecir": {
-        "aconsejar": "consejo", "argumentar": "argumento", "bendecir": "bendición",
-        "debatir": "debate", "maldecir": "maldición", "mentir": "mentira",
-        "prometer": "promesa"
-    }
-}
-
-VERBOS_TRI_NEG = {
-    "desatribuir": [
-        "desatribuir", "desasignar", "quitar", "retirar", "denegar",
-        "rechazar", "rehusar", "desconocer", "ignorar", "negar", "revocar",
-        "desacreditar", "desautorizar", "invalidar", "desadscribir",
-        "desvincular", "separar"
-    ],
-    "ocultar": [
-        "ocultar", "esconder", "encubrir", "disimular", "camuflar", "velar",
-        "callar", "silenciar", "omitir", "reservar", "retener", "hurtar",
-        "guardar", "escamotear", "suprimir", "enmascarar", "tapar"
-    ]
-}
-
-VERBOS_POSESION = {
-    "tener": [
-        "acoger", "albergar", "alojar", "contener", "conservar", "custodiar",
-        "cuidar", "demostrar", "denotar", "desplegar", "evidenciar", "exhibir",
-        "gestionar", "guardar", "hospedar", "incluir", "lucir", "manifestar",
-        "mantener", "mostrar", "ofrecer", "ostentar", "portar", "poseer",
-        "presentar", "proteger", "reflejar", "resguardar", "revelar",
-        "sostener", "soportar", "tener", "vigilar"
-    ],
-    "obtener": [
-        "obtener", "conseguir", "lograr", "adquirir", "alcanzar", "recibir",
-        "ganar", "captar", "capturar", "atrapar"
-    ],
-    "perder": ["perder", "extraviar", "traspapelar", "egraviar"]
-}
-
-VERBOS_EXISTENCIA = [
-    "conservada", "conservado", "conservadas", "conservados",
-    "existida", "existido", "existidas", "existidos",
-    "habida", "habido", "habidas", "habidos",
-    "perdurada", "perdurado", "perduradas", "perdurados",
-    "permanecida", "permanecido", "permanecidas", "permanecidos",
-    "persistida", "persistido", "persistidas", "persistidos",
-    "quedada", "quedado", "quedadas", "quedados",
-    "resistida", "resistido", "resistidas", "resistidos",
-    "restada", "restado", "restadas", "restados",
-    "sida", "sido", "sidas", "sidos",
-    "sobrevivida", "sobrevivido", "sobrevividas", "sobrevividos",
-    "subsistida", "subsistido", "subsistidas", "subsistidos"
-]
-
-VERBOS_PERCEPCION = {
-    "ver": "see", "observar": "see", "mirar": "see", "contemplar": "see",
-    "vislumbrar": "see", "divisar": "see", "atisbar": "see", "escudriñar": "see",
-    "distinguir": "see", "enfocar": "see", "ojear": "see", "cachar": "see",
-    "otear": "see", "escanear": "see", "acechar": "see",
-    "oír": "hear", "escuchar": "hear", "atender": "hear", "auscultar": "hear",
-    "tocar": "feel", "palpar": "feel", "rozar": "feel", "acariciar": "feel",
-    "manosear": "feel",
-    "probar": "taste", "saborear": "taste", "degustar": "taste", "paladear": "taste",
-    "catar": "taste", "gustar": "taste",
-    "oler": "smell", "aspirar": "smell", "olisquear": "smell", "olfatear": "smell",
-    "husmear": "smell", "inhalar": "smell", "olorosar": "smell"
-}
-
-VERBOS_PERCEPCION_IMPERSONAL = {
-    "saber": "taste", "sabido": "taste", "sabida": "taste", "sabidos": "taste", "sabidas": "taste",
-    "oler": "smell", "olido": "smell", "olida": "smell", "olidos": "smell", "olidas": "smell",
-    "sonar": "hear", "sonado": "hear", "sonada": "hear", "sonados": "hear", "sonadas": "hear",
-    "ver": "see", "verse": "see", "visto": "see", "vista": "see", "vistos": "see", "vistas": "see",
-    "sentir": "feel", "sentirse": "feel", "sentido": "feel", "sentida": "feel", "sentidos": "feel", "sentidas": "feel"
-}
-
-# --- 3. FUNCIONES AUXILIARES ---
-
-def buscar_verbo(verbo, diccionario):
-    for categoria, verbos in diccionario.items():
-        if verbo in verbos:
-            return categoria
-    return None
-
-def normalizar_arg(arg: str) -> str:
-    return 'Ø' if arg in ('0', '') else arg
-
-def extraer_mr(ls: str) -> tuple:
-    """Extrae el marcador [MR0] o [MR1] de la estructura lógica.
-    Retorna (ls_sin_mr, mr) donde mr es el marcador o cadena vacía."""
-    match = re.search(r'\s*\[MR[01]\]\s*$', ls)
-    if match:
-        mr = match.group().strip()
-        ls_sin_mr = ls[:match.start()].strip()
-        return (ls_sin_mr, mr)
-    return (ls, "")
-
-def insertar_mr(ls: str, mr: str) -> str:
-    """Inserta el marcador MR al final de la estructura lógica."""
-    if mr:
-        return f"{ls} {mr}"
-    return ls
-
-def traducir_ls_a_ingles(ls_string: str, usar_html: bool = True) -> str:
-    """
-    Traduce constantes al inglés y las pone en NEGRITA.
-    Incluye un diccionario de correcciones ampliado para evitar ambigüedades 
-    donde el traductor confunde participios con sustantivos.
-    """
-    if not ls_string:
-        return ls_string
-
-    # Tags para formato
-    if usar_html:
-        NEGRITA_INICIO = "<b>"
-        NEGRITA_FIN = "</b>"
-    else:
-        NEGRITA_INICIO = ""
-        NEGRITA_FIN = ""
-    
-    if TRADUCTOR_DISPONIBLE:
-        translator = GoogleTranslator(source='es', target='en')
-    else:
-        translator = None
-
-    def reemplazar_match(match):
-        constante = match.group(1) 
-        
-        # Variable para guardar la palabra final
-        palabra_final = constante
-        constante_lower = constante.lower()
-
-        # 1. Si está en la lista de palabras reservadas RRG, no tocar
-        if constante_lower in RRG_KEYWORDS:
-            pass
-            
-        # 2. Si está en nuestro DICCIONARIO DE CORRECCIONES, usar esa versión
-        elif constante_lower in CORRECCIONES:
-            palabra_final = CORRECCIONES[constante_lower]
-            
-        # 3. Si no, intentar traducción normal
-        elif translator:
-            texto_limpio = constante.replace(".", " ")
-            if texto_limpio in CACHE_TRADUCCION:
-                palabra_final = CACHE_TRADUCCION[texto_limpio]
-            else:
-                try:
-                    traduccion = translator.translate(texto_limpio)
-                    if traduccion:
-                        palabra_final = traduccion.lower().strip().replace(" ", ".")
-                        CACHE_TRADUCCION[texto_limpio] = palabra_final
-                except Exception:
-                    pass 
-
-        return f"{NEGRITA_INICIO}{palabra_final}'{NEGRITA_FIN}"
-
-    patron = r"\b([a-zA-Zñáéíóúü\._Ø0-9\-]+)'"
-    ls_traducida = re.sub(patron, reemplazar_match, ls_string)
-    return ls_traducida
-
-def infinitivo_a_participio(infinitivo: str) -> str:
-    """Convierte un infinitivo español a su forma de participio."""
-    infinitivo = infinitivo.lower().strip()
-    
-    # Quitar pronombres enclíticos (se, me, te, nos, os)
-    pronombres = ("se", "me", "te", "nos", "os")
-    for pron in pronombres:
-        if infinitivo.endswith(pron):
-            infinitivo = infinitivo[:-len(pron)]
-            break
-
-    # Buscar en irregulares
-    if infinitivo in PARTICIPIOS_IRREGULARES:
-        return PARTICIPIOS_IRREGULARES[infinitivo]
-    
-    # Reglas regulares (adaptado de aktionsart_es.py)
-    if infinitivo.endswith("ar"):
-        return infinitivo[:-2] + "ado"
-    elif infinitivo.endswith(("er", "ir")):
-        return infinitivo[:-2] + "ido"
-    
-    # Si no reconoce el patrón, devolver tal cual
-    return infinitivo
-
-# FUNCIONES PARA EXPORTAR O COPIAR LS FINAL
-
-def limpiar_html_ls(ls_html: str) -> str:
-    """Convierte la estructura lógica con HTML a texto plano."""
-    texto = ls_html
-    # Reemplazar entidades HTML por ángulos Unicode
-    texto = texto.replace('&lt;', '⟨')
-    texto = texto.replace('&gt;', '⟩')
-    # Eliminar tags HTML
-    texto = re.sub(r'<[^>]+>', '', texto)
-    return texto
-
-def convertir_ls_a_latex(ls_html: str) -> str:
-    """Convierte la estructura lógica con HTML a formato LaTeX (modo matemático)."""
-    texto = ls_html
-    
-    # 1. Convertir negritas (constantes predicativas)
-    texto = re.sub(r'<b>([^<]+)</b>', r'\\mathbf{\1}', texto)
-    
-    # 2. Convertir apertura de operador: &lt;<sub>XX</sub> → \langle_{\text{XX}}\;
-    texto = re.sub(r'&lt;<sub>([^<]+)</sub>', r'\\langle_{\\text{\1}}\\;', texto)
-    
-    # 3. Convertir itálicas (valores de operadores) con espacio después
-    texto = re.sub(r'<i>([^<]+)</i>', r'\\textit{\1}\\;', texto)
-    
-    # 4. Convertir cierre de ángulos con espacio antes
-    texto = texto.replace('&gt;', r'\rangle')
-    
-    # 5. Convertir símbolo vacío
-    texto = texto.replace('Ø', r'\varnothing')
-    
-    # 6. Convertir palabras clave de RRG a texto con espacios
-    keywords = ['CAUSE', 'INGR', 'BECOME', 'PROC', 'SEML', 'PURP', 'FIN', 'NOT']
-    for kw in keywords:
-        texto = re.sub(rf'(?<![a-zA-Z]){kw}(?![a-zA-Z\'])', f'\\;\\\\text{{{kw}}}\\;', texto)
-    
-    # 7. Formatear [MR0] y [MR1]
-    texto = re.sub(r'\[MR([01])\]', r'\\;[\\text{MR\1}]', texto)
-    
-    # 8. Formatear argumentos entre paréntesis (palabras que empiezan con mayúscula)
-    def formatear_argumento(match):
-        arg = match.group(1)
-        if arg[0].isupper() and arg not in keywords:
-            return f'\\text{{{arg}}}'
-        return arg
-    
-    texto = re.sub(r'\b([A-Z][a-zá-úñ]*)\b(?![}\'])', formatear_argumento, texto)
-    
-    # 9. Añadir espacio después de comas
-    texto = texto.replace(',', ', ')
-    
-    # 10. Envolver todo en modo matemático
-    texto = f'${texto}$'
-    return texto
-
-def generar_imagen_ls(ls_html: str) -> bytes:
-    """Genera una imagen PNG de la estructura lógica con formato."""
-    import matplotlib.pyplot as plt
-    from io import BytesIO
-    
-    # Convertir HTML a formato matplotlib mathtext
-    texto = ls_html
-    texto = texto.replace('&lt;', '⟨')
-    texto = texto.replace('&gt;', '⟩')
-    texto = re.sub(r'<sub>([^<]+)</sub>', r'$_{\\mathrm{\1}}$', texto)
-    texto = re.sub(r'<i>([^<]+)</i>', r'$\\mathit{\1}$', texto)
-    texto = re.sub(r'<b>([^<]+)</b>', r'$\\mathbf{\1}$', texto)
-    
-    # Calcular ancho según longitud
-    ancho = max(len(ls_html) * 0.08, 10)
-    
-    fig, ax = plt.subplots(figsize=(ancho, 1.5))
-    ax.axis('off')
-    
-    ax.text(0.5, 0.5, texto,
-            fontsize=14,
-            ha='center',
-            va='center',
-            transform=ax.transAxes)
-    
-    buf = BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight', dpi=150,
-                facecolor='white', edgecolor='none', pad_inches=0.3)
-    plt.close(fig)
-    buf.seek(0)
-    return buf.getvalue()
-
-def extraer_predicados_de_ls(ls_html: str) -> list:
-    """Extrae los predicados (en negrita) de la estructura lógica, excluyendo palabras reservadas de RRG."""
-    patron = r"<b>([^<]+)'</b>"
-    matches = re.findall(patron, ls_html)
-    # Eliminar duplicados manteniendo orden, excluyendo palabras reservadas
-    vistos = set()
-    unicos = []
-    for m in matches:
-        m_lower = m.lower()
-        # Verificar que no sea palabra reservada (comparar también sin puntos)
-        m_base = m_lower.split('.')[0]
-        if m not in vistos and m_lower not in RRG_KEYWORDS and m_base not in RRG_KEYWORDS:
-            vistos.add(m)
-            unicos.append(m)
-    return unicos
-
-def reemplazar_predicado_en_ls(ls_html: str, pred_viejo: str, pred_nuevo: str) -> str:
-    """Reemplaza un predicado por otro en la estructura lógica."""
-    # Reemplazar <b>pred_viejo'</b> por <b>pred_nuevo'</b>
-    patron = f"<b>{re.escape(pred_viejo)}'</b>"
-    reemplazo = f"<b>{pred_nuevo}'</b>"
-    return re.sub(patron, reemplazo, ls_html)
-
-# --- 4. FUNCIONES DE GENERACIÓN DE ESTRUCTURAS LÓGICAS ---
-
-def generar_estructura_no_causativa(x, y, locus, pred, operador, AKT):
-    if y != "Ø" and locus == "Ø":
-        return f"{operador + ' ' if operador else ''}{pred}' ({x}, {y})"
-    elif y == "Ø" and locus != "Ø":
-        return f"{operador + ' ' if operador else ''}{pred}' ({x}, {locus})"
-    elif y == "Ø" and locus == "Ø":
-        return f"{operador + ' ' if operador else ''}{pred}' ({x})"
-    return None
-
-def generar_estructura_causativa(x, y, pred, operador):
-    if y == "Ø":
-        return None
-    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}{pred}' ({y})]"
-
-def generar_estructura_actividad(x, y, locus, pred, operador):
-    if y != "Ø" and locus == "Ø":
-        return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x}, {y})])"
-    elif y == "Ø" and locus != "Ø":
-        return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x}, {locus})])"
-    elif y == "Ø" and locus == "Ø":
-        return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x})])"
-    return None
-
-def generar_estructura_actividad_causativa(x, y, pred, operador):
-    if y == "Ø":
-        return None
-    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}do' ({y}, [{pred}' ({y})])]"
-
-def aplicar_DO(x, estructura_logica):
-    if estructura_logica is None:
-        return None
-    ls_sin_mr, mr = extraer_mr(estructura_logica)
-    resultado = f"DO ({ls_sin_mr})"
-    return insertar_mr(resultado, mr)
-
-def aplicar_anticausativa(estructura_logica):
-    ls_sin_mr, mr = extraer_mr(estructura_logica)
-    resultado = f"[do' (Ø, Ø)] CAUSE [{ls_sin_mr}]"
-    return insertar_mr(resultado, mr)
-
-def añadir_operadores_a_ls(estructura_logica: str, operadores_seleccionados: List[Tuple[str, Optional[str]]]) -> str:
-    """Añade operadores a la estructura lógica con formato RRG (operador en subíndice, valor en itálica)."""
-    if not operadores_seleccionados:
-        return estructura_logica
-    
-    # Extraer MR si existe
-    ls_sin_mr, mr = extraer_mr(estructura_logica)
-    # Construir el resultado base: MR queda dentro del corchete externo pero fuera de la LS
-    if mr:
-        resultado = f"[{ls_sin_mr}]{mr}"
-    else:
-        resultado = f"[{ls_sin_mr}]"
-    
-    for codigo, valor in reversed(operadores_seleccionados):
-        # Separar el símbolo + si existe en el código (para NEG.INT + y NEG.NUC +)
-        if codigo.endswith(' +'):
-            codigo_base = codigo[:-2]
-            sufijo_codigo = " <i>+</i>"
-        else:
-            codigo_base = codigo
-            sufijo_codigo = ""
-        
-        # Separar el símbolo + si existe en el valor (para STA NEG +)
-        if valor and valor.endswith(' +'):
-            valor_base = valor[:-2]
-            valor_formateado = f"<i>{valor_base}</i> <i>+</i>"
-        elif valor:
-            valor_formateado = f"<i>{valor}</i>"
-        else:
-            valor_formateado = ""
-        
-        if valor_formateado:
-            resultado = f"&lt;<sub>{codigo_base}</sub>{sufijo_codigo} {valor_formateado} {resultado}&gt;"
-        else:
-            resultado = f"&lt;<sub>{codigo_base}</sub>{sufijo_codigo} {resultado}&gt;"
-    
-    return resultado
-
-# --- 5. NAVEGACIÓN STREAMLIT ---
+from nucleo.ls import (
+    AKTIONSART_OPCIONES, CLASES_RA, MODIFICADORES_AKT, OPERADORES, OPERADORES_DESC,
+    PREGUNTAS_LS, RespuestasLS, SENTIDOS, aplicar_DO, aplicar_anticausativa,
+    añadir_operadores_a_ls, buscar_verbo, convertir_ls_a_latex, es_de_clase,
+    extraer_predicados_de_ls, generar_estructura_actividad,
+    generar_estructura_causativa, generar_estructura_no_causativa, generar_imagen_ls,
+    infinitivo_a_participio, limpiar_html_ls, normalizar_arg, normalizar_operadores,
+    opciones_predicado, reemplazar_predicado_en_ls, registrar_predicado, resolver_ls,
+    sentido_percepcion, sugerir_predicados, sustantivo_diccion, traducir_ls_a_ingles,
+)
+
+# --- 6. NAVEGACIÓN STREAMLIT ---
 
 def crear_callback_ir_a(paso, **kwargs):
     """Crea un callback para navegar a un paso específico, opcionalmente asignando valores."""
@@ -592,6 +32,34 @@ def ir_a(paso):
     st.session_state.ls_paso = paso
     st.rerun()
 
+def ir_a_predicado(pred: str, siguiente: str, participio: bool = False):
+    """Guarda el predicado y navega a `siguiente`. Si el verbo no se reconoce pero se parece
+    a uno conocido, pasa antes por el paso '¿Quisiste decir...?' (usar solo dentro de forms)."""
+    sugerencias = sugerir_predicados(pred)
+    if sugerencias:
+        st.session_state.ls_sugerencia_pred = (pred, tuple(sugerencias), siguiente, participio)
+        ir_a('sugerir_predicado')
+    else:
+        registrar_predicado(pred)
+        st.session_state.ls_pred = predicado_final(pred, participio)
+        ir_a(siguiente)
+
+def predicado_final(pred: str, participio: bool) -> str:
+    """En los pasos que piden participio, convierte el infinitivo escrito."""
+    if participio and pred.endswith(("ar", "er", "ir", "arse", "erse", "irse")):
+        return infinitivo_a_participio(pred).replace(" ", ".")
+    return pred
+
+def crear_callback_predicado(pred: str):
+    """Crea un callback que fija el predicado elegido en '¿Quisiste decir...?' y sigue el análisis."""
+    def callback():
+        _, _, siguiente, participio = st.session_state.ls_sugerencia_pred
+        registrar_predicado(pred)
+        st.session_state.ls_pred = predicado_final(pred, participio)
+        st.session_state.ls_paso = siguiente
+        del st.session_state.ls_sugerencia_pred
+    return callback
+
 def ir_a_intencionalidad():
     """Navega al paso intencionalidad guardando la estructura pre-DO."""
     st.session_state.ls_estructura_pre_do = st.session_state.ls_estructura
@@ -610,6 +78,19 @@ def reiniciar_analisis():
     # 3. Asegurar que la dinamicidad heredada se limpie
     st.session_state.ls_es_dinamico = None
 
+def selector_predicado(etiqueta: str) -> str:
+    """Campo del predicado con autocompletado: ofrece los verbos conocidos (los más usados
+    primero) y acepta también cualquier texto nuevo."""
+    valor = st.selectbox(
+        etiqueta,
+        options=opciones_predicado(),
+        index=None,
+        accept_new_options=True,
+        placeholder="Escribe para ver sugerencias",
+        label_visibility="collapsed",
+    )
+    return valor or ""
+
 def botones_navegacion():
     st.write("---")
     st.button("↺ Iniciar un nuevo análisis", use_container_width=True, key=f"nav_reset_{st.session_state.ls_paso}", on_click=reiniciar_analisis)
@@ -620,7 +101,7 @@ def lista_elegante(items: list):
         html_items += f'<div style="display: flex; align-items: flex-start; margin-bottom: 8px;"><div style="color: #4A90E2; margin-right: 10px; font-weight: bold;">•</div><div style="line-height: 1.4;">{item}</div></div>'
     st.markdown(f'<div style="margin-bottom: 15px;">{html_items}</div>', unsafe_allow_html=True)
 
-# --- 6. PANEL INFORMATIVO LATERAL ---
+# --- 7. PANEL INFORMATIVO LATERAL ---
 
 def mostrar_panel_info():
     """Muestra el panel informativo con los datos del análisis actual."""
@@ -804,7 +285,7 @@ def mostrar_panel_info():
             </div>
         ''', unsafe_allow_html=True)
 
-# --- 7. INTERFAZ PRINCIPAL ---
+# --- 8. INTERFAZ PRINCIPAL ---
 
 def mostrar_asistente_ls():
     st.markdown("""
@@ -953,6 +434,119 @@ def mostrar_asistente_ls():
                         elif not oracion:
                             st.warning("Por favor, escribe la cláusula.")
 
+                st.button(
+                    "Modo experto: completar todo en un solo formulario",
+                    use_container_width=True,
+                    key="ir_experto",
+                    on_click=crear_callback_ir_a('experto')
+                )
+
+        # --- PASO: FORMULARIO EXPERTO ---
+        elif st.session_state.ls_paso == 'experto':
+            st.markdown("#### **Formulario experto**")
+            st.info("Completa en una sola pantalla los datos y respuestas que necesita el asistente. Deja en blanco lo que no corresponda: si falta algo necesario, se te indicará qué responder.")
+
+            aktionsart_opciones = list(AKTIONSART_OPCIONES.values())
+            akt_previo = st.session_state.get('ls_akt')
+
+            with st.form(key="form_experto_ls"):
+                st.write("**Aktionsart y cláusula:**")
+                akt = st.selectbox(
+                    "Aktionsart",
+                    options=aktionsart_opciones,
+                    index=aktionsart_opciones.index(akt_previo) if akt_previo in aktionsart_opciones else None,
+                    format_func=lambda x: x.capitalize(),
+                    key="exp_akt"
+                )
+                oracion = st.text_input("Cláusula", value=st.session_state.get('ls_oracion', ''), key="exp_oracion")
+
+                st.write("**Argumentos** (en blanco si no están presentes; para afijos o clíticos, escribe los rasgos, ej.: *3sg*):")
+                c1, c2, c3 = st.columns(3)
+                x = c1.text_input("Sujeto", key="exp_x")
+                y = c2.text_input("Complemento directo (sin «a»)", key="exp_y")
+                z = c3.text_input("Complemento indirecto (sin «a»)", key="exp_z")
+
+                st.write("**Predicado y otros constituyentes:**")
+                c1, c2 = st.columns(2)
+                predicado = c1.text_input("Infinitivo del verbo (o adjetivo/atributo)", key="exp_predicado")
+                tipo_pred = c2.radio("Tipo de predicado", options=["Verbo", "Adjetivo/atributo"], index=None, horizontal=True, key="exp_tipo_pred")
+                c1, c2 = st.columns(2)
+                actividad = c1.text_input("Actividad del participante causado (infinitivo)", key="exp_actividad")
+                atributo = c2.text_input("Sensación, atributo, adverbio o cualidad", key="exp_atributo")
+                c1, c2 = st.columns(2)
+                locus = c1.text_input("Lugar (sin preposición)", key="exp_locus")
+                lugar_tipo = c2.radio("El lugar es", options=["Procedencia", "Destino"], index=None, horizontal=True, key="exp_lugar_tipo")
+                c1, c2 = st.columns(2)
+                suplemento = c1.text_input("Complemento de régimen (sin preposición)", key="exp_suplemento")
+                preposicion = c2.text_input("Preposición regida", key="exp_preposicion")
+                c1, c2 = st.columns(2)
+                interlocutor = c1.text_input("Interlocutor", key="exp_interlocutor")
+                alimento = c2.text_input("Alimento consumido", key="exp_alimento")
+                sentido = st.radio("Sentido de la percepción", options=list(SENTIDOS.keys()), index=None, horizontal=True, key="exp_sentido")
+                clase_ra = st.radio("Clase semántica de la realización activa", options=CLASES_RA, index=None, horizontal=True, key="exp_clase_ra")
+
+                st.write("**Preguntas diagnósticas** (responde las que sean pertinentes):")
+                respuestas = {}
+                for clave, pregunta in PREGUNTAS_LS.items():
+                    respuesta = st.radio(pregunta, options=["Sí", "No"], index=None, horizontal=True, key=f"exp_preg_{clave}")
+                    respuestas[clave] = None if respuesta is None else respuesta == "Sí"
+
+                st.write("**Operadores** (opcional):")
+                ops_seleccionados = []
+                for i, op in enumerate(OPERADORES):
+                    c1, c2 = st.columns([1, 2])
+                    checked = c1.checkbox(op.descripcion, key=f"exp_op_check_{i}")
+                    valor = c2.text_input(
+                        f"Valor para {op.codigo}",
+                        placeholder=f"ej.: {op.ejemplos}",
+                        key=f"exp_op_val_{i}",
+                        label_visibility="collapsed"
+                    ) if op.requiere_valor else None
+                    if checked:
+                        ops_seleccionados.append((op.codigo, valor))
+
+                if st.form_submit_button("Generar estructura lógica", use_container_width=True):
+                    if not akt:
+                        st.warning("Por favor, selecciona un aktionsart.")
+                    elif not oracion:
+                        st.warning("Por favor, escribe la cláusula.")
+                    else:
+                        r = RespuestasLS(
+                            akt=akt, oracion=oracion, x=x, y=y, z=z,
+                            predicado=predicado,
+                            predicado_es_atributo=None if tipo_pred is None else tipo_pred == "Adjetivo/atributo",
+                            actividad=actividad, atributo=atributo, locus=locus,
+                            lugar_tipo={"Procedencia": "1", "Destino": "2"}.get(lugar_tipo, ""),
+                            suplemento=suplemento, preposicion=preposicion,
+                            interlocutor=interlocutor, alimento=alimento,
+                            sentido=SENTIDOS.get(sentido, ""), clase_ra=clase_ra or "",
+                            respuestas=respuestas,
+                        )
+                        res = resolver_ls(r)
+                        if res.pendientes:
+                            st.warning("Para generar la estructura lógica falta responder:\n\n" + "\n\n".join(res.pendientes))
+                        elif res.error:
+                            st.error(res.error)
+                        else:
+                            st.session_state.ls_akt = akt
+                            st.session_state.ls_oracion = oracion
+                            st.session_state.ls_x, st.session_state.ls_y, st.session_state.ls_z = (normalizar_arg(a.strip()) for a in (x, y, z))
+                            st.session_state.ls_pred = res.pred
+                            st.session_state.ls_locus = res.locus
+                            st.session_state.ls_complemento_regimen = res.complemento_regimen
+                            st.session_state.ls_es_dinamico = res.es_dinamico
+                            st.session_state.ls_estructura = res.estructura
+                            st.session_state.ls_estructura_pre_do = res.estructura_pre_do
+                            st.session_state.ls_estructura_con_do = res.estructura_con_do
+                            st.session_state.ls_estructura_traducida = traducir_ls_a_ingles(res.estructura, usar_html=True)
+                            if ops_seleccionados:
+                                st.session_state.ls_ops_valores = normalizar_operadores(ops_seleccionados)
+                                st.session_state.ls_estructura_final = añadir_operadores_a_ls(st.session_state.ls_estructura_traducida, st.session_state.ls_ops_valores)
+                            else:
+                                st.session_state.ls_estructura_final = st.session_state.ls_estructura_traducida
+                            ir_a('final')
+            botones_navegacion()
+
         # --- PASO: ARGUMENTOS ---
         elif st.session_state.ls_paso == 'argumentos':
             st.markdown("#### **Identificación de argumentos**")
@@ -1161,15 +755,14 @@ def mostrar_asistente_ls():
             elif (AKT in ["actividad", "realización activa"]) or (AKT in ["logro", "semelfactivo"] and es_dinamico) or (y != "Ø" and "causativ" not in AKT):
                 with st.form(key="form_pred_inf"):
                     st.info("Escribe el **infinitivo** del verbo:")
-                    pred = st.text_input("Infinitivo", label_visibility="collapsed")
+                    pred = selector_predicado("Infinitivo")
                     if st.form_submit_button("Siguiente", use_container_width=True):
-                        st.session_state.ls_pred = pred.lower().replace(" ", ".")
-                        ir_a('predicados_especiales_check')
+                        ir_a_predicado(pred.lower().replace(" ", "."), 'predicados_especiales_check')
                 botones_navegacion()
             else:
                 with st.form(key="form_pred_part"):
                     st.info("Escribe el **infinitivo** del verbo (o el **adjetivo/atributo** si se trata de un verbo copulativo o seudocopulativo):")
-                    pred = st.text_input("Predicado", label_visibility="collapsed")
+                    pred = selector_predicado("Predicado")
                     tipo_pred = st.radio(
                         "Tipo de predicado",
                         options=["Verbo", "Adjetivo/atributo"],
@@ -1186,11 +779,9 @@ def mostrar_asistente_ls():
                             pred_limpio = pred.lower().replace(" ", ".")
                             if tipo_pred == "Adjetivo/atributo":
                                 st.session_state.ls_pred = pred_limpio
-                            elif pred_limpio.endswith(("ar", "er", "ir", "arse", "erse", "irse")):
-                                st.session_state.ls_pred = infinitivo_a_participio(pred_limpio).replace(" ", ".")
+                                ir_a('predicados_especiales_check')
                             else:
-                                st.session_state.ls_pred = pred_limpio
-                            ir_a('predicados_especiales_check')
+                                ir_a_predicado(pred_limpio, 'predicados_especiales_check', participio=True)
                 botones_navegacion()
 
         # --- PASO: VERIFICACIÓN DE CASOS ESPECIALES ---
@@ -1447,7 +1038,7 @@ def mostrar_asistente_ls():
             if AKT == "realización activa":
                 with st.form(key="form_ld_ra"):
                     st.info("Escribe el **infinitivo** del verbo:")
-                    pred = st.text_input("Infinitivo", label_visibility="collapsed")
+                    pred = selector_predicado("Infinitivo")
                     if st.form_submit_button("Generar estructura"):
                         pred = pred.lower().replace(" ", ".")
                         st.session_state.ls_pred = pred
@@ -1472,7 +1063,7 @@ def mostrar_asistente_ls():
             if AKT == "realización activa":
                 with st.form(key="form_oi_pred_ra"):
                     st.info("Escribe el **infinitivo** del verbo:")
-                    pred = st.text_input("Infinitivo", label_visibility="collapsed")
+                    pred = selector_predicado("Infinitivo")
                     if st.form_submit_button("Siguiente"):
                         st.session_state.ls_pred = pred.lower().replace(" ", ".")
                         ir_a('pregunta_diccion_ra')
@@ -1480,14 +1071,14 @@ def mostrar_asistente_ls():
             elif AKT == "realización activa causativa":
                 with st.form(key="form_oi_pred_rac"):
                     st.info("Escribe el **infinitivo** del verbo:")
-                    pred = st.text_input("Infinitivo", label_visibility="collapsed")
+                    pred = selector_predicado("Infinitivo")
                     if st.form_submit_button("Siguiente"):
                         st.session_state.ls_pred = pred.lower().replace(" ", ".")
                         ir_a('pregunta_ensenar_rac')
             else:
                 with st.form(key="form_oi_pred"):
                     st.info("Escribe el **infinitivo** del verbo:")
-                    pred = st.text_input("Infinitivo", label_visibility="collapsed")
+                    pred = selector_predicado("Infinitivo")
                     if st.form_submit_button("Siguiente"):
                         st.session_state.ls_pred = pred.lower().replace(" ", ".")
                         ir_a('verificar_tipo_oi')
@@ -1531,13 +1122,13 @@ def mostrar_asistente_ls():
             
             y_clean = "something" if y in ["Ø", "0"] else y.replace(" ", ".")
             
-            if pred in VERBOS_DICCION["preguntar"]:
+            if es_de_clase(pred, "diccion.preguntar"):
                 ls = f"[do' ({x}, [express.question' ({x}, pregunta)]) ∧ PROC being.created' (pregunta) ∧ FIN exist' (pregunta)] PURP [do' ({z}, [express.something' ({z}, {y})])]"
-            elif pred in VERBOS_DICCION["agradecer"]:
-                arg_inc = VERBOS_DICCION["agradecer"].get(pred, pred)
+            elif es_de_clase(pred, "diccion.agradecer"):
+                arg_inc = sustantivo_diccion(pred, "agradecer")
                 ls = f"[do' ({x}, [express.{arg_inc}' ({x}, {y})]) ∧ PROC being.created' ({arg_inc}) ∧ FIN exist' ({arg_inc})] PURP [know' ({z}, {arg_inc} por {y})]"
-            elif pred in VERBOS_DICCION["bendecir"]:
-                arg_inc = VERBOS_DICCION["bendecir"].get(pred, pred)
+            elif es_de_clase(pred, "diccion.bendecir"):
+                arg_inc = sustantivo_diccion(pred, "bendecir")
                 ls = f"[do' ({x}, [express.{arg_inc}' ({x}, {y})]) ∧ PROC being.created' ({arg_inc}) ∧ FIN exist' ({arg_inc})] PURP [know' ({z}, {arg_inc} de {y})]"
             else:
                 ls = f"[do' ({x}, [express.something' ({x}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})] PURP [know' ({z}, {y})]"
@@ -1554,14 +1145,14 @@ def mostrar_asistente_ls():
             operador = MODIFICADORES_AKT.get(AKT, "")
             
             # Verificar transferencia
-            if pred in VERBOS_TRANSFERENCIA["sacar"]:
+            if es_de_clase(pred, "transferencia.sacar"):
                 if pred == "arrancar" and "causativ" not in AKT:
                     ir_a('caso_locativo')
                 else:
                     ls = f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT have' ({z}, {y})] PURP [have' ({x}, {y})]"
                     st.session_state.ls_estructura = ls
                     ir_a_intencionalidad()
-            elif pred in VERBOS_TRANSFERENCIA["dar_poner"] or (pred == "pegar" and y != "Ø"):
+            elif es_de_clase(pred, "transferencia.dar_poner") or (pred == "pegar" and y != "Ø"):
                 ls = f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}have' ({z}, {y})]"
                 st.session_state.ls_estructura = ls
                 ir_a_intencionalidad()
@@ -1604,13 +1195,13 @@ def mostrar_asistente_ls():
             
             y_clean = "something" if y in ["Ø", "0"] else y.replace(" ", ".")
             
-            if pred in VERBOS_DICCION["preguntar"]:
+            if es_de_clase(pred, "diccion.preguntar"):
                 ls = f"[{operador + ' ' if operador else ''}do' ({x}, [express.question' ({x})])] PURP [do' ({z}, [express.{y_clean}' ({z}, {y})])]"
-            elif pred in VERBOS_DICCION["agradecer"]:
-                arg_inc = VERBOS_DICCION["agradecer"].get(pred, pred)
+            elif es_de_clase(pred, "diccion.agradecer"):
+                arg_inc = sustantivo_diccion(pred, "agradecer")
                 ls = f"[{operador + ' ' if operador else ''}do' ({x}, [express.{arg_inc}' ({x}, {y})])] PURP [know' ({z}, {arg_inc} por {y})]"
-            elif pred in VERBOS_DICCION["bendecir"]:
-                arg_inc = VERBOS_DICCION["bendecir"].get(pred, pred)
+            elif es_de_clase(pred, "diccion.bendecir"):
+                arg_inc = sustantivo_diccion(pred, "bendecir")
                 ls = f"[{operador + ' ' if operador else ''}do' ({x}, [express.{arg_inc}' ({x}, {y})])] PURP [know' ({z}, {arg_inc} de {y})]"
             else:
                 ls = f"[{operador + ' ' if operador else ''}do' ({x}, [express.something' ({x}, {y})])] PURP [know' ({z}, {y})]"
@@ -1626,11 +1217,11 @@ def mostrar_asistente_ls():
             AKT = st.session_state.ls_akt
             operador = MODIFICADORES_AKT.get(AKT, "")
             
-            if pred in VERBOS_TRI_NEG["desatribuir"]:
+            if es_de_clase(pred, "tri_neg.desatribuir"):
                 ls = f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT have' ({z}, {y})]"
                 st.session_state.ls_estructura = ls
                 ir_a_intencionalidad()
-            elif pred in VERBOS_TRI_NEG["ocultar"]:
+            elif es_de_clase(pred, "tri_neg.ocultar"):
                 ls = f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT know' ({z}, {y})]"
                 st.session_state.ls_estructura = ls
                 ir_a_intencionalidad()
@@ -1840,11 +1431,21 @@ def mostrar_asistente_ls():
                 st.info("Escribe la información del lugar, sin preposición:")
                 locus = st.text_input("Lugar", label_visibility="collapsed")
                 st.info("Escribe el infinitivo del verbo:")
-                pred = st.text_input("infinitivo", label_visibility="collapsed")
+                pred = selector_predicado("infinitivo")
                 if st.form_submit_button("Siguiente"):
                     st.session_state.ls_locus = locus
-                    st.session_state.ls_pred = pred.lower().replace(" ", ".")
-                    ir_a('procesar_locativo')
+                    ir_a_predicado(pred.lower().replace(" ", "."), 'procesar_locativo')
+            botones_navegacion()
+
+        # --- PASO: ¿QUISISTE DECIR...? ---
+        elif st.session_state.ls_paso == 'sugerir_predicado':
+            escrito, sugerencias, _, _ = st.session_state.ls_sugerencia_pred
+            st.markdown("#### **¿Quisiste decir...?**")
+            st.info(f"No se reconoce el verbo **{escrito}**. ¿Quisiste decir alguno de estos?")
+            cols = st.columns(len(sugerencias) + 1)
+            for i, verbo in enumerate(sugerencias):
+                cols[i].button(verbo, use_container_width=True, key=f"sug_pred_{i}", on_click=crear_callback_predicado(verbo))
+            cols[-1].button(f"Mantener «{escrito}»", use_container_width=True, key="sug_pred_mantener", on_click=crear_callback_predicado(escrito))
             botones_navegacion()
 
         elif st.session_state.ls_paso == 'procesar_locativo':
@@ -1867,7 +1468,7 @@ def mostrar_asistente_ls():
                 st.session_state.ls_estructura = ls
                 ir_a_intencionalidad()
             # Verbo "tener" con locativo
-            elif pred in VERBOS_POSESION["tener"]:
+            elif es_de_clase(pred, "posesion.tener"):
                 ir_a('pregunta_tener_locativo')
             # Verbo "olvidar" con locativo
             elif pred == "olvidar":
@@ -1875,13 +1476,13 @@ def mostrar_asistente_ls():
                 st.session_state.ls_estructura = ls
                 ir_a_intencionalidad()
             # Verbos tipo "sacar" con locativo
-            elif pred in VERBOS_TRANSFERENCIA["sacar"] and not ((pred == "arrancar" or pred == "retirar") and "causativ" not in AKT):
+            elif es_de_clase(pred, "transferencia.sacar") and not ((pred == "arrancar" or pred == "retirar") and "causativ" not in AKT):
                 ls = f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}NOT be-LOC' ({locus}, {y})]"
                 st.session_state.ls_estructura = ls
                 ir_a_intencionalidad()
             # Verbos de movimiento
             elif AKT in ("actividad", "logro", "realización", "proceso", "semelfactivo"):
-                categoria_mov = buscar_verbo(pred, VERBOS_MOVIMIENTO)
+                categoria_mov = buscar_verbo(pred, "movimiento")
                 if categoria_mov:
                     ir_a('pregunta_lugar_tipo')
                 else:
@@ -2086,7 +1687,7 @@ def mostrar_asistente_ls():
                     
                     # Filtro de seguridad para verbos recíprocos (como en el CLI)
                     verbo_aislado = pred.split(".")[0]
-                    categoria = buscar_verbo(verbo_aislado, VERBOS_DICCION)
+                    categoria = buscar_verbo(verbo_aislado, "diccion")
                     if categoria == "conversar":
                         # Abortar y dejar que lo maneje predicados_especiales
                         ir_a('predicados_especiales_check')
@@ -2114,15 +1715,15 @@ def mostrar_asistente_ls():
             operador = MODIFICADORES_AKT.get(AKT, "")
             
             # Casos de percepción impersonal (algo huele mal)
-            if pred in VERBOS_PERCEPCION_IMPERSONAL and not es_dinamico and y == "Ø":
+            if es_de_clase(pred, "percepcion_impersonal") and not es_dinamico and y == "Ø":
                 ir_a('percepcion_impersonal')
             # Verbos meteorológicos propios
-            elif x == "Ø" and pred in VERBOS_METEOROLOGICOS:
+            elif x == "Ø" and es_de_clase(pred, "meteorologico"):
                 ls = f"{operador + ' ' if operador else ''}do' ([{pred}'])"
                 st.session_state.ls_estructura = ls
                 ir_a_intencionalidad()
             # Verbos de conversación recíproca
-            elif pred in VERBOS_DICCION["conversar"]:
+            elif es_de_clase(pred, "diccion.conversar"):
                 ir_a('pregunta_interlocutor')
             # Verbos de olvido
             elif pred in ["olvidar", "desaprender"]:
@@ -2133,7 +1734,7 @@ def mostrar_asistente_ls():
                 st.session_state.ls_estructura = ls
                 ir_a_intencionalidad()
             # Verbos de pérdida
-            elif pred in VERBOS_POSESION["perder"]:
+            elif es_de_clase(pred, "posesion.perder") and y != "Ø":
                 if es_dinamico:
                     ls = f"{operador + ' ' if operador else ''}do' ({x}, [NOT have' ({x}, {y})])"
                 else:
@@ -2141,7 +1742,7 @@ def mostrar_asistente_ls():
                 st.session_state.ls_estructura = ls
                 ir_a_intencionalidad()
             # Verbos de obtención
-            elif pred in VERBOS_POSESION["obtener"] and y != "Ø":
+            elif es_de_clase(pred, "posesion.obtener") and y != "Ø":
                 if es_dinamico:
                     ls = f"{operador + ' ' if operador else ''}do' ({x}, [INGR have' ({x}, {y})])"
                 else:
@@ -2155,18 +1756,18 @@ def mostrar_asistente_ls():
                     ls = f"NOT know' ({x}, {y})"
                     st.session_state.ls_estructura = ls
                     ir_a_intencionalidad()
-                # Verbos de existencia con sujeto
-                elif pred in VERBOS_EXISTENCIA and y == "Ø":
-                    ls = f"exist' ({x})"
-                    st.session_state.ls_estructura = ls
-                    ir_a_intencionalidad()
                 # Verbos de existencia sin sujeto ("haber")
                 elif pred == "haber":
                     ls = f"exist' ({y}) [MR0]"
                     st.session_state.ls_estructura = ls
                     ir_a_intencionalidad()
+                # Verbos de existencia con sujeto
+                elif es_de_clase(pred, "existencia") and y == "Ø":
+                    ls = f"exist' ({x})"
+                    st.session_state.ls_estructura = ls
+                    ir_a_intencionalidad()
                 # Posesión alienable, inalienable y de parentesco
-                elif pred in VERBOS_POSESION["tener"] and y != "Ø":
+                elif es_de_clase(pred, "posesion.tener") and y != "Ø":
                     ir_a('pregunta_posesion_parte')
                 else:
                     ir_a('generar_basico')
@@ -2184,7 +1785,7 @@ def mostrar_asistente_ls():
                     cualidad = cualidad.lower().replace(" ", ".")
                     x = st.session_state.ls_x
                     operador = MODIFICADORES_AKT.get(st.session_state.ls_akt, "")
-                    verbo_infinitivo = VERBOS_PERCEPCION_IMPERSONAL[pred]
+                    verbo_infinitivo = sentido_percepcion(pred, impersonal=True)
                     ls = f"{operador + ' ' if operador else ''}{verbo_infinitivo}.{cualidad}' ({x})"
                     st.session_state.ls_estructura = ls
                     # No hay intencionalidad para estos casos
@@ -2357,8 +1958,8 @@ def mostrar_asistente_ls():
             def _perc_si():
                 pred = st.session_state.ls_pred
                 pred_lower = pred.lower()
-                if pred_lower in VERBOS_PERCEPCION:
-                    st.session_state.ls_pred = VERBOS_PERCEPCION[pred_lower]
+                if es_de_clase(pred_lower, "percepcion"):
+                    st.session_state.ls_pred = sentido_percepcion(pred_lower)
                     st.session_state.ls_paso = 'generar_basico_final'
                 else:
                     st.session_state.ls_paso = 'seleccionar_sentido'
@@ -2533,7 +2134,7 @@ def mostrar_asistente_ls():
             pred = st.session_state.ls_pred
             
             # Buscar categoría de movimiento
-            categoria_mov = buscar_verbo(pred, VERBOS_MOVIMIENTO)
+            categoria_mov = buscar_verbo(pred, "movimiento")
             if categoria_mov:
                 pred = categoria_mov
                 st.session_state.ls_pred = pred
@@ -3000,13 +2601,7 @@ def mostrar_asistente_ls():
                 if st.form_submit_button("Siguiente", use_container_width=True):
                     if ops_seleccionados:
                         # Procesar los valores
-                        ops_valores = []
-                        for idx, codigo, valor in ops_seleccionados:
-                            if valor:
-                                valor = valor.upper()
-                                if codigo == 'STA' and valor == 'NEG':
-                                    valor = 'NEG +'
-                            ops_valores.append((codigo, valor))
+                        ops_valores = normalizar_operadores([(codigo, valor) for idx, codigo, valor in ops_seleccionados])
                 
                         st.session_state.ls_ops_valores = ops_valores
                 
@@ -0,0 +1,428 @@
+"""Analizador morfológico compilado para formas verbales del español.
+
+Las desinencias de los paradigmas regulares y las raíces irregulares se compilan
+al importar el módulo en un trie de sufijos invertidos. Cada forma se analiza con
+un solo recorrido desde su última letra hacia la primera.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# --- 1. CLASES ---
+
+@dataclass(frozen=True)
+class AnalisisVerbal:
+    lema: str
+    persona: str = ""
+    numero: str = ""
+    tiempo: str = ""
+    cliticos: Tuple[str, ...] = ()
+
+    @property
+    def persona_numero(self) -> str:
+        """Código de persona y número usado por el detector (ej.: '3s')."""
+        return f"{self.persona}{self.numero}" if self.persona and self.numero else ""
+
+# --- 2. PARADIGMAS Y TABLAS ---
+
+PERSONAS = ('1s', '2s', '3s', '1p', '2p', '3p')
+
+# Desinencias regulares por conjugación y tiempo, en el orden de PERSONAS
+DESINENCIAS = {
+    'ar': {
+        'presente': ('o', 'as', 'a', 'amos', 'áis', 'an'),
+        'pretérito': ('é', 'aste', 'ó', 'amos', 'asteis', 'aron'),
+        'imperfecto': ('aba', 'abas', 'aba', 'ábamos', 'abais', 'aban'),
+        'futuro': ('aré', 'arás', 'ará', 'aremos', 'aréis', 'arán'),
+        'condicional': ('aría', 'arías', 'aría', 'aríamos', 'aríais', 'arían'),
+        'presente de subjuntivo': ('e', 'es', 'e', 'emos', 'éis', 'en'),
+        'imperfecto de subjuntivo': ('ara', 'aras', 'ara', 'áramos', 'arais', 'aran'),
+        'imperfecto de subjuntivo (-se)': ('ase', 'ases', 'ase', 'ásemos', 'aseis', 'asen'),
+    },
+    'er': {
+        'presente': ('o', 'es', 'e', 'emos', 'éis', 'en'),
+        'pretérito': ('í', 'iste', 'ió', 'imos', 'isteis', 'ieron'),
+        'imperfecto': ('ía', 'ías', 'ía', 'íamos', 'íais', 'ían'),
+        'futuro': ('eré', 'erás', 'erá', 'eremos', 'eréis', 'erán'),
+        'condicional': ('ería', 'erías', 'ería', 'eríamos', 'eríais', 'erían'),
+        'presente de subjuntivo': ('a', 'as', 'a', 'amos', 'áis', 'an'),
+        'imperfecto de subjuntivo': ('iera', 'ieras', 'iera', 'iéramos', 'ierais', 'ieran'),
+        'imperfecto de subjuntivo (-se)': ('iese', 'ieses', 'iese', 'iésemos', 'ieseis', 'iesen'),
+    },
+    'ir': {
+        'presente': ('o', 'es', 'e', 'imos', 'ís', 'en'),
+        'pretérito': ('í', 'iste', 'ió', 'imos', 'isteis', 'ieron'),
+        'imperfecto': ('ía', 'ías', 'ía', 'íamos', 'íais', 'ían'),
+        'futuro': ('iré', 'irás', 'irá', 'iremos', 'iréis', 'irán'),
+        'condicional': ('iría', 'irías', 'iría', 'iríamos', 'iríais', 'irían'),
+        'presente de subjuntivo': ('a', 'as', 'a', 'amos', 'áis', 'an'),
+        'imperfecto de subjuntivo': ('iera', 'ieras', 'iera', 'iéramos', 'ierais', 'ieran'),
+        'imperfecto de subjuntivo (-se)': ('iese', 'ieses', 'iese', 'iésemos', 'ieseis', 'iesen'),
+    },
+}
+
+FORMAS_NO_PERSONALES = {
+    'ar': {'infinitivo': ('ar',), 'gerundio': ('ando',), 'participio': ('ado', 'ada', 'ados', 'adas')},
+    'er': {'infinitivo': ('er',), 'gerundio': ('iendo', 'yendo'), 'participio': ('ido', 'ida', 'idos', 'idas', 'ído', 'ída', 'ídos', 'ídas')},
+    'ir': {'infinitivo': ('ir', 'ír'), 'gerundio': ('iendo', 'yendo'), 'participio': ('ido', 'ida', 'idos', 'idas')},
+}
+
+# Pretérito y subjuntivo con -y- de los verbos en -eer, -aer y -uir (leyó, cayeron, construyera)
+DESINENCIAS_Y = {
+    'pretérito': (None, None, 'yó', None, None, 'yeron'),
+    'imperfecto de subjuntivo': ('yera', 'yeras', 'yera', 'yéramos', 'yerais', 'yeran'),
+}
+for _conj in ('er', 'ir'):
+    for _tiempo, _formas in DESINENCIAS_Y.items():
+        DESINENCIAS[_conj][_tiempo + ' (-y-)'] = _formas
+
+# Desinencias de las raíces irregulares
+DESINENCIAS_FUERTES = {'pretérito': ('e', 'iste', 'o', 'imos', 'isteis', 'ieron')}
+DESINENCIAS_FUERTES_J = {'pretérito': ('e', 'iste', 'o', 'imos', 'isteis', 'eron')}
+DESINENCIAS_FUTURO = {
+    'futuro': ('é', 'ás', 'á', 'emos', 'éis', 'án'),
+    'condicional': ('ía', 'ías', 'ía', 'íamos', 'íais', 'ían'),
+}
+DESINENCIAS_G = {
+    'presente': ('o', None, None, None, None, None),
+    'presente de subjuntivo': ('a', 'as', 'a', 'amos', 'áis', 'an'),
+}
+
+# Raíz irregular -> (lema, desinencias que admite)
+RAICES_IRREGULARES = {
+    # Pretéritos fuertes
+    "estuv": ("estar", DESINENCIAS_FUERTES), "tuv": ("tener", DESINENCIAS_FUERTES),
+    "anduv": ("andar", DESINENCIAS_FUERTES), "pud": ("poder", DESINENCIAS_FUERTES),
+    "pus": ("poner", DESINENCIAS_FUERTES), "sup": ("saber", DESINENCIAS_FUERTES),
+    "hic": ("hacer", DESINENCIAS_FUERTES), "hiz": ("hacer", {'pretérito': (None, None, 'o', None, None, None)}),
+    "satisfic": ("satisfacer", DESINENCIAS_FUERTES), "satisfiz": ("satisfacer", {'pretérito': (None, None, 'o', None, None, None)}),
+    "quis": ("querer", DESINENCIAS_FUERTES), "vin": ("venir", DESINENCIAS_FUERTES),
+    "cup": ("caber", DESINENCIAS_FUERTES), "hub": ("haber", DESINENCIAS_FUERTES),
+    "dij": ("decir", DESINENCIAS_FUERTES_J), "traj": ("traer", DESINENCIAS_FUERTES_J),
+    "duj": ("ducir", DESINENCIAS_FUERTES_J),
+    # Futuros y condicionales irregulares
+    "tendr": ("tener", DESINENCIAS_FUTURO), "pondr": ("poner", DESINENCIAS_FUTURO),
+    "vendr": ("venir", DESINENCIAS_FUTURO), "saldr": ("salir", DESINENCIAS_FUTURO),
+    "valdr": ("valer", DESINENCIAS_FUTURO), "podr": ("poder", DESINENCIAS_FUTURO),
+    "sabr": ("saber", DESINENCIAS_FUTURO), "cabr": ("caber", DESINENCIAS_FUTURO),
+    "habr": ("haber", DESINENCIAS_FUTURO), "querr": ("querer", DESINENCIAS_FUTURO),
+    "har": ("hacer", DESINENCIAS_FUTURO), "dir": ("decir", DESINENCIAS_FUTURO),
+    # Presentes con -g- (1s y subjuntivo)
+    "teng": ("tener", DESINENCIAS_G), "pong": ("poner", DESINENCIAS_G),
+    "veng": ("venir", DESINENCIAS_G), "salg": ("salir", DESINENCIAS_G),
+    "valg": ("valer", DESINENCIAS_G), "hag": ("hacer", DESINENCIAS_G),
+    "dig": ("decir", DESINENCIAS_G), "traig": ("traer", DESINENCIAS_G),
+    "caig": ("caer", DESINENCIAS_G), "oig": ("oír", DESINENCIAS_G),
+    # Presente de decir con cierre vocálico (dices, dice, dicen)
+    "dic": ("decir", {'presente': (None, 'es', 'e', None, None, 'en')}),
+}
+
+DESINENCIAS_PARTICIPIO = {'participio': ('o', 'a', 'os', 'as')}
+
+# Participios irregulares: raíz -> lema
+PARTICIPIOS_IRREGULARES = {
+    "abiert": "abrir", "cubiert": "cubrir", "dich": "decir", "escrit": "escribir",
+    "scrit": "scribir", "hech": "hacer", "frit": "freír", "impres": "imprimir",
+    "muert": "morir", "puest": "poner", "provist": "proveer", "rot": "romper",
+    "satisfech": "satisfacer", "suelt": "soltar", "vist": "ver", "vuelt": "volver",
+    "resuelt": "resolver",
+}
+RAICES_IRREGULARES.update({raiz: (lema, DESINENCIAS_PARTICIPIO) for raiz, lema in PARTICIPIOS_IRREGULARES.items()})
+
+# Prefijos con los que una raíz irregular forma derivados (supuso -> suponer)
+PREFIJOS = frozenset({
+    "a", "abs", "ante", "com", "con", "contra", "de", "des", "dis", "en", "entre", "ex",
+    "im", "in", "inter", "intro", "man", "ob", "pos", "pre", "pro", "re", "retro", "se",
+    "sobre", "sos", "su", "super", "sus", "tra", "tran", "trans",
+})
+
+# Raíces que solo existen con prefijo (condujo, tradujo, describió)
+RAICES_LIGADAS = frozenset({"duj", "scrit"})
+
+# Verbos con diptongación o cierre vocálico en la raíz (piensa, duerme, pide, juega)
+VERBOS_CAMBIO_VOCALICO = frozenset({
+    "acertar", "acordar", "acostar", "advertir", "almorzar", "apretar", "aprobar", "atender",
+    "atravesar", "calentar", "cerrar", "ceñir", "colgar", "comenzar", "competir", "concebir",
+    "cocer", "confesar", "conseguir", "consentir", "contar", "convertir", "corregir", "costar",
+    "defender", "demostrar", "derretir", "despedir", "despertar", "devolver", "divertir",
+    "doler", "dormir", "elegir", "embestir", "empezar", "encender", "encontrar", "entender",
+    "envolver", "expedir", "forzar", "fregar", "freír", "gemir", "helar", "herir", "hervir",
+    "impedir", "jugar", "llover", "medir", "mentir", "merendar", "morder", "morir", "mostrar",
+    "mover", "negar", "nevar", "oler", "pedir", "pensar", "perder", "perseguir", "poder",
+    "preferir", "probar", "querer", "recordar", "regar", "reír", "rendir", "renovar", "repetir",
+    "resolver", "reñir", "rogar", "seguir", "sembrar", "sentar", "sentir", "servir", "soler",
+    "soltar", "sonar", "sonreír", "soñar", "sugerir", "temblar", "tender", "tener", "teñir",
+    "torcer", "tostar", "tropezar", "venir", "vestir", "volar", "volcar", "volver",
+})
+
+# Paradigmas supletivos o muy irregulares: (lema, tiempo) -> formas en el orden de PERSONAS.
+# None deja la persona a las desinencias regulares (estamos, dices).
+_FUI = ("fui", "fuiste", "fue", "fuimos", "fuisteis", "fueron")
+PARADIGMAS_IRREGULARES: Dict[Tuple[str, str], Tuple[Optional[str], ...]] = {
+    ("ser", 'presente'): ("soy", "eres", "es", "somos", "sois", "son"),
+    ("ser", 'imperfecto'): ("era", "eras", "era", "éramos", "erais", "eran"),
+    ("ser", 'pretérito'): _FUI,
+    ("ser", 'presente de subjuntivo'): ("sea", "seas", "sea", "seamos", "seáis", "sean"),
+    ("ir", 'presente'): ("voy", "vas", "va", "vamos", "vais", "van"),
+    ("ir", 'imperfecto'): ("iba", "ibas", "iba", "íbamos", "ibais", "iban"),
+    ("ir", 'pretérito'): _FUI,
+    ("ir", 'presente de subjuntivo'): ("vaya", "vayas", "vaya", "vayamos", "vayáis", "vayan"),
+    ("estar", 'presente'): ("estoy", "estás", "está", None, None, "están"),
+    ("estar", 'presente de subjuntivo'): ("esté", "estés", "esté", None, None, "estén"),
+    ("haber", 'presente'): ("he", "has", "ha", "hemos", "habéis", "han"),
+    ("haber", 'presente de subjuntivo'): ("haya", "hayas", "haya", "hayamos", "hayáis", "hayan"),
+    ("dar", 'presente'): ("doy", None, None, None, None, None),
+    ("dar", 'pretérito'): ("di", "diste", "dio", "dimos", "disteis", "dieron"),
+    ("ver", 'pretérito'): ("vi", "viste", "vio", "vimos", "visteis", "vieron"),
+    ("ver", 'imperfecto'): ("veía", "veías", "veía", "veíamos", "veíais", "veían"),
+    ("saber", 'presente'): ("sé", None, None, None, None, None),
+    ("caber", 'presente'): ("quepo", None, None, None, None, None),
+    ("oír", 'presente'): (None, "oyes", "oye", "oímos", "oís", "oyen"),
+    ("oír", 'pretérito'): ("oí", "oíste", "oyó", "oímos", "oísteis", "oyeron"),
+    # oler diptonga con h- (huelo)
+    ("oler", 'presente'): ("huelo", "hueles", "huele", "olemos", "oléis", "huelen"),
+    ("oler", 'presente de subjuntivo'): ("huela", "huelas", "huela", "olamos", "oláis", "huelan"),
+}
+# reír y sus compuestos: r-ío, sonr-ío, fr-ío
+for _raiz in ("r", "sonr", "fr"):
+    PARADIGMAS_IRREGULARES[(_raiz + "eír", 'presente')] = tuple(
+        _raiz + d for d in ("ío", "íes", "íe", "eímos", "eís", "íen"))
+    PARADIGMAS_IRREGULARES[(_raiz + "eír", 'pretérito')] = tuple(
+        _raiz + d for d in ("eí", "eíste", "ió", "eímos", "eísteis", "ieron"))
+    PARADIGMAS_IRREGULARES[(_raiz + "eír", 'presente de subjuntivo')] = tuple(
+        _raiz + d for d in ("ía", "ías", "ía", "iamos", "iais", "ían"))
+
+# Forma supletiva o muy irregular -> [(lema, tiempo, persona_numero)]
+FORMAS_IRREGULARES: Dict[str, List[Tuple[str, str, str]]] = {}
+
+def _registrar(lema, tiempo, formas):
+    for pn, forma in zip(PERSONAS, formas):
+        if forma:
+            FORMAS_IRREGULARES.setdefault(forma, []).append((lema, tiempo, pn))
+
+for (_lema, _tiempo), _formas in PARADIGMAS_IRREGULARES.items():
+    _registrar(_lema, _tiempo, _formas)
+# El subjuntivo de ser e ir sale del pretérito (fue-ron -> fue-ra)
+_registrar("ser", 'imperfecto de subjuntivo', ("fuera", "fueras", "fuera", "fuéramos", "fuerais", "fueran"))
+_registrar("ir", 'imperfecto de subjuntivo', ("fuera", "fueras", "fuera", "fuéramos", "fuerais", "fueran"))
+_registrar("haber", 'presente', (None, None, "hay", None, None, None))
+# El futuro de ir no tiene raíz fuera del infinitivo (ir-emos)
+_registrar("ir", 'futuro', ("iré", "irás", "irá", "iremos", "iréis", "irán"))
+_registrar("ir", 'condicional', ("iría", "irías", "iría", "iríamos", "iríais", "irían"))
+# Ortografía de 2010: los monosílabos rio y frio van sin tilde
+_registrar("reír", 'pretérito', (None, None, "rio", None, None, None))
+_registrar("freír", 'pretérito', (None, None, "frio", None, None, None))
+# Gerundios que las desinencias no devuelven a su lema
+for _forma, _lema in (("diciendo", "decir"), ("yendo", "ir"), ("oyendo", "oír")):
+    FORMAS_IRREGULARES.setdefault(_forma, []).append((_lema, 'gerundio', ''))
+
+# Verbos en -eer: sin ellos, leo y creo se leerían como de -ear (lear)
+VERBOS_EER = frozenset({"leer", "creer", "poseer", "proveer", "releer", "descreer"})
+
+# Lemas que el propio analizador conoce; desempatan cuando no hay otra pista
+LEMAS_CONOCIDOS = frozenset(
+    {lema for raiz, (lema, _) in RAICES_IRREGULARES.items() if raiz not in RAICES_LIGADAS}
+    | {lema for analisis in FORMAS_IRREGULARES.values() for lema, _, _ in analisis}
+    | VERBOS_CAMBIO_VOCALICO | VERBOS_EER
+)
+
+CLITICOS = frozenset({"me", "te", "se", "nos", "os", "le", "les", "lo", "los", "la", "las"})
+_CLITICOS_POR_LARGO = tuple(sorted(CLITICOS, key=len, reverse=True))
+_SIN_TILDE = str.maketrans("áéíóú", "aeiou")
+
+# --- 3. COMPILACIÓN DEL TRIE ---
+
+_FIN = ''
+
+def _insertar(trie: dict, cadena: str, entrada: tuple):
+    nodo = trie
+    for letra in reversed(cadena):
+        nodo = nodo.setdefault(letra, {})
+    nodo.setdefault(_FIN, []).append(entrada)
+
+def _compilar() -> dict:
+    """Construye el trie de sufijos invertidos. Cada nodo final guarda entradas
+    ('reg', conjugación, tiempo, pn), ('irr', lema, tiempo, pn, raíz) o ('sup', lema, tiempo, pn)."""
+    trie: dict = {}
+    for conj, tiempos in DESINENCIAS.items():
+        for tiempo, formas in tiempos.items():
+            for pn, desinencia in zip(PERSONAS, formas):
+                if desinencia is not None:
+                    _insertar(trie, desinencia, ('reg', conj, tiempo.split(' (')[0], pn))
+        for tiempo, formas in FORMAS_NO_PERSONALES[conj].items():
+            for desinencia in formas:
+                _insertar(trie, desinencia, ('reg', conj, tiempo, ''))
+    for raiz, (lema, tiempos) in RAICES_IRREGULARES.items():
+        for tiempo, formas in tiempos.items():
+            for pn, desinencia in zip(PERSONAS, formas):
+                if desinencia is not None:
+                    _insertar(trie, raiz + desinencia, ('irr', lema, tiempo, pn if tiempo != 'participio' else '', raiz))
+    for forma, analisis in FORMAS_IRREGULARES.items():
+        for lema, tiempo, pn in analisis:
+            _insertar(trie, forma, ('sup', lema, tiempo, pn))
+    return trie
+
+_TRIE = _compilar()
+
+# Prioridad de los tiempos cuando una desinencia es ambigua
+_PRIORIDAD_TIEMPO = {
+    'infinitivo': 0, 'gerundio': 0, 'participio': 0, 'presente': 1, 'pretérito': 2,
+    'imperfecto': 3, 'futuro': 3, 'condicional': 3, 'imperfecto de subjuntivo': 4,
+    'presente de subjuntivo': 5,
+}
+_PRIORIDAD_PN = {'3s': 0, '3p': 1, '1s': 2, '2s': 3, '1p': 4, '2p': 5, '': 0}
+_PRIORIDAD_CONJ = {'ar': 0, 'er': 1, 'ir': 2}
+
+# --- 4. ANÁLISIS ---
+
+@lru_cache(maxsize=4096)
+def cambia_vocal(lema: str) -> bool:
+    """Indica si el lema, o su base sin prefijo, diptonga o cierra la vocal de la raíz."""
+    if lema in VERBOS_CAMBIO_VOCALICO:
+        return True
+    return any(lema.startswith(p) and lema[len(p):] in VERBOS_CAMBIO_VOCALICO for p in PREFIJOS)
+
+def _variantes_raiz(raiz: str, desinencia: str, conj: str) -> List[Tuple[str, int]]:
+    """Deshace los cambios ortográficos (busqu-é -> busc-) y vocálicos (duerm-e -> dorm-)
+    de la raíz. Devuelve (raíz, penalización)."""
+    inicial = desinencia[:1].translate(_SIN_TILDE)
+    penalizacion = 0
+    raiz = raiz.translate(_SIN_TILDE)  # la tilde de la raíz no llega al infinitivo (continú-a, enví-an)
+    # Cambios ortográficos obligatorios: la raíz sin deshacer no existe
+    if conj == 'ar' and inicial == 'e':
+        if raiz.endswith('qu'): raiz = raiz[:-2] + 'c'
+        elif raiz.endswith('gu'): raiz = raiz[:-2] + 'g'
+        elif raiz.endswith('gü'): raiz = raiz[:-1] + 'u'
+        elif raiz.endswith('c'): raiz = raiz[:-1] + 'z'
+    elif conj != 'ar' and inicial in ('o', 'a'):
+        if raiz.endswith('zc'): raiz = raiz[:-2] + 'c'
+        elif raiz.endswith('z'): raiz = raiz[:-1] + 'c'
+        elif raiz.endswith('j'): raiz = raiz[:-1] + 'g'
+    if raiz.endswith('uy'):
+        if conj == 'ir': raiz = raiz[:-1]
+        else: penalizacion = 50
+    elif raiz.endswith('zc') or (conj == 'er' and raiz.endswith(('u', 'uc'))) or (conj != 'ar' and raiz.endswith('qu')):
+        penalizacion = 50  # no hay verbos en -uer ni en -ucer (conduce -> conducir)
+    elif conj == 'ir' and raiz.endswith('gu') and inicial == 'e':
+        penalizacion = 15
+    elif raiz.endswith('ü') and (conj == 'er' or inicial != 'i'):
+        penalizacion = 50  # la diéresis va ante e en -ar (averigüe) y ante i en -ir (argüimos)
+    variantes = [(raiz, penalizacion)]
+    for diptongo, vocal in (('ie', 'e'), ('ue', 'o'), ('ue', 'u'), ('i', 'e'), ('u', 'o')):
+        pos = raiz.rfind(diptongo)
+        if pos > 0:
+            variante = raiz[:pos] + vocal + raiz[pos + len(diptongo):]
+            if cambia_vocal(variante + conj):
+                variantes.insert(0, (variante, penalizacion))
+    return variantes
+
+@lru_cache(maxsize=8192)
+def _candidatos(forma: str) -> Tuple[Tuple[int, str, str, str], ...]:
+    """Recorre la forma una vez desde el final y devuelve (prioridad, lema, tiempo, pn)."""
+    candidatos = []
+    nodo = _TRIE
+    for i in range(len(forma), -1, -1):
+        for entrada in nodo.get(_FIN, ()):
+            resto = forma[:i]
+            desinencia = forma[i:]
+            if entrada[0] == 'sup':
+                if not resto:
+                    candidatos.append((-200, entrada[1], entrada[2], entrada[3]))
+            elif entrada[0] == 'irr':
+                if resto in PREFIJOS or (not resto and entrada[4] not in RAICES_LIGADAS):
+                    candidatos.append((-100 if not resto else -99, resto + entrada[1], entrada[2], entrada[3]))
+            elif resto:
+                _, conj, tiempo, pn = entrada
+                sufijo_lema = 'ír' if desinencia == 'ír' else conj
+                base = 20 - 10 * len(desinencia) + 2 * _PRIORIDAD_TIEMPO.get(tiempo, 9) + _PRIORIDAD_CONJ[conj]
+                for variante, penalizacion in _variantes_raiz(resto, desinencia, conj):
+                    candidatos.append((base + penalizacion, variante + sufijo_lema, tiempo, pn))
+        if i == 0:
+            break
+        nodo = nodo.get(forma[i - 1])
+        if nodo is None:
+            break
+    return tuple(candidatos)
+
+def es_infinitivo(palabra: str) -> bool:
+    """Una sola palabra terminada en -ar, -er, -ir o -ír (sin juzgar si el verbo existe)."""
+    return len(palabra) > 2 and palabra.isalpha() and palabra.endswith(('ar', 'er', 'ir', 'ír'))
+
+def separar_encliticos(forma: str) -> Tuple[str, Tuple[str, ...]]:
+    """Separa los clíticos pospuestos de infinitivos y gerundios (dándoselo -> dando, (se, lo))."""
+    resto, cliticos = forma, []
+    for _ in range(3):
+        for clitico in _CLITICOS_POR_LARGO:
+            if resto.endswith(clitico) and len(resto) >= len(clitico) + 2:
+                resto = resto[:-len(clitico)]
+                cliticos.insert(0, clitico)
+                break
+        else:
+            break
+    if not cliticos:
+        return forma, ()
+    for candidata in (resto, resto.translate(_SIN_TILDE)):
+        if candidata.endswith(('ar', 'er', 'ir', 'ír', 'ando', 'iendo', 'yendo')):
+            return candidata, tuple(cliticos)
+    return forma, ()
+
+def analizar_forma(forma: str, lema_sugerido: str = "", persona_sugerida: str = "",
+                   lexico: Iterable[str] = (), procliticos: Iterable[str] = ()) -> Optional[AnalisisVerbal]:
+    """Analiza una forma verbal y devuelve lema, persona, número, tiempo y clíticos.
+    El lema sugerido (p. ej., el de spaCy), la persona sugerida y el léxico sirven para
+    elegir entre análisis igualmente posibles; si ningún análisis da el lema sugerido y
+    el elegido no es un lema conocido, se conserva el sugerido (derritió -> derretir)."""
+    forma = forma.lower().strip()
+    lexico = lexico if isinstance(lexico, (set, frozenset, dict)) else set(lexico)
+    base, encliticos = separar_encliticos(forma)
+    opciones = [(base, encliticos), (forma, ())] if encliticos else [(forma, ())]
+
+    mejor, mejor_puntaje = None, None
+    for orden, (texto, cliticos) in enumerate(opciones):
+        for prioridad, lema, tiempo, pn in _candidatos(texto):
+            puntaje = (
+                0 if lema_sugerido and lema == lema_sugerido else 1,
+                0 if lema in lexico else 1,
+                0 if lema in LEMAS_CONOCIDOS else 1,
+                0 if persona_sugerida and pn == persona_sugerida else 1,
+                orden,
+                prioridad,
+                _PRIORIDAD_PN[pn],
+            )
+            if mejor_puntaje is None or puntaje < mejor_puntaje:
+                mejor, mejor_puntaje = (lema, tiempo, pn, cliticos), puntaje
+    if mejor is None:
+        return None
+    lema, tiempo, pn, cliticos = mejor
+    # Un lema sugerido que es un infinitivo vale más que un lema inventado por las desinencias
+    if (lema_sugerido and lema != lema_sugerido and lema not in lexico and lema not in LEMAS_CONOCIDOS
+            and es_infinitivo(lema_sugerido)):
+        lema = lema_sugerido
+    return AnalisisVerbal(
+        lema=lema,
+        persona=pn[:1],
+        numero=pn[1:],
+        tiempo=tiempo,
+        cliticos=tuple(procliticos) + cliticos,
+    )
+
+@lru_cache(maxsize=8192)
+def normalizar_lema(forma: str, lexico: FrozenSet[str] = frozenset()) -> str:
+    """Lema canónico de una forma conjugada, un participio o un infinitivo con clíticos
+    (conservadas -> conservar, visto -> ver, sentirse -> sentir). Lo que no se reconoce
+    como verbo, o los predicados compuestos (hacer.daño), se devuelven sin cambios."""
+    forma = forma.lower().strip()
+    if not forma or "." in forma or " " in forma:
+        return forma
+    analisis = analizar_forma(forma, lexico=lexico)
+    return analisis.lema if analisis else forma
+
+def procliticos_contiguos(tokens: List[str], idx: int) -> Tuple[str, ...]:
+    """Devuelve los clíticos inmediatamente anteriores al verbo, sin saltar otras palabras."""
+    cliticos = []
+    i = idx - 1
+    while i >= 0 and tokens[i].lower() in CLITICOS:
+        cliticos.insert(0, tokens[i].lower())
+        i -= 1
+    return tuple(cliticos)
@@ -0,0 +1,45 @@
+"""Lógica de Vendler sin Streamlit, para scripts y procesos por lotes.
+
+    from nucleo import convertir_ls_a_latex
+    from nucleo.aktionsart_en import generate_english_forms
+
+Ningún módulo del paquete importa Streamlit. spaCy, deep_translator y matplotlib
+se importan la primera vez que se usan. Los submódulos también se cargan al
+primer uso: `import nucleo` no importa nada más, y `nucleo.añadir_operadores_a_ls`
+importa solo nucleo.ls. Los módulos ls, aktionsart_es y aktionsart_en de la raíz
+son la interfaz de Streamlit sobre este paquete.
+"""
+
+import importlib
+
+_SUBMODULOS = ("aktionsart_en", "aktionsart_es", "ls")
+
+# Nombre público -> submódulo que lo define
+_NOMBRES = {
+    **dict.fromkeys((
+        "convertir_ls_a_latex", "añadir_operadores_a_ls", "traducir_ls_a_ingles", "generar_imagen_ls",
+        "limpiar_html_ls", "extraer_predicados_de_ls", "reemplazar_predicado_en_ls", "normalizar_operadores",
+        "resolver_ls", "RespuestasLS", "ResolucionLS", "sugerir_predicados", "completar_predicado",
+    ), "ls"),
+    **dict.fromkeys((
+        "analizar_automaticamente", "calcular_aktionsart", "oraciones_prueba", "DatosClause", "RasgosPred",
+    ), "aktionsart_es"),
+    **dict.fromkeys((
+        "analyze_automatically", "compute_aktionsart", "generate_english_forms", "test_sentences",
+        "ClauseData", "Features",
+    ), "aktionsart_en"),
+}
+
+__all__ = [*_SUBMODULOS, *_NOMBRES]
+
+def __getattr__(nombre: str):
+    if nombre in _SUBMODULOS:
+        return importlib.import_module(f"{__name__}.{nombre}")
+    if nombre in _NOMBRES:
+        valor = getattr(importlib.import_module(f"{__name__}.{_NOMBRES[nombre]}"), nombre)
+        globals()[nombre] = valor  # las consultas siguientes no pasan por aquí
+        return valor
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,257 @@
+"""Aktionsart detector (English): Streamlit-free core.
+
+Classes, automatic clause analysis, aktionsart computation and diagnostic test
+sentences. spaCy is imported when the model is first loaded.
+"""
+
+import threading
+from dataclasses import dataclass, astuple
+from enum import Enum
+from functools import lru_cache
+from typing import Optional
+from datos_lexicos import LexicoRecargable, ruta_datos
+from expresiones import elegir_expresion, leer_expresiones
+from perfiles_spacy import cargar_modelo_acotado
+from cliente_modelos import aplicar_respuesta, analizar_en_servidor, servidor_configurado
+from servicio_analisis import ServicioAnalisis
+from inflection_en import inflect
+from quick_parse_en import CONFIDENCE_THRESHOLD, quick_analyze, reverse_index
+
+# --- 1. CLASSES AND ENUMS ---
+
+class Aktionsart(Enum):
+    STATE = "state"
+    CAUSATIVE_STATE = "causative state"
+    ACHIEVEMENT = "achievement"
+    CAUSATIVE_ACHIEVEMENT = "causative achievement"
+    SEMELFACTIVE = "semelfactive"
+    CAUSATIVE_SEMELFACTIVE = "causative semelfactive"
+    ACTIVE_ACCOMPLISHMENT = "active accomplishment"
+    CAUSATIVE_ACTIVE_ACCOMPLISHMENT = "causative active accomplishment"
+    ACCOMPLISHMENT = "accomplishment"
+    CAUSATIVE_ACCOMPLISHMENT = "causative accomplishment"
+    ACTIVITY = "activity"
+    CAUSATIVE_ACTIVITY = "causative activity"
+    PROCESS = "process"
+    CAUSATIVE_PROCESS = "causative process"
+
+@dataclass
+class Features:
+    causative: Optional[bool] = None
+    stative: Optional[bool] = None
+    punctual: Optional[bool] = None
+    telic: Optional[bool] = None
+    dynamic: Optional[bool] = None
+
+@dataclass
+class ClauseData:
+    gerund: str = ""
+    participle: str = ""
+    infinitive: str = ""
+    subject: str = ""
+    postverbal: str = ""
+    person_number: str = "3s"
+
+# --- 2. DICTIONARIES AND AUXILIARIES ---
+
+BE_PRESENT = {
+    '1s': "am", '2s': "are", '3s': "is",
+    '1p': "are", '2p': "are", '3p': "are"
+}
+
+BE_PAST = {
+    '1s': "was", '2s': "were", '3s': "was",
+    '1p': "were", '2p': "were", '3p': "were"
+}
+
+HAVE_PRESENT = {
+    '1s': "have", '2s': "have", '3s': "has",
+    '1p': "have", '2p': "have", '3p': "have"
+}
+
+PERSONS_DICT = {
+    "1s": "1st person singular (I)",
+    "2s": "2nd person singular (You)",
+    "3s": "3rd person singular (He/She/It)",
+    "1p": "1st person plural (We)",
+    "2p": "2nd person plural (You)",
+    "3p": "3rd person plural (They)"
+}
+
+@lru_cache(maxsize=None)
+def _cargar_nlp():
+    model = cargar_modelo_acotado("en_core_web_sm")
+    return ServicioAnalisis(model) if model else None
+
+_candado_nlp = threading.Lock()
+
+def load_nlp():
+    """Shared model of the process (or None if not installed); loaded only once."""
+    with _candado_nlp:
+        return _cargar_nlp()
+
+# The model is loaded by the warm-up (calentamiento.py) or by the first analysis that needs it.
+# With a model server, this process only loads its own copy if the server does not answer.
+
+# Multiword predicates (give up, take place...), compiled from data/en_expressions.txt
+EXPRESSIONS = LexicoRecargable(ruta_datos("en_expressions.txt"), leer_expresiones)
+
+def find_expression(doc, verb_token):
+    """Looks for a multiword predicate containing the verb in the already parsed clause."""
+    words = [t.text for t in doc]
+    lemmas = [{t.lemma_.lower(), t.lower_} for t in doc]
+    found = EXPRESSIONS.actual().buscar(words, lemmas)
+    return elegir_expresion(found, verb_token.i if verb_token is not None else None)
+
+def generate_english_forms(lemma: str):
+    """Returns the gerund and past participle from the precomputed inflection table."""
+    forms = inflect(lemma)
+    return forms.gerund, forms.participle
+
+def detect_person_number(doc, verb_token, idx):
+    """Deduces Person/Number based on the Subject found by spaCy."""
+    subj_token = None
+    for token in doc:
+        if token.head == verb_token and "subj" in token.dep_:
+            subj_token = token
+            break
+    
+    if not subj_token:
+        return "3s"
+    
+    text = subj_token.text.lower()
+    
+    if text == "i": return "1s"
+    if text == "you": return "2s"
+    if text == "we": return "1p"
+    if text == "they": return "3p"
+    if text in ["he", "she", "it"]: return "3s"
+    
+    morph = subj_token.morph.to_dict()
+    number = morph.get("Number", "Sing")
+    
+    if number == "Plur":
+        return "3p"
+    else:
+        return "3s"
+
+def fill_data(data, lemma, expression, subject, postverbal, person_number):
+    """Fills the clause data from the verb lemma; returns False if no forms can be built."""
+    ger, pp = generate_english_forms(lemma)
+    if not ger or not pp: return False
+    rest = f" {expression.resto}" if expression else ""
+    data.infinitive = lemma + rest
+    data.gerund = ger + rest
+    data.participle = pp + rest
+    data.person_number = person_number
+    data.subject = subject
+    data.postverbal = postverbal
+    return True
+
+def analyze_with_rules(clause, quick, data):
+    """Fills the clause data from the rule-based fast path, without spaCy."""
+    words = list(quick.words)
+    index = reverse_index()
+    lemmas = [{w.lower(), index[w.lower()][0]} if w.lower() in index else {w.lower()} for w in words]
+    expression = elegir_expresion(EXPRESSIONS.actual().buscar(words, lemmas), quick.index)
+    idx = expression.inicio if expression else quick.index
+    end = expression.fin if expression else idx + 1
+    lemma = expression.lema if expression else quick.lemma
+    start, stop = quick.spans[idx][0], quick.spans[end - 1][1]
+    if not fill_data(data, lemma, expression, clause[:start].strip(), clause[stop:].strip(), quick.person_number):
+        return False, "", ""
+    return True, clause[start:stop], data.infinitive
+
+def analyze_automatically(clause, data):
+    """Analyzes the clause: rule-based for simple clauses, otherwise on the model server when one is configured."""
+    if servidor_configurado():
+        quick = quick_analyze(clause)
+        if quick and quick.confidence >= CONFIDENCE_THRESHOLD:
+            return analyze_with_rules(clause, quick, data)
+        response = analizar_en_servidor("en", clause)
+        if response is not None:
+            return aplicar_respuesta(response, data)
+    return analyze_locally(clause, data)
+
+def analyze_locally(clause, data):
+    """Analyzes the clause structure and morphology: rule-based for simple clauses, spaCy when the rules are unsure."""
+    quick = quick_analyze(clause)
+    model = None if quick and quick.confidence >= CONFIDENCE_THRESHOLD else load_nlp()
+    if quick and not model:
+        return analyze_with_rules(clause, quick, data)
+    if not model: return False, "", ""
+    
+    doc = model(clause)
+    verb_token = None
+    
+    for token in doc:
+        if token.dep_ == "ROOT" and token.pos_ in ["VERB", "AUX"]:
+            verb_token = token
+            break
+    
+    if not verb_token:
+        for token in doc:
+            if token.pos_ in ["VERB", "AUX"]:
+                verb_token = token
+                break
+    
+    if not verb_token and len(doc) <= 2:
+        for token in doc:
+            if token.pos_ not in ["DET", "PRON"]:
+                verb_token = token
+                break
+    
+    # A multiword predicate fixes the verb even if the parser picked one of its other words
+    expression = find_expression(doc, verb_token)
+    if expression:
+        verb_token = doc[expression.inicio]
+    
+    if not verb_token: return False, "", ""
+    
+    lemma = expression.lema if expression else verb_token.lemma_.lower()
+    idx = verb_token.i
+    end = expression.fin if expression else idx + 1
+    person_number = detect_person_number(doc, verb_token, idx)
+    if not fill_data(data, lemma, expression, doc[:idx].text.strip(), doc[end:].text.strip(), person_number):
+        return False, "", ""
+    
+    return True, doc[idx:end].text, data.infinitive
+
+def build_prog(past: bool, data: ClauseData) -> str:
+    be = BE_PAST[data.person_number] if past else BE_PRESENT[data.person_number]
+    parts = [data.subject, f"{be} {data.gerund}", data.postverbal]
+    return " ".join(p for p in parts if p)
+
+def build_perfect(data: ClauseData) -> str:
+    have = HAVE_PRESENT[data.person_number]
+    parts = [data.subject, f"{have} {data.participle}", data.postverbal]
+    return " ".join(p for p in parts if p)
+
+def build_stop(data: ClauseData) -> str:
+    parts = [data.subject or "(subject)", f"stopped {data.gerund}", data.postverbal]
+    return " ".join(p for p in parts if p)
+
+@lru_cache(maxsize=4096)
+def _test_sentences_cache(key: tuple) -> dict:
+    data = ClauseData(*key)
+    return {
+        'prog_past': build_prog(True, data),
+        'prog': build_prog(False, data),
+        'perfect': build_perfect(data),
+        'stop': build_stop(data),
+    }
+
+def test_sentences(data: ClauseData) -> dict:
+    """Builds all the diagnostic test sentences at once (cached across sessions)."""
+    return dict(_test_sentences_cache(astuple(data)))
+
+def compute_aktionsart(f: Features) -> str:
+    """Returns the aktionsart label that corresponds to the detected features."""
+    if f.stative: sub = "state"
+    elif f.punctual and f.telic: sub = "achievement"
+    elif f.punctual and not f.telic: sub = "semelfactive"
+    elif not f.punctual and f.telic and f.dynamic: sub = "active accomplishment"
+    elif not f.punctual and not f.telic and f.dynamic: sub = "activity"
+    elif not f.punctual and f.telic and not f.dynamic: sub = "accomplishment"
+    else: sub = "process"
+    return f"causative {sub}" if f.causative else sub
@@ -0,0 +1,206 @@
+"""Detector de aktionsart (español): núcleo sin Streamlit.
+
+Clases, análisis automático de la cláusula, cálculo del aktionsart y perífrasis de
+las pruebas diagnósticas. spaCy se importa al cargar el modelo por primera vez.
+"""
+
+import threading
+from dataclasses import dataclass, astuple
+from enum import Enum
+from functools import lru_cache
+from typing import Optional
+from morfologia_es import analizar_forma, procliticos_contiguos
+from conjugacion_es import auxiliar, con_encliticos, formas_no_finitas, lemas_irregulares
+from analisis_rapido_es import UMBRAL_CONFIANZA, analizar_rapido, lemas_por_palabra
+from datos_lexicos import LexicoRecargable, ruta_datos
+from expresiones import elegir_expresion, leer_expresiones
+from perfiles_spacy import cargar_modelo_acotado
+from cliente_modelos import aplicar_respuesta, analizar_en_servidor, servidor_configurado
+from servicio_analisis import ServicioAnalisis
+
+# --- 1. CLASES Y ENUMS ---
+
+class Aktionsart(Enum):
+    ESTADO = "estado"
+    ESTADO_CAUSATIVO = "estado causativo"
+    LOGRO = "logro"
+    LOGRO_CAUSATIVO = "logro causativo"
+    SEMELFACTIVO = "semelfactivo"
+    SEMELFACTIVO_CAUSATIVO = "semelfactivo causativo"
+    REALIZACION_ACTIVA = "realización activa"
+    REALIZACION_ACTIVA_CAUSATIVA = "realización activa causativa"
+    REALIZACION = "realización"
+    REALIZACION_CAUSATIVA = "realización causativa"
+    ACTIVIDAD = "actividad"
+    ACTIVIDAD_CAUSATIVA = "actividad causativa"
+    PROCESO = "proceso"
+    PROCESO_CAUSATIVO = "proceso causativo"
+
+@dataclass
+class RasgosPred:
+    causativo: Optional[bool] = None
+    estativo: Optional[bool] = None
+    puntual: Optional[bool] = None
+    telico: Optional[bool] = None
+    dinamico: Optional[bool] = None
+
+@dataclass
+class DatosClause:
+    gerundio: str = ""
+    participio: str = ""
+    infinitivo: str = ""
+    sujeto: str = ""
+    complementos: str = ""
+    persona_numero: str = "3s"
+
+# --- 2. DICCIONARIOS Y AUXILIARES ---
+
+PERSONAS_DICT = {
+    "1s": "Primera persona singular",
+    "2s": "Segunda persona singular",
+    "3s": "Tercera persona singular",
+    "1p": "Primera persona plural",
+    "2p": "Segunda persona plural",
+    "3p": "Tercera persona plural"
+}
+
+@lru_cache(maxsize=None)
+def _cargar_nlp():
+    modelo = cargar_modelo_acotado("es_core_news_sm")
+    return ServicioAnalisis(modelo) if modelo else None
+
+_candado_nlp = threading.Lock()
+
+def load_nlp():
+    """Modelo compartido del proceso (o None si no está instalado); se carga una sola vez."""
+    with _candado_nlp:
+        return _cargar_nlp()
+
+# El modelo se carga en el calentamiento (calentamiento.py) o con el primer análisis que lo necesite.
+# Con un servidor de modelos, este proceso solo carga su copia si el servidor no responde.
+
+# Predicados multipalabra (darse cuenta, hacer caso...), compilados desde data/expresiones_es.txt
+EXPRESIONES = LexicoRecargable(ruta_datos("expresiones_es.txt"), leer_expresiones)
+
+def buscar_expresion(doc, token_verbo):
+    """Busca en la cláusula ya analizada un predicado multipalabra que contenga el verbo."""
+    palabras = [t.text for t in doc]
+    lemas = []
+    for t in doc:
+        analisis = analizar_forma(t.text, lema_sugerido=t.lemma_.lower())
+        lemas.append({t.lemma_.lower(), analisis.lema} if analisis else {t.lemma_.lower()})
+    encontradas = EXPRESIONES.actual().buscar(palabras, lemas)
+    return elegir_expresion(encontradas, token_verbo.i if token_verbo is not None else None)
+
+def _rellenar_datos(datos, analisis, lema_respaldo, expresion, sujeto, complementos, persona_respaldo=""):
+    """Completa los datos de la cláusula a partir del análisis del verbo y devuelve el lema mostrado."""
+    resto = f" {expresion.resto}" if expresion else ""
+    lema_limpio = analisis.lema if analisis else lema_respaldo
+    cliticos = analisis.cliticos if analisis else ()
+    
+    datos.infinitivo = con_encliticos(lema_limpio, cliticos) + resto
+    formas = formas_no_finitas(lema_limpio)
+    datos.gerundio, datos.participio = (formas.gerundio + resto, formas.participio + resto) if formas else ("", "")
+    datos.persona_numero = (analisis.persona_numero if analisis else "") or persona_respaldo or "3s"
+        
+    datos.sujeto = sujeto
+    datos.complementos = complementos
+    return lema_limpio + resto
+
+def _analizar_con_reglas(oracion, rapido, datos):
+    """Completa los datos con el analizador rápido, sin spaCy."""
+    palabras = list(rapido.palabras)
+    encontradas = EXPRESIONES.actual().buscar(palabras, lemas_por_palabra(palabras, lemas_irregulares()))
+    expresion = elegir_expresion(encontradas, rapido.indice)
+    idx, analisis = rapido.indice, rapido.analisis
+    if expresion and expresion.inicio != idx:
+        idx = expresion.inicio
+        analisis = analizar_forma(palabras[idx], lema_sugerido=expresion.lema, lexico=lemas_irregulares(),
+                                  procliticos=procliticos_contiguos(palabras, idx))
+    fin = expresion.fin if expresion else idx + 1
+    inicio_verbo, fin_verbo = rapido.posiciones[idx][0], rapido.posiciones[fin - 1][1]
+    lema = _rellenar_datos(datos, analisis, palabras[idx].lower(), expresion,
+                           oracion[:inicio_verbo].strip(), oracion[fin_verbo:].strip())
+    return True, oracion[inicio_verbo:fin_verbo], lema
+
+def analizar_automaticamente(oracion, datos):
+    # Las cláusulas simples se resuelven por reglas; las demás, en el servidor de modelos si lo hay
+    if servidor_configurado():
+        rapido = analizar_rapido(oracion)
+        if rapido and rapido.confianza >= UMBRAL_CONFIANZA:
+            return _analizar_con_reglas(oracion, rapido, datos)
+        respuesta = analizar_en_servidor("es", oracion)
+        if respuesta is not None:
+            return aplicar_respuesta(respuesta, datos)
+    return analizar_localmente(oracion, datos)
+
+def analizar_localmente(oracion, datos):
+    # Las cláusulas simples se resuelven por reglas; spaCy solo cuando el analizador rápido duda
+    rapido = analizar_rapido(oracion)
+    modelo = None if rapido and rapido.confianza >= UMBRAL_CONFIANZA else load_nlp()
+    if rapido and not modelo:
+        return _analizar_con_reglas(oracion, rapido, datos)
+    if not modelo: return False, "", ""
+    doc = modelo(oracion)
+    verbo_token = next((t for t in doc if t.dep_ == "ROOT" and t.pos_ in ["VERB", "AUX"]), None)
+    if not verbo_token:
+        verbo_token = next((t for t in doc if t.pos_ in ["VERB", "AUX"]), None)
+    # Un predicado multipalabra fija el verbo aunque el parser haya tomado otra de sus palabras
+    expresion = buscar_expresion(doc, verbo_token)
+    if expresion:
+        verbo_token = doc[expresion.inicio]
+    if not verbo_token: return False, "", ""
+    
+    idx = verbo_token.i
+    fin = expresion.fin if expresion else idx + 1
+    morph = verbo_token.morph.to_dict()
+    persona_spacy = {("1", "Sing"): "1s", ("2", "Sing"): "2s", ("3", "Sing"): "3s", ("1", "Plur"): "1p", ("2", "Plur"): "2p", ("3", "Plur"): "3p"}.get((morph.get("Person"), morph.get("Number")), "")
+    analisis = analizar_forma(
+        verbo_token.text,
+        lema_sugerido=expresion.lema if expresion else verbo_token.lemma_.lower(),
+        persona_sugerida=persona_spacy,
+        lexico=lemas_irregulares(),
+        procliticos=procliticos_contiguos([t.text for t in doc], idx),
+    )
+    lema = _rellenar_datos(datos, analisis, verbo_token.lemma_.lower(), expresion,
+                           doc[:idx].text.strip(), doc[fin:].text.strip(), persona_spacy)
+    return True, doc[idx:fin].text, lema
+
+def calcular_aktionsart(rasgos: RasgosPred) -> str:
+    """Devuelve la etiqueta de aktionsart correspondiente a los rasgos detectados."""
+    if rasgos.estativo: sub = "estado"
+    elif rasgos.puntual and rasgos.telico: sub = "logro"
+    elif rasgos.puntual and not rasgos.telico: sub = "semelfactivo"
+    elif not rasgos.puntual and rasgos.telico and rasgos.dinamico: sub = "realización activa"
+    elif not rasgos.puntual and not rasgos.telico and rasgos.dinamico: sub = "actividad"
+    elif not rasgos.puntual and rasgos.telico and not rasgos.dinamico: sub = "realización"
+    else: sub = "proceso"
+    if rasgos.causativo and sub in ["realización", "realización activa", "actividad"]:
+        return f"{sub} causativa"
+    return f"{sub} causativo" if rasgos.causativo else sub
+
+# Auxiliar (lema, tiempo) de cada perífrasis diagnóstica
+PERIFRASIS = {
+    'gerundio_pret': ("estar", 'pretérito'),
+    'gerundio_pres': ("estar", 'presente'),
+    'gerundio_subj': ("estar", 'imperfecto de subjuntivo'),
+    'participio': ("haber", 'presente'),
+    'infinitivo': ("dejar", 'imperfecto de subjuntivo'),
+}
+
+def construir_perif(tipo, datos):
+    v = auxiliar(*PERIFRASIS[tipo], datos.persona_numero)
+    if tipo == 'infinitivo': return " ".join(p for p in [f"{v} de {datos.infinitivo}", datos.complementos] if p)
+    aux = f"{v} {datos.gerundio}" if 'gerundio' in tipo else f"{v} {datos.participio}"
+    return " ".join(p for p in [datos.sujeto, aux, datos.complementos] if p)
+
+TIPOS_PERIF = tuple(PERIFRASIS)
+
+@lru_cache(maxsize=4096)
+def _oraciones_prueba_cache(clave: tuple) -> dict:
+    datos = DatosClause(*clave)
+    return {tipo: construir_perif(tipo, datos) for tipo in TIPOS_PERIF}
+
+def oraciones_prueba(datos: DatosClause) -> dict:
+    """Genera de una vez todas las perífrasis de las pruebas diagnósticas (caché compartida entre sesiones)."""
+    return dict(_oraciones_prueba_cache(astuple(datos)))
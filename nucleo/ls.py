@@ -0,0 +1,1064 @@
+# -*- coding: utf-8 -*-
+"""
+Logical Structure Generator (ES version) - núcleo sin Streamlit
+Léxico, generación y traducción de estructuras lógicas y motor de reglas del
+formulario experto. deep_translator y matplotlib se importan al primer uso.
+"""
+import typing
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Optional, List, Tuple, Dict, FrozenSet, Mapping
+from autocompletado import HistorialFrecuencias, TriePrefijos
+from indice_borrados import IndiceBorrados
+from conjugacion_es import participio_de_infinitivo
+from analisis_rapido_es import verbos_conocidos
+from morfologia_es import es_infinitivo, normalizar_lema, separar_encliticos
+from datos_lexicos import LexicoRecargable, congelar, leer_json, ruta_datos
+
+# VENDLER_TRADUCIR=0 deja solo el diccionario de correcciones (sin consultas a la red)
+TRADUCIR = os.environ.get("VENDLER_TRADUCIR", "1") != "0"
+
+@lru_cache(maxsize=1)
+def _clase_traductor():
+    """GoogleTranslator, importado la primera vez que se traduce; None si deep_translator no está
+    instalado o si la traducción en línea está desactivada."""
+    if not TRADUCIR:
+        return None
+    try:
+        from deep_translator import GoogleTranslator
+    except ImportError:
+        return None
+    return GoogleTranslator
+
+def traductor_disponible() -> bool:
+    return _clase_traductor() is not None
+
+# Caché para no consultar a Google repetidamente por la misma palabra
+CACHE_TRADUCCION = {}
+
+# --- DICCIONARIO DE CORRECCIONES MANUALES (data/ls_correcciones.json) ---
+CORRECCIONES = LexicoRecargable(ruta_datos("ls_correcciones.json"), lambda ruta: congelar(leer_json(ruta)))
+
+# --- LISTA DE PROTECCIÓN: Palabras clave de RRG que NO deben traducirse ---
+RRG_KEYWORDS = {
+    "do", "cause", "become", "ingr", "proc", "seml", "fin", "exist", 
+    "be", "be-loc", "know", "have", "feel", "see", "hear", "smell", "taste", 
+    "covering.path.distance", "weather", "if", "evid", "sta", "tns", "mod", 
+    "asp", "not", "purp", "being.created", "being.consumed", "consumed",
+    "have.as.part", "have.as.kin", "have.enough.with", "express", "hit",
+    "move.away.from.reference.point", "move.up.from.reference.point", 
+    "move.down.from.reference.point", "not"
+}
+
+# --- 1. CLASES Y ESTRUCTURAS ---
+
+@dataclass
+class Operador:
+    codigo: str
+    descripcion: str
+    requiere_valor: bool
+    ejemplos: str
+
+OPERADORES = [
+    Operador('IF', 'Fuerza ilocutiva', True, "DECL, INT, IMP"),
+    Operador('EVID', 'Evidencialidad', True, "VIS, INF, HEARSAY"),
+    Operador('STA', 'Estatus', True, "REALIS, PSBL, NEG"),
+    Operador('TNS', 'Tiempo', True, "PAST, PRES, FUT"),
+    Operador('NEG.INT +', 'Negación interna', False, ""),
+    Operador('MOD', 'Modalidad deóntica', True, "OBLIG, PERMIS"),
+    Operador('EVQ', 'Cuantificación eventiva', True, "DISTR"),
+    Operador('DIR.CORE', 'Direccionalidad de centro', True, "HACIA.HABLANTE, DESDE.HABLANTE"),
+    Operador('DIR.NUC', 'Direccionalidad nuclear', True, "ARRIBA, AFUERA"),
+    Operador('ASP', 'Aspecto', True, "PFV, PERF, PROG"),
+    Operador('NEG.NUC +', 'Negación nuclear', False, "")
+]
+
+# Diccionario para obtener descripción completa de operadores
+OPERADORES_DESC = {op.codigo: op.descripcion for op in OPERADORES}
+
+AKTIONSART_OPCIONES = {
+    "estado": "estado",
+    "estado causativo": "estado causativo",
+    "logro": "logro",
+    "logro causativo": "logro causativo",
+    "realización": "realización",
+    "realización causativa": "realización causativa",
+    "semelfactivo": "semelfactivo",
+    "semelfactivo causativo": "semelfactivo causativo",
+    "proceso": "proceso",
+    "proceso causativo": "proceso causativo",
+    "actividad": "actividad",
+    "actividad causativa": "actividad causativa",
+    "realización activa": "realización activa",
+    "realización activa causativa": "realización activa causativa"
+}
+
+MODIFICADORES_AKT = {
+    "logro": "INGR",
+    "realización": "BECOME",
+    "proceso": "PROC",
+    "semelfactivo": "SEML",
+    "logro causativo": "INGR",
+    "realización causativa": "BECOME",
+    "proceso causativo": "PROC",
+    "semelfactivo causativo": "SEML"
+}
+
+# --- 2. DICCIONARIOS DE VERBOS (data/ls_verbos.json) ---
+# "familias": clases con subclases (movimiento, transferencia, diccion, tri_neg, posesion)
+# "clases": clases sin subclases (existencia, percepcion, percepcion_impersonal, meteorologico)
+
+@dataclass(frozen=True, eq=False)
+class LexicoLS:
+    familias: Mapping[str, Mapping[str, Any]]
+    clases: Mapping[str, Any]
+    indice: Mapping[str, FrozenSet[str]]
+    solapamientos: Mapping[str, FrozenSet[str]]
+    lemas: FrozenSet[str]
+
+def _indexar_verbos(familias, clases) -> Dict[str, FrozenSet[str]]:
+    """Índice invertido: verbo -> clases a las que pertenece ('transferencia.sacar', 'meteorologico')."""
+    indice: Dict[str, set] = {}
+    for familia, subclases in familias.items():
+        for subclase, verbos in subclases.items():
+            for verbo in verbos:
+                indice.setdefault(verbo, set()).add(f"{familia}.{subclase}")
+    for clase, verbos in clases.items():
+        for verbo in verbos:
+            indice.setdefault(verbo, set()).add(clase)
+    return {verbo: frozenset(clases) for verbo, clases in indice.items()}
+
+def _construir_lexico_ls(ruta: str) -> LexicoLS:
+    datos = congelar(leer_json(ruta))
+    indice = _indexar_verbos(datos["familias"], datos["clases"])
+    return LexicoLS(
+        familias=datos["familias"],
+        clases=datos["clases"],
+        indice=MappingProxyType(indice),
+        # Verbos que aparecen en más de una clase (p. ej., "arrancar": movimiento y transferencia)
+        solapamientos=MappingProxyType({verbo: c for verbo, c in indice.items() if len(c) > 1}),
+        lemas=frozenset(indice),
+    )
+
+LEXICO_LS = LexicoRecargable(ruta_datos("ls_verbos.json"), _construir_lexico_ls)
+
+def lexico_ls() -> LexicoLS:
+    """Instantánea vigente del léxico de verbos (se recarga si cambia el archivo)."""
+    return LEXICO_LS.actual()
+
+# --- 3. FUNCIONES AUXILIARES ---
+
+# Clases que el léxico guarda solo como lemas: en ellas también se buscan los participios
+# y las formas conjugadas (quedadas -> quedar, visto -> ver)
+CLASES_POR_LEMA = frozenset({"existencia", "percepcion_impersonal"})
+
+def _clave(lexico: LexicoLS, verbo: str, tabla: Mapping[str, Any], por_lema: bool = False) -> str:
+    """Forma con la que se busca el verbo en una tabla: la forma tal cual si figura en ella
+    (así "perderse" no se confunde con "perder"); si no, el infinitivo sin clíticos
+    (verse -> ver) y, con por_lema, el lema de cualquier forma verbal (quedadas -> quedar)."""
+    if verbo in tabla:
+        return verbo
+    if por_lema:
+        return normalizar_lema(verbo, lexico.lemas)
+    base, cliticos = separar_encliticos(verbo.lower())
+    return base if cliticos and base.endswith(('ar', 'er', 'ir', 'ír')) else verbo
+
+def _clases_de(lexico: LexicoLS, verbo: str, por_lema: bool = False) -> FrozenSet[str]:
+    return lexico.indice.get(_clave(lexico, verbo, lexico.indice, por_lema), frozenset())
+
+def es_de_clase(verbo: str, clase: str, normalizar: bool = True) -> bool:
+    """Si el verbo pertenece a la clase. Con normalizar=False solo vale la forma tal cual
+    (para atributos como "perdido" o "presente", que no son el verbo del que vienen)."""
+    lexico = lexico_ls()
+    if not normalizar:
+        return clase in lexico.indice.get(verbo, ())
+    return clase in _clases_de(lexico, verbo, por_lema=clase in CLASES_POR_LEMA)
+
+def buscar_verbo(verbo: str, familia: str) -> Optional[str]:
+    """Devuelve la primera subclase de la familia que contiene el verbo, en el orden del archivo."""
+    lexico = lexico_ls()
+    clases = _clases_de(lexico, verbo)
+    if not clases:
+        return None
+    return next((sub for sub in lexico.familias[familia] if f"{familia}.{sub}" in clases), None)
+
+def sustantivo_diccion(verbo: str, clase: str) -> str:
+    """Sustantivo asociado a un verbo de dicción (agradecer -> agradecimiento)."""
+    lexico = lexico_ls()
+    tabla = lexico.familias["diccion"][clase]
+    return tabla.get(_clave(lexico, verbo, tabla), verbo)
+
+def sentido_percepcion(verbo: str, impersonal: bool = False) -> str:
+    """Predicado de percepción en inglés (see, hear...) de un verbo de percepción."""
+    lexico = lexico_ls()
+    tabla = lexico.clases["percepcion_impersonal" if impersonal else "percepcion"]
+    return tabla[_clave(lexico, verbo, tabla, por_lema=impersonal)]
+
+@lru_cache(maxsize=2)
+def _vocabulario(lexico: LexicoLS, conocidos: FrozenSet[str]) -> Tuple[FrozenSet[str], IndiceBorrados]:
+    """Verbos conocidos (léxico de LS y los del analizador: verbos_es.txt, irregulares y de cambio
+    vocálico) y su índice de borrados, por instantánea."""
+    lemas = lexico.lemas | conocidos
+    return lemas, IndiceBorrados(lemas)
+
+def vocabulario() -> Tuple[FrozenSet[str], IndiceBorrados]:
+    return _vocabulario(lexico_ls(), verbos_conocidos())
+
+# Usos de cada predicado en análisis anteriores (ruta configurable con VENDLER_HISTORIAL)
+HISTORIAL_PREDICADOS = HistorialFrecuencias(
+    os.environ.get("VENDLER_HISTORIAL", ruta_datos("historial_predicados.json"))
+)
+
+# Usos a partir de los que un predicado que no está en el vocabulario se ofrece en los
+# selectores de todas las sesiones (antes puede ser una errata que alguien mantuvo)
+USOS_PARA_OFRECER = 3
+
+def _ofrecible(pred: str, usos: int, lemas: FrozenSet[str]) -> bool:
+    return pred in lemas or usos >= USOS_PARA_OFRECER
+
+@lru_cache(maxsize=2)
+def _trie_predicados(lemas: FrozenSet[str]) -> TriePrefijos:
+    """Trie de autocompletado: verbos conocidos más los predicados del historial que ya se
+    pueden ofrecer, por instantánea."""
+    frecuencias = dict.fromkeys(lemas, 0)
+    frecuencias.update((p, n) for p, n in HISTORIAL_PREDICADOS.conteos().items() if _ofrecible(p, n, lemas))
+    return TriePrefijos(frecuencias)
+
+def trie_predicados() -> TriePrefijos:
+    lemas, _ = vocabulario()
+    return _trie_predicados(lemas)
+
+def completar_predicado(prefijo: str, maximo: int = 8) -> List[str]:
+    """Predicados que empiezan por el prefijo, de los más usados a los menos usados."""
+    return trie_predicados().completar(prefijo.lower().strip(), maximo)
+
+def opciones_predicado() -> List[str]:
+    """Todos los predicados conocidos, de los más usados a los menos usados (para los selectores)."""
+    return trie_predicados().ranking()
+
+def registrar_predicado(pred: str) -> None:
+    """Suma un uso del infinitivo al historial; pasa al trie de autocompletado si está en el
+    vocabulario o ya tiene USOS_PARA_OFRECER usos."""
+    pred = pred.lower().strip()
+    if "." in pred or not pred.endswith(("ar", "er", "ir", "arse", "erse", "irse")):
+        return
+    conteos = HISTORIAL_PREDICADOS.registrar([pred])
+    lemas, _ = vocabulario()
+    if _ofrecible(pred, conteos[pred], lemas):
+        _trie_predicados(lemas).agregar(pred, conteos[pred])
+
+def sugerir_predicados(pred: str, maximo: int = 3) -> List[str]:
+    """Verbos conocidos más parecidos a un infinitivo que no se reconoce ("¿Quisiste decir...?").
+    Devuelve una lista vacía si el verbo está en el vocabulario o si no se parece a ninguno; haberlo
+    usado antes no basta (podría ser una errata que alguien mantuvo)."""
+    pred = pred.lower().strip()
+    if not pred or "." in pred:
+        return []
+    lemas, indice = vocabulario()
+    trie = _trie_predicados(lemas)
+    lema_pred = normalizar_lema(pred, lemas)
+    if pred in lemas or lema_pred in lemas:
+        return []
+    encontradas = indice.buscar(pred, 1 if len(pred) <= 6 else 2)
+    if es_infinitivo(separar_encliticos(pred)[0]):
+        # Un infinitivo bien formado puede ser un verbo que falta en el léxico: solo se sugieren
+        # los verbos a una letra (corer -> correr); el paso ofrece igual mantener lo escrito
+        encontradas = [(d, v) for d, v in encontradas if d == 1]
+    if not encontradas:
+        # Un infinitivo a medio escribir ("desapar") se completa por prefijo
+        return trie.completar(pred, maximo) if len(pred) >= 3 else []
+    # Solo las más cercanas (si hay una a distancia 1, las de distancia 2 sobran), las más usadas primero
+    minima = encontradas[0][0]
+    cercanas = [verbo for d, verbo in encontradas if d == minima]
+    return sorted(cercanas, key=lambda v: (-trie.frecuencia(v), v))[:maximo]
+
+def normalizar_arg(arg: str) -> str:
+    return 'Ø' if arg in ('0', '') else arg
+
+def extraer_mr(ls: str) -> tuple:
+    """Extrae el marcador [MR0] o [MR1] de la estructura lógica.
+    Retorna (ls_sin_mr, mr) donde mr es el marcador o cadena vacía."""
+    match = re.search(r'\s*\[MR[01]\]\s*$', ls)
+    if match:
+        mr = match.group().strip()
+        ls_sin_mr = ls[:match.start()].strip()
+        return (ls_sin_mr, mr)
+    return (ls, "")
+
+def insertar_mr(ls: str, mr: str) -> str:
+    """Inserta el marcador MR al final de la estructura lógica."""
+    if mr:
+        return f"{ls} {mr}"
+    return ls
+
+def traducir_ls_a_ingles(ls_string: str, usar_html: bool = True) -> str:
+    """
+    Traduce constantes al inglés y las pone en NEGRITA.
+    Incluye un diccionario de correcciones ampliado para evitar ambigüedades 
+    donde el traductor confunde participios con sustantivos.
+    """
+    if not ls_string:
+        return ls_string
+
+    # Tags para formato
+    if usar_html:
+        NEGRITA_INICIO = "<b>"
+        NEGRITA_FIN = "</b>"
+    else:
+        NEGRITA_INICIO = ""
+        NEGRITA_FIN = ""
+    
+    GoogleTranslator = _clase_traductor()
+    if GoogleTranslator:
+        translator = GoogleTranslator(source='es', target='en')
+    else:
+        translator = None
+    correcciones = CORRECCIONES.actual()
+
+    def reemplazar_match(match):
+        constante = match.group(1) 
+        
+        # Variable para guardar la palabra final
+        palabra_final = constante
+        constante_lower = constante.lower()
+
+        # 1. Si está en la lista de palabras reservadas RRG, no tocar
+        if constante_lower in RRG_KEYWORDS:
+            pass
+            
+        # 2. Si está en nuestro DICCIONARIO DE CORRECCIONES, usar esa versión
+        elif constante_lower in correcciones:
+            palabra_final = correcciones[constante_lower]
+            
+        # 3. Si no, intentar traducción normal
+        elif translator:
+            texto_limpio = constante.replace(".", " ")
+            if texto_limpio in CACHE_TRADUCCION:
+                palabra_final = CACHE_TRADUCCION[texto_limpio]
+            else:
+                try:
+                    traduccion = translator.translate(texto_limpio)
+                    if traduccion:
+                        palabra_final = traduccion.lower().strip().replace(" ", ".")
+                        CACHE_TRADUCCION[texto_limpio] = palabra_final
+                except Exception:
+                    pass 
+
+        return f"{NEGRITA_INICIO}{palabra_final}'{NEGRITA_FIN}"
+
+    patron = r"\b([a-zA-Zñáéíóúü\._Ø0-9\-]+)'"
+    ls_traducida = re.sub(patron, reemplazar_match, ls_string)
+    return ls_traducida
+
+def infinitivo_a_participio(infinitivo: str) -> str:
+    """Convierte un infinitivo español (con o sin clíticos) a su forma de participio."""
+    return participio_de_infinitivo(infinitivo)
+
+# FUNCIONES PARA EXPORTAR O COPIAR LS FINAL
+
+def limpiar_html_ls(ls_html: str) -> str:
+    """Convierte la estructura lógica con HTML a texto plano."""
+    texto = ls_html
+    # Reemplazar entidades HTML por ángulos Unicode
+    texto = texto.replace('&lt;', '⟨')
+    texto = texto.replace('&gt;', '⟩')
+    # Eliminar tags HTML
+    texto = re.sub(r'<[^>]+>', '', texto)
+    return texto
+
+def convertir_ls_a_latex(ls_html: str) -> str:
+    """Convierte la estructura lógica con HTML a formato LaTeX (modo matemático)."""
+    texto = ls_html
+    
+    # 1. Convertir negritas (constantes predicativas)
+    texto = re.sub(r'<b>([^<]+)</b>', r'\\mathbf{\1}', texto)
+    
+    # 2. Convertir apertura de operador: &lt;<sub>XX</sub> → \langle_{\text{XX}}\;
+    texto = re.sub(r'&lt;<sub>([^<]+)</sub>', r'\\langle_{\\text{\1}}\\;', texto)
+    
+    # 3. Convertir itálicas (valores de operadores) con espacio después
+    texto = re.sub(r'<i>([^<]+)</i>', r'\\textit{\1}\\;', texto)
+    
+    # 4. Convertir cierre de ángulos con espacio antes
+    texto = texto.replace('&gt;', r'\rangle')
+    
+    # 5. Convertir símbolo vacío
+    texto = texto.replace('Ø', r'\varnothing')
+    
+    # 6. Convertir palabras clave de RRG a texto con espacios
+    keywords = ['CAUSE', 'INGR', 'BECOME', 'PROC', 'SEML', 'PURP', 'FIN', 'NOT']
+    for kw in keywords:
+        texto = re.sub(rf'(?<![a-zA-Z]){kw}(?![a-zA-Z\'])', f'\\;\\\\text{{{kw}}}\\;', texto)
+    
+    # 7. Formatear [MR0] y [MR1]
+    texto = re.sub(r'\[MR([01])\]', r'\\;[\\text{MR\1}]', texto)
+    
+    # 8. Formatear argumentos entre paréntesis (palabras que empiezan con mayúscula)
+    def formatear_argumento(match):
+        arg = match.group(1)
+        if arg[0].isupper() and arg not in keywords:
+            return f'\\text{{{arg}}}'
+        return arg
+    
+    texto = re.sub(r'\b([A-Z][a-zá-úñ]*)\b(?![}\'])', formatear_argumento, texto)
+    
+    # 9. Añadir espacio después de comas
+    texto = texto.replace(',', ', ')
+    
+    # 10. Envolver todo en modo matemático
+    texto = f'${texto}$'
+    return texto
+
+def generar_imagen_ls(ls_html: str) -> bytes:
+    """Genera una imagen PNG de la estructura lógica con formato."""
+    import matplotlib.pyplot as plt
+    from io import BytesIO
+    
+    # Convertir HTML a formato matplotlib mathtext
+    texto = ls_html
+    texto = texto.replace('&lt;', '⟨')
+    texto = texto.replace('&gt;', '⟩')
+    texto = re.sub(r'<sub>([^<]+)</sub>', r'$_{\\mathrm{\1}}$', texto)
+    texto = re.sub(r'<i>([^<]+)</i>', r'$\\mathit{\1}$', texto)
+    texto = re.sub(r'<b>([^<]+)</b>', r'$\\mathbf{\1}$', texto)
+    
+    # Calcular ancho según longitud
+    ancho = max(len(ls_html) * 0.08, 10)
+    
+    fig, ax = plt.subplots(figsize=(ancho, 1.5))
+    ax.axis('off')
+    
+    ax.text(0.5, 0.5, texto,
+            fontsize=14,
+            ha='center',
+            va='center',
+            transform=ax.transAxes)
+    
+    buf = BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', dpi=150,
+                facecolor='white', edgecolor='none', pad_inches=0.3)
+    plt.close(fig)
+    buf.seek(0)
+    return buf.getvalue()
+
+def extraer_predicados_de_ls(ls_html: str) -> list:
+    """Extrae los predicados (en negrita) de la estructura lógica, excluyendo palabras reservadas de RRG."""
+    patron = r"<b>([^<]+)'</b>"
+    matches = re.findall(patron, ls_html)
+    # Eliminar duplicados manteniendo orden, excluyendo palabras reservadas
+    vistos = set()
+    unicos = []
+    for m in matches:
+        m_lower = m.lower()
+        # Verificar que no sea palabra reservada (comparar también sin puntos)
+        m_base = m_lower.split('.')[0]
+        if m not in vistos and m_lower not in RRG_KEYWORDS and m_base not in RRG_KEYWORDS:
+            vistos.add(m)
+            unicos.append(m)
+    return unicos
+
+def reemplazar_predicado_en_ls(ls_html: str, pred_viejo: str, pred_nuevo: str) -> str:
+    """Reemplaza un predicado por otro en la estructura lógica."""
+    # Reemplazar <b>pred_viejo'</b> por <b>pred_nuevo'</b>
+    patron = f"<b>{re.escape(pred_viejo)}'</b>"
+    reemplazo = f"<b>{pred_nuevo}'</b>"
+    return re.sub(patron, reemplazo, ls_html)
+
+# --- 4. FUNCIONES DE GENERACIÓN DE ESTRUCTURAS LÓGICAS ---
+
+def generar_estructura_no_causativa(x, y, locus, pred, operador, AKT):
+    if y != "Ø" and locus == "Ø":
+        return f"{operador + ' ' if operador else ''}{pred}' ({x}, {y})"
+    elif y == "Ø" and locus != "Ø":
+        return f"{operador + ' ' if operador else ''}{pred}' ({x}, {locus})"
+    elif y == "Ø" and locus == "Ø":
+        return f"{operador + ' ' if operador else ''}{pred}' ({x})"
+    return None
+
+def generar_estructura_causativa(x, y, pred, operador):
+    if y == "Ø":
+        return None
+    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}{pred}' ({y})]"
+
+def generar_estructura_actividad(x, y, locus, pred, operador):
+    if y != "Ø" and locus == "Ø":
+        return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x}, {y})])"
+    elif y == "Ø" and locus != "Ø":
+        return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x}, {locus})])"
+    elif y == "Ø" and locus == "Ø":
+        return f"{operador + ' ' if operador else ''}do' ({x}, [{pred}' ({x})])"
+    return None
+
+def generar_estructura_actividad_causativa(x, y, pred, operador):
+    if y == "Ø":
+        return None
+    return f"[do' ({x}, Ø)] CAUSE [{operador + ' ' if operador else ''}do' ({y}, [{pred}' ({y})])]"
+
+def aplicar_DO(x, estructura_logica):
+    if estructura_logica is None:
+        return None
+    ls_sin_mr, mr = extraer_mr(estructura_logica)
+    resultado = f"DO ({ls_sin_mr})"
+    return insertar_mr(resultado, mr)
+
+def aplicar_anticausativa(estructura_logica):
+    ls_sin_mr, mr = extraer_mr(estructura_logica)
+    resultado = f"[do' (Ø, Ø)] CAUSE [{ls_sin_mr}]"
+    return insertar_mr(resultado, mr)
+
+def añadir_operadores_a_ls(estructura_logica: str, operadores_seleccionados: List[Tuple[str, Optional[str]]]) -> str:
+    """Añade operadores a la estructura lógica con formato RRG (operador en subíndice, valor en itálica)."""
+    if not operadores_seleccionados:
+        return estructura_logica
+    
+    # Extraer MR si existe
+    ls_sin_mr, mr = extraer_mr(estructura_logica)
+    # Construir el resultado base: MR queda dentro del corchete externo pero fuera de la LS
+    if mr:
+        resultado = f"[{ls_sin_mr}]{mr}"
+    else:
+        resultado = f"[{ls_sin_mr}]"
+    
+    for codigo, valor in reversed(operadores_seleccionados):
+        # Separar el símbolo + si existe en el código (para NEG.INT + y NEG.NUC +)
+        if codigo.endswith(' +'):
+            codigo_base = codigo[:-2]
+            sufijo_codigo = " <i>+</i>"
+        else:
+            codigo_base = codigo
+            sufijo_codigo = ""
+        
+        # Separar el símbolo + si existe en el valor (para STA NEG +)
+        if valor and valor.endswith(' +'):
+            valor_base = valor[:-2]
+            valor_formateado = f"<i>{valor_base}</i> <i>+</i>"
+        elif valor:
+            valor_formateado = f"<i>{valor}</i>"
+        else:
+            valor_formateado = ""
+        
+        if valor_formateado:
+            resultado = f"&lt;<sub>{codigo_base}</sub>{sufijo_codigo} {valor_formateado} {resultado}&gt;"
+        else:
+            resultado = f"&lt;<sub>{codigo_base}</sub>{sufijo_codigo} {resultado}&gt;"
+    
+    return resultado
+
+def normalizar_operadores(ops_seleccionados: List[Tuple[str, Optional[str]]]) -> List[Tuple[str, Optional[str]]]:
+    """Pasa los valores de los operadores a mayúsculas y convierte STA NEG en NEG +."""
+    ops_valores = []
+    for codigo, valor in ops_seleccionados:
+        if valor:
+            valor = valor.upper()
+            if codigo == 'STA' and valor == 'NEG':
+                valor = 'NEG +'
+        ops_valores.append((codigo, valor))
+    return ops_valores
+
+# --- 5. MOTOR DE REGLAS PARA EL FORMULARIO EXPERTO ---
+
+# Preguntas de sí/no que puede necesitar el motor, con el texto que se muestra al usuario
+PREGUNTAS_LS = {
+    'dinamico': "¿La cláusula (o el evento resultante, si es causativa) es compatible con expresiones como *enérgicamente*, *con fuerza* o *con ganas*?",
+    'lleva_se': "¿La cláusula contiene la partícula **se** (como en *se me/te/le*)?",
+    'x_parte_de_z': "¿El sujeto es una parte del complemento indirecto (ej.: *me duele la cabeza*)?",
+    'estructura_doler_gustar': "¿La cláusula se parece a *Me/te/le [verbo] X* o a *A Z me/te/le [verbo] X*?",
+    'verbo_hacer': "¿El verbo de la cláusula es *hacer* (ej.: *hace calor*)?",
+    'z_destino': "¿El complemento indirecto señala el destino de un desplazamiento por parte del sujeto?",
+    'estar_clima': "¿La cláusula describe una sensación o fenómeno climático usando *estar* como verbo no auxiliar (ej.: *está nublado*)?",
+    'ser_esencial': "¿La cláusula expresa un atributo esencial del sujeto usando **ser** (ej.: *Ana es alta*)?",
+    'sensacion': "¿El estado (o el estado o evento resultante, si es causativa) es un tipo de sensación o sentimiento (ej.: *miedo*, *amor*, *frío*)?",
+    'y_sensacion': "¿El complemento directo expresa una sensación o sentimiento?",
+    'diccion': "¿El verbo es un verbo de dicción?",
+    'ensenar': "¿El verbo es como *enseñar* o *mostrar*?",
+    'transferencia': "¿El significado típico del verbo es la transferencia de un objeto físico?",
+    'locativo': "¿Alguno de los constituyentes argumentales (no periféricos) o el atributo indica la ubicación, el destino o el punto de partida de los participantes?",
+    'y_en_parte_de_x': "¿El complemento directo está situado en alguna parte del sujeto?",
+    'y_parte_de_x': "¿El complemento directo es una parte constituyente del sujeto?",
+    'parentesco': "¿El complemento directo indica una relación de parentesco?",
+    'resultado_loc': "¿Como resultado del evento, el participante dejó de estar o llegó a estar en el lugar indicado?",
+    'mente': "¿La cláusula describe que el sujeto tiene o llega a tener en su mente lo expresado en el complemento directo?",
+    'regimen': "¿Alguno de los constituyentes es un complemento de régimen (ej.: *de defectos* en *la obra carece de defectos*)?",
+    'interlocutor': "¿Hay un interlocutor en la cláusula?",
+    'reciproco_intencional': "¿Tanto el sujeto como el interlocutor actuaron de manera intencional en la conversación?",
+    'percepcion': "¿El predicado indica un tipo de percepción sensorial?",
+    'intencional': "¿La acción fue efectuada intencionalmente por el sujeto?",
+    'anticausativa': "¿El verbo de la cláusula está construido con el clítico *se* y tiene una contraparte causativa (ej.: *romperse* / *romper*)?",
+}
+
+# Datos de texto o selección que puede necesitar el motor
+CAMPOS_LS = {
+    'predicado': "el infinitivo del verbo (o el adjetivo/atributo en cláusulas copulativas)",
+    'predicado_es_atributo': "si el predicado es un verbo o un adjetivo/atributo",
+    'actividad': "el infinitivo de la actividad realizada por el participante causado",
+    'atributo': "la sensación, atributo, adverbio o cualidad que expresa el predicado",
+    'locus': "la información del lugar, sin preposición",
+    'lugar_tipo': "si el lugar es la procedencia o el destino",
+    'suplemento': "la información del complemento de régimen, sin preposición",
+    'preposicion': "la preposición regida por el verbo",
+    'interlocutor': "quién es el interlocutor",
+    'alimento': "el alimento consumido",
+    'sentido': "el sentido involucrado en el acto de percepción",
+    'clase_ra': "la clase semántica de la realización activa",
+}
+
+CLASES_RA = ["Creación", "Consumo", "Desplazamiento", "Ninguno de estos"]
+SENTIDOS = {"Vista": "see", "Oído": "hear", "Olfato": "smell", "Gusto": "taste", "Tacto": "feel"}
+ERROR_GENERICO = "No fue posible generar una estructura lógica con estos parámetros."
+
+@dataclass
+class RespuestasLS:
+    """Todos los datos que las reglas del asistente pueden necesitar, reunidos en un solo formulario."""
+    akt: str = ""
+    oracion: str = ""
+    x: str = ""
+    y: str = ""
+    z: str = ""
+    es_dinamico: Optional[bool] = None
+    predicado: str = ""
+    predicado_es_atributo: Optional[bool] = None
+    actividad: str = ""
+    atributo: str = ""
+    locus: str = ""
+    lugar_tipo: str = ""
+    suplemento: str = ""
+    preposicion: str = ""
+    interlocutor: str = ""
+    alimento: str = ""
+    sentido: str = ""
+    clase_ra: str = ""
+    respuestas: Dict[str, Optional[bool]] = field(default_factory=dict)
+
+@dataclass
+class ResolucionLS:
+    estructura: str = ""
+    estructura_pre_do: str = ""
+    estructura_con_do: str = ""
+    pred: str = ""
+    locus: str = "Ø"
+    complemento_regimen: str = ""
+    es_dinamico: Optional[bool] = None
+    pendientes: List[str] = field(default_factory=list)
+    error: str = ""
+
+class _PreguntaPendiente(Exception):
+    """El motor necesita una respuesta que no se entregó en el formulario."""
+
+class _ErrorLS(Exception):
+    """Con los datos entregados no es posible generar una estructura lógica."""
+
+def resolver_ls(r: RespuestasLS) -> ResolucionLS:
+    """Recorre de una vez las mismas reglas que los pasos del asistente.
+    Si falta una respuesta necesaria, se detiene y la informa en `pendientes`."""
+    AKT = r.akt
+    x, y, z = (normalizar_arg(a.strip()) for a in (r.x, r.y, r.z))
+    operador = MODIFICADORES_AKT.get(AKT, "")
+    op = operador + ' ' if operador else ''
+    res = ResolucionLS()
+    estado = {'pred': '', 'locus': 'Ø', 'reciproco': False, 'directo': False, 'atributo': False}
+
+    def si(clave):
+        valor = r.respuestas.get(clave)
+        if valor is None:
+            raise _PreguntaPendiente(PREGUNTAS_LS[clave])
+        return valor
+
+    def texto(campo):
+        valor = getattr(r, campo).strip()
+        if not valor:
+            raise _PreguntaPendiente(f"Falta indicar {CAMPOS_LS[campo]}.")
+        return valor
+
+    def lema(campo):
+        return texto(campo).lower().replace(" ", ".")
+
+    def usar_predicado():
+        estado['pred'] = lema('predicado')
+        return estado['pred']
+
+    def lugar_tipo():
+        if r.lugar_tipo not in ("1", "2"):
+            raise _PreguntaPendiente(f"Falta indicar {CAMPOS_LS['lugar_tipo']}.")
+        return r.lugar_tipo
+
+    def dinamicidad():
+        if r.es_dinamico is not None:
+            return r.es_dinamico
+        if AKT in ["actividad", "actividad causativa", "realización activa", "realización activa causativa"]:
+            return True
+        if AKT in ["logro", "semelfactivo", "logro causativo", "semelfactivo causativo"]:
+            return si('dinamico')
+        return False
+
+    def caso_especial():
+        if "causativ" not in AKT and AKT != "realización activa" and x != "Ø" and y == "Ø" and z != "Ø":
+            if si('lleva_se'):
+                return dativo_experimentante()
+            if si('x_parte_de_z'):
+                return doler_gustar(parte=True)
+            if si('estructura_doler_gustar'):
+                return doler_gustar(parte=False)
+            return locativo_dativo() if AKT != "estado" else caso_locativo()
+        elif x == "Ø" and y != "Ø":
+            return hacer_meteo() if si('verbo_hacer') else caso_locativo()
+        elif not es_dinamico and x == "Ø" and y == "Ø" and z != "Ø":
+            return impersonal()
+        elif "causativ" not in AKT and AKT != "estado" and x != "Ø" and y == "Ø" and z != "Ø":
+            return locativo_dativo()
+        elif AKT == "estado":
+            return caso_estado()
+        elif AKT in ["estado causativo", "logro causativo", "realización causativa", "proceso causativo"]:
+            return causativo_sensacion() if si('sensacion') else caso_locativo()
+        elif z != "Ø":
+            return caso_oi()
+        return caso_locativo()
+
+    def dativo_experimentante():
+        participio = infinitivo_a_participio(usar_predicado()).replace(" ", ".")
+        estado['directo'] = True
+        if si('anticausativa'):
+            return f"[do' (Ø, Ø)] CAUSE [{op}{participio}' ({x})] ∧ affected' ({z})"
+        return f"{op}{participio}' ({x}) ∧ affected' ({z})"
+
+    def doler_gustar(parte):
+        pred = usar_predicado()
+        if parte:
+            if es_dinamico:
+                return f"{op}do' ({x}, [{pred}' ({x})]) ∧ have.as.part' ({z}, {x})"
+            return f"{op}{pred}' ({x}) ∧ have.as.part' ({z}, {x})"
+        if es_dinamico:
+            return f"{op}do' ({x}, [{pred}' ({x}, {z})]) [MR1]"
+        return f"{op}{pred}' ({x}, {z}) [MR1]"
+
+    def hacer_meteo():
+        pred = lema('atributo')
+        if es_dinamico:
+            return f"{op}do' (weather, [{pred}' (weather)])"
+        return f"{op}{pred}' (weather)"
+
+    def impersonal():
+        verbo = usar_predicado()
+        if verbo in ["ir", "irme", "irte", "irle", "irnos", "iros", "irles"]:
+            return f"{op}{lema('atributo')}' ({z}) [MR0]"
+        elif verbo in ["bastar", "sobrar"]:
+            suplemento = texto('suplemento')
+            res.complemento_regimen = suplemento
+            return f"{op}have.enough.with' ({z}, {suplemento}) [MR0]"
+        return caso_locativo()
+
+    def locativo_dativo():
+        if not si('z_destino'):
+            return caso_oi()
+        if AKT == "realización activa":
+            pred = usar_predicado()
+            return f"do' ({x}, [{pred}' ({x})]) ∧ PROC covering.path.distance' ({x}) ∧ FIN be-LOC' ({z}, {x})"
+        if es_dinamico:
+            return f"{op}do' ({x}, [be-LOC' ({z}, {x})])"
+        return f"{op}be-LOC' ({z}, {x})"
+
+    def diccion(ra):
+        pred = estado['pred']
+        y_clean = "something" if y in ["Ø", "0"] else y.replace(" ", ".")
+        if ra:
+            if es_de_clase(pred, "diccion.preguntar"):
+                return f"[do' ({x}, [express.question' ({x}, pregunta)]) ∧ PROC being.created' (pregunta) ∧ FIN exist' (pregunta)] PURP [do' ({z}, [express.something' ({z}, {y})])]"
+            for clase, prep in (("agradecer", "por"), ("bendecir", "de")):
+                if es_de_clase(pred, f"diccion.{clase}"):
+                    arg_inc = sustantivo_diccion(pred, clase)
+                    return f"[do' ({x}, [express.{arg_inc}' ({x}, {y})]) ∧ PROC being.created' ({arg_inc}) ∧ FIN exist' ({arg_inc})] PURP [know' ({z}, {arg_inc} {prep} {y})]"
+            return f"[do' ({x}, [express.something' ({x}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})] PURP [know' ({z}, {y})]"
+        if es_de_clase(pred, "diccion.preguntar"):
+            return f"[{op}do' ({x}, [express.question' ({x})])] PURP [do' ({z}, [express.{y_clean}' ({z}, {y})])]"
+        for clase, prep in (("agradecer", "por"), ("bendecir", "de")):
+            if es_de_clase(pred, f"diccion.{clase}"):
+                arg_inc = sustantivo_diccion(pred, clase)
+                return f"[{op}do' ({x}, [express.{arg_inc}' ({x}, {y})])] PURP [know' ({z}, {arg_inc} {prep} {y})]"
+        return f"[{op}do' ({x}, [express.something' ({x}, {y})])] PURP [know' ({z}, {y})]"
+
+    def caso_oi():
+        pred = usar_predicado()
+        if AKT == "realización activa":
+            return diccion(ra=True) if si('diccion') else caso_locativo()
+        if AKT == "realización activa causativa":
+            if si('ensenar'):
+                return f"[do' ({x}, [{pred}' ({x}, {y})])] CAUSE [do' ({z}, [know' ({z}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})]"
+            return caso_locativo()
+        if es_de_clase(pred, "transferencia.sacar"):
+            if pred == "arrancar" and "causativ" not in AKT:
+                return caso_locativo()
+            return f"[do' ({x}, Ø)] CAUSE [{op}NOT have' ({z}, {y})] PURP [have' ({x}, {y})]"
+        if es_de_clase(pred, "transferencia.dar_poner") or (pred == "pegar" and y != "Ø") or si('transferencia'):
+            return f"[do' ({x}, Ø)] CAUSE [{op}have' ({z}, {y})]"
+        if si('diccion'):
+            return diccion(ra=False)
+        if es_de_clase(pred, "tri_neg.desatribuir"):
+            return f"[do' ({x}, Ø)] CAUSE [{op}NOT have' ({z}, {y})]"
+        if es_de_clase(pred, "tri_neg.ocultar"):
+            return f"[do' ({x}, Ø)] CAUSE [{op}NOT know' ({z}, {y})]"
+        if si('ensenar'):
+            return f"[do' ({x}, Ø)] CAUSE [{op}know' ({z}, {y})]"
+        if pred in ["pegar", "pegarle"]:
+            return f"{op}do' ({x}, [hit' ({x}, {z})]) [MR1]"
+        raise _ErrorLS(
+            "Error. No se puede generar una estructura lógica con estos datos.\n\n"
+            f"Asegúrate de que **{z}** sea un argumento de **{pred}** y de que no se trate de un dativo ético o parte de una construcción aplicativa."
+        )
+
+    def caso_estado():
+        if y != "Ø":
+            if si('y_sensacion'):
+                return f"feel' ({x}, [{y.replace(' ', '.')}'])"
+            return caso_locativo()
+        if x == "Ø":
+            if si('estar_clima'):
+                estado['pred'] = lema('atributo')
+                return f"{estado['pred']}' (weather)"
+            return caso_locativo()
+        if si('ser_esencial'):
+            estado['pred'] = lema('atributo')
+            return f"be' ({x}, [{estado['pred']}'])"
+        if si('sensacion'):
+            estado['pred'] = lema('atributo')
+            return f"feel' ({x}, [{estado['pred']}'])"
+        return caso_locativo()
+
+    def causativo_sensacion():
+        experimentante = z if z != "Ø" else y
+        estado['pred'] = lema('atributo')
+        ls = f"[do' ({x}, Ø)] CAUSE [{op}feel' ({experimentante}, [{estado['pred']}'])]"
+        if z != "Ø" and y == "Ø":
+            ls += " [MR1]"
+        return ls
+
+    def caso_locativo():
+        if not si('locativo'):
+            return info_mente()
+        locus = texto('locus')
+        estado['locus'] = locus
+        pred = usar_predicado()
+        if pred == "haber":
+            tema = y if y != "Ø" else (x if x != "Ø" else "Ø")
+            return f"be-LOC' ({locus}, {tema}) [MR1]"
+        elif es_de_clase(pred, "posesion.tener"):
+            if si('y_en_parte_de_x'):
+                return f"have.as.part' ({x}, {y}) ∧ be-LOC' ({locus}, {y})"
+            if pred in ["tener", "poseer", "ostentar", "lucir"] and si('parentesco'):
+                return f"have.as.kin' ({x}, {y}) ∧ be-LOC' ({locus}, {y})"
+            return f"{pred}' ({x}, {y}) ∧ be-LOC' ({locus}, {y})"
+        elif pred == "olvidar":
+            return f"{op}NOT know' ({x}, {y}) ∧ be-LOC' ({locus}, {y})"
+        elif es_de_clase(pred, "transferencia.sacar") and not ((pred == "arrancar" or pred == "retirar") and "causativ" not in AKT):
+            return f"[do' ({x}, Ø)] CAUSE [{op}NOT be-LOC' ({locus}, {y})]"
+        elif AKT in ("actividad", "logro", "realización", "proceso", "semelfactivo"):
+            if buscar_verbo(pred, "movimiento") or si('resultado_loc'):
+                return movimiento(causativo=False)
+            return generar_basico()
+        elif AKT in ("logro causativo", "realización causativa", "proceso causativo", "semelfactivo causativo"):
+            if si('resultado_loc'):
+                return movimiento(causativo=True)
+            return generar_basico()
+        if AKT != "realización activa":
+            estado['pred'] = "be-LOC"
+        return generar_basico()
+
+    def movimiento(causativo):
+        locus = estado['locus']
+        neg = "NOT " if lugar_tipo() == "1" else ""
+        tema = y if causativo else x
+        if es_dinamico:
+            ls = f"{op}do' ({tema}, [{neg}be-LOC' ({locus}, {tema})])"
+        else:
+            ls = f"{op}{neg}be-LOC' ({locus}, {tema})"
+        return f"[do' ({x}, Ø)] CAUSE [{ls}]" if causativo else ls
+
+    def info_mente():
+        if y == "Ø" or "causativ" in AKT or AKT == "realización activa" or AKT == "actividad":
+            return complemento_regimen()
+        if si('mente'):
+            return f"{op}know' ({x}, {y})"
+        return complemento_regimen()
+
+    def complemento_regimen():
+        if AKT in ["estado", "actividad", "proceso", "logro", "realización", "semelfactivo"] and y == "Ø" and si('regimen'):
+            pred = usar_predicado()
+            suplemento = texto('suplemento')
+            res.complemento_regimen = suplemento
+            if buscar_verbo(pred.split(".")[0], "diccion") == "conversar":
+                return predicados_especiales()
+            if es_dinamico:
+                return f"{op}do' ({x}, [{pred}' ({x}, {suplemento})]) [MR1]"
+            return f"{op}{pred}' ({x}, {suplemento}) [MR1]"
+        return predicado()
+
+    def predicado():
+        if AKT in ["actividad causativa", "realización activa causativa"] or (AKT in ["logro causativo", "semelfactivo causativo"] and es_dinamico):
+            estado['pred'] = ""
+        elif (AKT in ["actividad", "realización activa"]) or (AKT in ["logro", "semelfactivo"] and es_dinamico) or (y != "Ø" and "causativ" not in AKT):
+            usar_predicado()
+        else:
+            pred = lema('predicado')
+            if r.predicado_es_atributo is None:
+                raise _PreguntaPendiente(f"Falta indicar {CAMPOS_LS['predicado_es_atributo']}.")
+            if not r.predicado_es_atributo and pred.endswith(("ar", "er", "ir", "arse", "erse", "irse")):
+                pred = infinitivo_a_participio(pred).replace(" ", ".")
+            estado['pred'] = pred
+            estado['atributo'] = r.predicado_es_atributo
+        return predicados_especiales()
+
+    def predicados_especiales():
+        pred = estado['pred']
+        # Un atributo (perdido, presente, nublado) se busca tal cual, no por el verbo del que viene
+        normalizar = not estado['atributo']
+        if es_de_clase(pred, "percepcion_impersonal", normalizar) and not es_dinamico and y == "Ø":
+            estado['reciproco'] = True
+            return f"{op}{sentido_percepcion(pred, impersonal=True)}.{lema('atributo')}' ({x})"
+        elif x == "Ø" and es_de_clase(pred, "meteorologico", normalizar):
+            return f"{op}do' ([{pred}'])"
+        elif es_de_clase(pred, "diccion.conversar", normalizar):
+            if not si('interlocutor'):
+                return generar_basico()
+            inter = texto('interlocutor')
+            parte1 = f"[do' ({x}, [express.something.to.{inter.replace(' ', '.')}' ({x}, {y})])] PURP [{op}know' ({inter}, {y})]"
+            parte2 = f"[do' ({inter}, [express.something.to.{x.replace(' ', '.')}' ({inter}, {y})])] PURP [{op}know' ({x}, {y})]"
+            estado['reciproco'] = True
+            if si('reciproco_intencional'):
+                return f"DO ({parte1}) ∧ DO ({parte2})"
+            return f"{parte1} ∧ {parte2}"
+        elif pred in ["olvidar", "desaprender"]:
+            return f"{op}do' ({x}, [NOT know' ({x}, {y})])" if es_dinamico else f"{op}NOT know' ({x}, {y})"
+        elif es_de_clase(pred, "posesion.perder", normalizar) and y != "Ø":
+            return f"{op}do' ({x}, [NOT have' ({x}, {y})])" if es_dinamico else f"{op}NOT have' ({x}, {y})"
+        elif es_de_clase(pred, "posesion.obtener", normalizar) and y != "Ø":
+            return f"{op}do' ({x}, [INGR have' ({x}, {y})])" if es_dinamico else f"{op}have' ({x}, {y})"
+        elif AKT == "estado":
+            if pred in ["ignorar", "desconocer"]:
+                return f"NOT know' ({x}, {y})"
+            elif pred == "haber":
+                return f"exist' ({y}) [MR0]"
+            elif es_de_clase(pred, "existencia", normalizar) and y == "Ø":
+                return f"exist' ({x})"
+            elif es_de_clase(pred, "posesion.tener", normalizar) and y != "Ø":
+                if si('y_parte_de_x'):
+                    return f"have.as.part' ({x}, {y})"
+                if pred in ["tener", "poseer", "ostentar", "lucir"] and si('parentesco'):
+                    return f"have.as.kin' ({x}, {y})"
+                return f"have' ({x}, {y})"
+        return generar_basico()
+
+    def generar_basico():
+        pred = estado['pred']
+        locus = estado['locus']
+        if AKT in ["realización activa", "realización activa causativa"]:
+            return realizacion_activa()
+        if es_dinamico and "causativ" in AKT:
+            estado['pred'] = lema('actividad')
+            return f"[do' ({x}, Ø)] CAUSE [{op}do' ({y}, [{estado['pred']}' ({y})])]"
+        if AKT in ["estado causativo", "logro causativo", "realización causativa", "proceso causativo", "semelfactivo causativo"]:
+            ls = generar_estructura_causativa(x, y, pred, operador)
+        elif es_dinamico:
+            if y != "Ø" and locus == "Ø":
+                return percepcion()
+            ls = generar_estructura_actividad(x, y, locus, pred, operador)
+        elif AKT in ["estado", "logro", "realización", "proceso", "semelfactivo"]:
+            if AKT != "estado" and y != "Ø":
+                return percepcion()
+            ls = generar_estructura_no_causativa(x, y, locus, pred, operador, AKT)
+        else:
+            ls = None
+        if not ls:
+            raise _ErrorLS(ERROR_GENERICO)
+        return ls
+
+    def percepcion():
+        if si('percepcion'):
+            pred_lower = estado['pred'].lower()
+            if es_de_clase(pred_lower, "percepcion"):
+                estado['pred'] = sentido_percepcion(pred_lower)
+            elif r.sentido in SENTIDOS.values():
+                estado['pred'] = r.sentido
+            else:
+                raise _PreguntaPendiente(f"Falta indicar {CAMPOS_LS['sentido']}.")
+        if es_dinamico:
+            ls = generar_estructura_actividad(x, y, estado['locus'], estado['pred'], operador)
+        else:
+            ls = generar_estructura_no_causativa(x, y, estado['locus'], estado['pred'], operador, AKT)
+        if not ls:
+            raise _ErrorLS(ERROR_GENERICO)
+        return ls
+
+    def realizacion_activa():
+        if r.clase_ra not in CLASES_RA:
+            raise _PreguntaPendiente(f"Falta indicar {CAMPOS_LS['clase_ra']}.")
+        es_causativa = AKT == "realización activa causativa"
+        pred = estado['pred']
+        locus = estado['locus']
+        if r.clase_ra == "Creación":
+            if es_causativa:
+                estado['pred'] = lema('actividad')
+                return f"[do' ({x}, Ø)] CAUSE [do' ({z}, [{estado['pred']}' ({z}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})]"
+            return f"do' ({x}, [{pred}' ({x}, {y})]) ∧ PROC being.created' ({y}) ∧ FIN exist' ({y})"
+        if r.clase_ra == "Consumo":
+            if not es_causativa:
+                return f"do' ({x}, [{pred}' ({x}, {y})]) ∧ PROC being.consumed' ({y}) ∧ FIN consumed' ({y})"
+            verbo = usar_predicado()
+            actividad = lema('actividad')
+            if verbo in ["alimentar", "nutrir", "cebar", "hidratar", "saciar", "empachar"]:
+                alimento = lema('alimento')
+                return f"[do' ({x}, Ø)] CAUSE [do' ({y}, [{actividad}' ({y}, {alimento})]) ∧ PROC being.consumed' ({alimento}) ∧ FIN consumed' ({alimento})]"
+            return f"[do' ({x}, Ø)] CAUSE [do' ({z}, [{actividad}' ({z}, {y})]) ∧ PROC being.consumed' ({y}) ∧ FIN consumed' ({y})]"
+        if r.clase_ra == "Desplazamiento":
+            categoria_mov = buscar_verbo(pred, "movimiento")
+            if categoria_mov:
+                pred = estado['pred'] = categoria_mov
+            if (locus == "Ø" or y != "Ø") and not es_causativa:
+                return f"do' ({x}, [{pred}' ({x})]) ∧ PROC covering.path.distance' ({x}, {y}) ∧ FIN be-LOC' ({locus}, {x})"
+            fin_loc = "NOT be-LOC'" if lugar_tipo() == "1" else "be-LOC'"
+            if es_causativa:
+                estado['pred'] = lema('actividad')
+                return f"[do' ({x}, Ø)] CAUSE [do' ({y}, [{estado['pred']}' ({y})]) ∧ PROC covering.path.distance' ({y}) ∧ FIN {fin_loc} ({locus}, {y})]"
+            return f"do' ({x}, [{pred}' ({x})]) ∧ PROC covering.path.distance' ({x}) ∧ FIN {fin_loc} ({locus}, {x})"
+        # Ninguno de estos
+        if es_causativa:
+            estado['pred'] = actividad = lema('actividad')
+            participio = infinitivo_a_participio(actividad).replace(" ", ".")
+            if z != "Ø":
+                return f"[do' ({x}, Ø)] CAUSE [do' ({z}, [{actividad}' ({z}, {y})]) ∧ PROC {participio}' ({y}) ∧ FIN {participio}' ({y})]"
+            if si('regimen'):
+                prep = lema('preposicion')
+                suplemento = texto('suplemento')
+                res.complemento_regimen = suplemento
+                return f"[do' ({x}, Ø)] CAUSE [do' ({y}, [{actividad}.{prep}' ({y}, {suplemento})]) ∧ PROC {participio}.{prep}' ({y}, {suplemento}) ∧ FIN {participio}.{prep}' ({y}, {suplemento})]"
+            return f"[do' ({x}, Ø)] CAUSE [do' ({y}, [{actividad}' ({y})]) ∧ PROC {participio}' ({y}) ∧ FIN {participio}' ({y})]"
+        participio = infinitivo_a_participio(pred).replace(" ", ".")
+        if y != "Ø":
+            return f"do' ({x}, [{pred}' ({x}, {y})]) ∧ PROC {participio}' ({y}) ∧ FIN {participio}' ({y})"
+        if si('regimen'):
+            prep = lema('preposicion')
+            suplemento = texto('suplemento')
+            res.complemento_regimen = suplemento
+            return f"do' ({x}, [{pred}.{prep}' ({x}, {suplemento})]) ∧ PROC {participio}.{prep}' ({x}, {suplemento}) ∧ FIN {participio}.{prep}' ({x}, {suplemento})"
+        return f"do' ({x}, [{pred}' ({x})]) ∧ PROC {participio}' ({x}) ∧ FIN {participio}' ({x})"
+
+    try:
+        es_dinamico = res.es_dinamico = dinamicidad()
+        ls = caso_especial()
+        res.estructura_pre_do = ls
+        if not estado['directo']:
+            if not estado['reciproco'] and x != "Ø" and (es_dinamico or "causativ" in AKT) and si('intencional'):
+                ls = aplicar_DO(x, ls)
+                res.estructura_con_do = ls
+            if AKT in ["realización", "logro", "proceso", "semelfactivo"] and y == "Ø" and si('anticausativa'):
+                ls = aplicar_anticausativa(ls)
+            if not res.estructura_con_do:
+                res.estructura_pre_do = ls
+        res.estructura = ls
+    except _PreguntaPendiente as e:
+        res.pendientes.append(str(e))
+    except _ErrorLS as e:
+        res.error = str(e)
+    res.pred = estado['pred']
+    res.locus = estado['locus']
+    return res
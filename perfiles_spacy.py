@@ -0,0 +1,193 @@
+"""Carga de los modelos de spaCy con solo los componentes que usan los detectores.
+
+Los detectores leen pos_, dep_, lemma_, morph, head y los índices de los tokens.
+El reconocedor de entidades y los demás componentes empaquetados solo gastan
+tiempo por cláusula y memoria por proceso. Cada perfil enumera los componentes
+necesarios de un modelo; el resto se excluye al cargar, así que ni se construye
+ni se leen sus pesos. Después se comprueba con una oración de prueba que los
+atributos se siguen produciendo y, si falta alguno, se carga el modelo completo.
+VENDLER_SPACY_COMPLETO=1 fuerza siempre el modelo completo.
+
+Cada cláusula analizada añade sus palabras al Vocab y al StringStore del modelo,
+que nunca las liberan. ModeloAcotado limita ese crecimiento en los procesos que
+pasan semanas sirviendo la aplicación: cuando el vocabulario ha crecido más de
+VENDLER_SPACY_MAX_CADENAS cadenas desde la carga, prepara en segundo plano una
+copia nueva del modelo y la pone en uso de una sola vez (si la carga falla, espera
+ESPERA_TRAS_FALLO segundos antes de reintentar). Los análisis en curso
+terminan con el modelo anterior, que se libera cuando nadie lo usa.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+logger = logging.getLogger(__name__)
+
+# Componentes que necesita cada modelo: vectores de contexto, categoría gramatical y
+# rasgos (morphologizer en español, tagger + attribute_ruler en inglés), dependencias y lemas
+PERFILES: Dict[str, FrozenSet[str]] = {
+    "es_core_news_sm": frozenset({"tok2vec", "morphologizer", "parser", "attribute_ruler", "lemmatizer"}),
+    "en_core_web_sm": frozenset({"tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer"}),
+}
+
+ORACIONES_PRUEBA = {
+    "es_core_news_sm": "Los niños comieron manzanas en el parque.",
+    "en_core_web_sm": "The children ate apples in the park.",
+}
+
+# Atributo de los tokens -> anotación del Doc que lo respalda (head va con las dependencias)
+ATRIBUTOS = {"pos_": "POS", "dep_": "DEP", "lemma_": "LEMMA", "morph": "MORPH"}
+
+CARGAR_COMPLETO = os.environ.get("VENDLER_SPACY_COMPLETO", "") not in ("", "0")
+
+# Cadenas nuevas admitidas antes de renovar el modelo (0: sin límite)
+MAX_CADENAS = int(os.environ.get("VENDLER_SPACY_MAX_CADENAS", "200000"))
+
+# Segundos de espera tras una renovación fallida antes de volver a intentarla
+ESPERA_TRAS_FALLO = 600.0
+
+def componentes_del_modelo(modelo: str) -> List[str]:
+    """Todos los componentes empaquetados, incluidos los desactivados por defecto (senter)."""
+    import spacy
+    ruta = spacy.util.get_package_path(modelo) if spacy.util.is_package(modelo) else Path(modelo)
+    meta = spacy.util.load_meta(ruta / "meta.json")
+    return list(meta.get("components") or [*meta.get("pipeline", []), *meta.get("disabled", [])])
+
+def componentes_excluidos(modelo: str) -> List[str]:
+    necesarios = PERFILES.get(modelo)
+    if necesarios is None:
+        return []
+    return [c for c in componentes_del_modelo(modelo) if c not in necesarios]
+
+def atributos_faltantes(nlp: "Language", oracion: str) -> List[str]:
+    doc = nlp(oracion)
+    return [atributo for atributo, anotacion in ATRIBUTOS.items() if not doc.has_annotation(anotacion)]
+
+def cargar_modelo(modelo: str, completo: bool = CARGAR_COMPLETO) -> Optional["Language"]:
+    """Carga el modelo con su perfil reducido. Devuelve None si el modelo no está instalado."""
+    import spacy  # se importa al cargar el primer modelo, no al importar la aplicación
+    if not completo and modelo in PERFILES:
+        try:
+            nlp = spacy.load(modelo, exclude=componentes_excluidos(modelo))
+            faltan = atributos_faltantes(nlp, ORACIONES_PRUEBA[modelo])
+            if not faltan:
+                return nlp
+            logger.warning("El perfil de %s no produce %s; se carga el modelo completo",
+                           modelo, ", ".join(faltan))
+        except Exception:
+            pass  # sin metadatos o sin modelo: se intenta la carga completa
+    try:
+        return spacy.load(modelo)
+    except Exception:
+        return None
+
+def memoria_residente() -> float:
+    """Memoria residente del proceso, en MB (VmRSS; en otros sistemas, el máximo de getrusage)."""
+    try:
+        with open("/proc/self/status") as f:
+            for linea in f:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maximo / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+@dataclass(frozen=True)
+class EstadoModelo:
+    cadenas: int       # cadenas en el StringStore del modelo en uso
+    lexemas: int       # entradas del Vocab
+    crecimiento: int   # cadenas añadidas desde que se cargó
+    renovaciones: int
+    rss_mb: float
+
+class ModeloAcotado:
+    """Modelo de spaCy que se sustituye por una copia recién cargada cuando su vocabulario crece demasiado."""
+
+    def __init__(self, modelo: str, nlp: "Language", max_cadenas: int = MAX_CADENAS):
+        self.modelo = modelo
+        self.max_cadenas = max_cadenas
+        self._candado = threading.Lock()
+        self._renovando = False
+        self._renovaciones = 0
+        self._proximo_intento = 0.0
+        self._nlp = nlp
+        self._cadenas_iniciales = len(nlp.vocab.strings)
+
+    @property
+    def nlp(self) -> "Language":
+        return self._nlp
+
+    def __call__(self, texto: str):
+        nlp = self._nlp  # quien ya empezó sigue con este modelo aunque se renueve
+        doc = nlp(texto)
+        self._revisar(nlp)
+        return doc
+
+    def pipe(self, textos: Iterable[str]) -> List:
+        nlp = self._nlp
+        docs = list(nlp.pipe(textos))
+        self._revisar(nlp)
+        return docs
+
+    def _revisar(self, nlp: "Language") -> None:
+        # Un análisis que terminó con el modelo ya renovado no cuenta: su vocabulario no se
+        # compara con el del modelo nuevo, y el anterior se libera solo
+        if nlp is not self._nlp:
+            return
+        if self.max_cadenas and len(nlp.vocab.strings) - self._cadenas_iniciales > self.max_cadenas:
+            self._renovar_en_segundo_plano()
+
+    def _renovar_en_segundo_plano(self) -> None:
+        with self._candado:
+            if self._renovando or time.monotonic() < self._proximo_intento:
+                return
+            self._renovando = True
+        threading.Thread(target=self.renovar, name=f"renovar-{self.modelo}", daemon=True).start()
+
+    def renovar(self) -> bool:
+        """Carga una copia nueva del modelo y la pone en uso. Si la carga falla, sigue el anterior."""
+        try:
+            nuevo = cargar_modelo(self.modelo)
+            if nuevo is None:
+                logger.warning("No se pudo renovar %s; se mantiene el modelo en uso y se reintenta en %.0f s",
+                               self.modelo, ESPERA_TRAS_FALLO)
+                with self._candado:
+                    self._proximo_intento = time.monotonic() + ESPERA_TRAS_FALLO
+                return False
+            anterior = len(self._nlp.vocab.strings)
+            with self._candado:
+                self._nlp = nuevo
+                self._cadenas_iniciales = len(nuevo.vocab.strings)
+                self._renovaciones += 1
+            logger.info("Modelo %s renovado: %d cadenas antes, %d ahora", self.modelo, anterior,
+                        self._cadenas_iniciales)
+            return True
+        finally:
+            with self._candado:
+                self._renovando = False
+
+    def estado(self) -> EstadoModelo:
+        nlp = self._nlp
+        cadenas = len(nlp.vocab.strings)
+        return EstadoModelo(
+            cadenas=cadenas,
+            lexemas=len(nlp.vocab),
+            crecimiento=cadenas - self._cadenas_iniciales,
+            renovaciones=self._renovaciones,
+            rss_mb=memoria_residente(),
+        )
+
+def cargar_modelo_acotado(modelo: str, max_cadenas: int = MAX_CADENAS) -> Optional[ModeloAcotado]:
+    """Como cargar_modelo, pero con el vocabulario acotado. Devuelve None si el modelo no está instalado."""
+    nlp = cargar_modelo(modelo)
+    return ModeloAcotado(modelo, nlp, max_cadenas) if nlp is not None else None
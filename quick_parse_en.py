@@ -0,0 +1,156 @@
+"""Rule-based fast path for simple English clauses.
+
+Finds the verb without a dependency parse. Function words, proper nouns and
+words right after a determiner are skipped. The remaining words are looked up
+in a reverse index of the inflection table (form -> lemma). Each candidate is
+scored: a finite inflected form, a subject pronoun or modal right before it,
+or an -ing/participle form after an auxiliary. Confidence depends on the lead
+of the best candidate over the runner-up. The detector only runs spaCy below
+the threshold, and uses this result when no model is installed.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from inflection_en import TABLE_STORE, EnglishForms
+
+TOKEN = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?")
+
+DETERMINERS = frozenset({
+    "the", "a", "an", "this", "that", "these", "those", "my", "your", "his", "her", "its", "our", "their",
+    "some", "any", "no", "every", "each", "many", "much", "few", "several", "all", "both", "another", "other",
+})
+
+SUBJECT_PRONOUNS = {"i": "1s", "you": "2s", "he": "3s", "she": "3s", "it": "3s", "we": "1p", "they": "3p"}
+
+AUXILIARIES = {
+    "am": "be", "is": "be", "are": "be", "was": "be", "were": "be", "be": "be", "been": "be",
+    "has": "have", "have": "have", "had": "have",
+    "do": "do", "does": "do", "did": "do",
+}
+
+# Person suggested by an auxiliary when there is no subject pronoun
+AUXILIARY_PERSON = {"am": "1s", "is": "3s", "was": "3s", "has": "3s", "does": "3s",
+                    "are": "3p", "were": "3p", "have": "3p", "do": "3p"}
+
+IRREGULAR_PLURALS = frozenset({"children", "people", "men", "women", "feet", "teeth", "mice", "geese"})
+
+MODALS = frozenset({"can", "could", "will", "would", "shall", "should", "may", "might", "must", "to"})
+
+FUNCTION_WORDS = DETERMINERS | frozenset(SUBJECT_PRONOUNS) | MODALS | frozenset({
+    "me", "him", "us", "them", "myself", "yourself", "himself", "herself", "itself", "ourselves", "themselves",
+    "about", "above", "across", "after", "against", "along", "at", "before", "behind", "below", "by",
+    "down", "during", "for", "from", "in", "into", "near", "of", "off", "on", "onto", "out", "over",
+    "through", "under", "up", "with", "without", "and", "or", "but", "if", "because", "when", "while",
+    "not", "never", "always", "often", "already", "very", "too", "also", "just", "yesterday", "today",
+    "tomorrow", "now", "then", "here", "there", "quickly", "slowly", "well",
+})
+
+# Minimum confidence to skip spaCy
+CONFIDENCE_THRESHOLD = 0.75
+
+@dataclass(frozen=True)
+class QuickAnalysis:
+    words: Tuple[str, ...]
+    spans: Tuple[Tuple[int, int], ...]   # start and end of each word in the clause
+    index: int                           # word holding the verb
+    lemma: str
+    person_number: str
+    confidence: float
+
+def third_person(lemma: str) -> str:
+    if lemma.endswith(("s", "x", "z", "ch", "sh", "o")):
+        return lemma + "es"
+    if lemma.endswith("y") and len(lemma) > 1 and lemma[-2] not in "aeiou":
+        return lemma[:-1] + "ies"
+    return lemma + "s"
+
+FINITE = frozenset({"base", "third", "past"})
+
+# form -> (lemma, kinds); kinds among "base", "third", "past", "participle" and "gerund"
+_reverse: Tuple[Optional[Mapping[str, EnglishForms]], Dict[str, Tuple[str, FrozenSet[str]]]] = (None, {})
+
+def reverse_index() -> Dict[str, Tuple[str, FrozenSet[str]]]:
+    """Inflected form -> lemma and the forms it can be, rebuilt when the inflection table is reloaded."""
+    global _reverse
+    table = TABLE_STORE.actual()
+    if _reverse[0] is not table:
+        kinds: Dict[str, Tuple[str, set]] = {}
+        for lemma, forms in table.items():
+            for form, kind in ((lemma, "base"), (third_person(lemma), "third"), (forms.past, "past"),
+                               (forms.participle, "participle"), (forms.gerund, "gerund")):
+                # A form shared by two lemmas keeps the first one in the table (the one it is a base of)
+                entry = kinds.setdefault(form, (lemma, set()))
+                if entry[0] == lemma:
+                    entry[1].add(kind)
+        _reverse = (table, {form: (lemma, frozenset(k)) for form, (lemma, k) in kinds.items()})
+    return _reverse[1]
+
+def _candidates(words: List[str], index: Dict[str, Tuple[str, FrozenSet[str]]]) -> List[Tuple[int, int, str, str]]:
+    subject = ""
+    candidates = []
+    for i, word in enumerate(words):
+        low = word.lower()
+        previous = words[i - 1].lower() if i else ""
+        following = words[i + 1].lower() if i + 1 < len(words) else ""
+        if low in SUBJECT_PRONOUNS:
+            subject = SUBJECT_PRONOUNS[low]
+        if low in AUXILIARIES:
+            subject = subject or AUXILIARY_PERSON.get(low, "")
+            # An auxiliary is only the verb when no verb form follows ("John is tall"). After "be",
+            # a participle may be an adjective ("I am tired"), so both stay as tied candidates.
+            after = words[i + 2].lower() if following == "not" and i + 2 < len(words) else following
+            kinds = index.get(after, ("", frozenset()))[1]
+            if kinds & {"gerund", "base"} or (kinds & {"participle", "past"} and AUXILIARIES[low] != "be"):
+                continue
+            candidates.append((2, i, AUXILIARIES[low], subject))
+            continue
+        if low in FUNCTION_WORDS or previous in DETERMINERS or (i and word[0].isupper()):
+            continue
+        entry = index.get(low)
+        if entry is None:
+            continue
+        lemma, kinds = entry
+        after_auxiliary = previous in AUXILIARIES or previous == "not"
+        score = 0
+        if kinds & {"third", "past"} and not after_auxiliary:
+            score += 2
+        if previous in SUBJECT_PRONOUNS or previous in MODALS or after_auxiliary:
+            score += 2
+        elif previous and previous not in FUNCTION_WORDS and kinds & FINITE:
+            score += 1  # right after a noun: the verb slot in SVO order
+        if not kinds & FINITE and not after_auxiliary:
+            score -= 1
+        if i == 0 and word[0].isupper() and len(words) > 1:
+            score -= 1  # a capitalized first word is usually the subject (John, Mary)
+        person = "3s" if kinds == {"third"} else subject
+        candidates.append((score, i, lemma, person))
+    return candidates
+
+def quick_analyze(clause: str) -> Optional[QuickAnalysis]:
+    """Picks the verb of a simple clause. Returns None when there is no candidate."""
+    matches = list(TOKEN.finditer(clause))
+    words = [m.group() for m in matches]
+    candidates = _candidates(words, reverse_index())
+    if not candidates:
+        return None
+    candidates.sort(key=lambda c: (-c[0], c[1]))
+    score, index, lemma, person = candidates[0]
+    if len(candidates) == 1:
+        confidence = 1.0 if score >= 1 else 0.6
+    else:
+        # Ties go to the leftmost candidate (SVO order), with low confidence
+        confidence = round(min(1.0, 0.4 + 0.2 * (score - candidates[1][0])), 2)
+    if not person:
+        subject = words[index - 1].lower() if index else ""
+        plural = subject in IRREGULAR_PLURALS or (subject.endswith("s") and not subject.endswith("ss"))
+        person = "3p" if plural else "3s"
+    return QuickAnalysis(
+        words=tuple(words),
+        spans=tuple(m.span() for m in matches),
+        index=index,
+        lemma=lemma,
+        person_number=person,
+        confidence=confidence,
+    )
@@ -0,0 +1,50 @@
+"""Builds data/en_inflections.tsv from the lemma list in data/en_verbs.tsv.
+
+Usage: python scripts/build_english_inflections.py [lemmas.tsv] [output.tsv]
+
+Lines in the lemma list are either a bare lemma (regular spelling rules) or
+lemma<TAB>gerund<TAB>past<TAB>participle for irregulars and exceptions.
+The app watches only the output, so edits to the lemma list need a rebuild.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from inflection_en import TABLE_PATH, EnglishForms, regular_forms
+
+SOURCE_PATH = os.path.join(ROOT, "data", "en_verbs.tsv")
+
+def read_lemmas(path: str) -> dict:
+    entries = {}
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            lemma = fields[0].lower()
+            if len(fields) == 1:
+                entries.setdefault(lemma, regular_forms(lemma))
+            elif len(fields) == 4:
+                entries[lemma] = EnglishForms(lemma, *fields[1:])
+            else:
+                raise ValueError(f"{path}:{number}: expected 1 or 4 fields, got {len(fields)}")
+    return entries
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else SOURCE_PATH
+    target = sys.argv[2] if len(sys.argv) > 2 else TABLE_PATH
+    entries = read_lemmas(source)
+    with open(target, "w", encoding="utf-8") as f:
+        f.write("# Generated by scripts/build_english_inflections.py; do not edit by hand.\n")
+        f.write("# lemma\tgerund\tpast\tparticiple\n")
+        for lemma in sorted(entries):
+            forms = entries[lemma]
+            f.write("\t".join((forms.lemma, forms.gerund, forms.past, forms.participle)) + "\n")
+    print(f"{len(entries)} lemmas -> {target}")
+
+if __name__ == "__main__":
+    main()
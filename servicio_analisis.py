@@ -0,0 +1,98 @@
+"""Servicio de análisis por lotes compartido por todas las sesiones de un proceso.
+
+Cada sesión de Streamlit corre en su propio hilo. Si todas llaman al modelo de
+spaCy directamente, se turnan por el GIL de a una cláusula. El servicio pone las
+cláusulas en una cola y un único hilo por modelo las reúne durante unos
+milisegundos (VENDLER_LOTE_MS) para pasarlas juntas por nlp.pipe. Quien envía una
+cláusula recibe un Future. Una cláusula idéntica a otra que todavía espera
+recibe el mismo Future, así que cuando cuarenta estudiantes envían a la vez el
+mismo ejercicio, se analiza una sola vez. Los detectores solo leen el Doc, de modo
+que compartirlo entre sesiones es seguro.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+ESPERA_LOTE_MS = float(os.environ.get("VENDLER_LOTE_MS", "5"))
+TAMANO_LOTE = int(os.environ.get("VENDLER_LOTE_MAX", "64"))
+
+class ServicioAnalisis:
+    """Cola de cláusulas con un hilo que las analiza por lotes con `modelo.pipe`."""
+
+    def __init__(self, modelo, espera_ms: float = ESPERA_LOTE_MS, tamano_lote: int = TAMANO_LOTE):
+        self.modelo = modelo
+        self._espera = espera_ms / 1000
+        self._tamano_lote = tamano_lote
+        self._iniciar()
+        # Tras un fork (lanzador.py) el hilo no existe en el proceso hijo: se crea uno nuevo
+        referencia = weakref.WeakMethod(self._iniciar)
+        os.register_at_fork(after_in_child=lambda: referencia() and referencia()())
+
+    def _iniciar(self) -> None:
+        self._cola: "queue.Queue[str]" = queue.Queue()
+        self._pendientes: Dict[str, Future] = {}
+        self._candado = threading.Lock()
+        self._lotes = 0
+        self._analizadas = 0
+        self._hilo = threading.Thread(target=self._trabajar, name="servicio-analisis", daemon=True)
+        self._hilo.start()
+
+    def enviar(self, texto: str) -> Future:
+        """Pone la cláusula en la cola (o se suma a una idéntica que ya espera) y devuelve su Future."""
+        with self._candado:
+            futuro = self._pendientes.get(texto)
+            if futuro is None:
+                futuro = Future()
+                self._pendientes[texto] = futuro
+                self._cola.put(texto)
+            return futuro
+
+    def __call__(self, texto: str):
+        return self.enviar(texto).result()
+
+    def estadisticas(self) -> Dict[str, float]:
+        return {
+            "lotes": self._lotes,
+            "analizadas": self._analizadas,
+            "promedio_lote": self._analizadas / self._lotes if self._lotes else 0.0,
+            "en_cola": self._cola.qsize(),
+        }
+
+    def _reunir_lote(self) -> List[str]:
+        lote = [self._cola.get()]
+        limite = time.monotonic() + self._espera
+        while len(lote) < self._tamano_lote:
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                break
+            try:
+                lote.append(self._cola.get(timeout=restante))
+            except queue.Empty:
+                break
+        return lote
+
+    def _trabajar(self) -> None:
+        while True:
+            lote = self._reunir_lote()
+            try:
+                docs = list(self.modelo.pipe(lote))
+            except Exception as error:
+                logger.exception("Falló el análisis de un lote de %d cláusulas", len(lote))
+                docs = [error] * len(lote)
+            self._lotes += 1
+            self._analizadas += len(lote)
+            for texto, doc in zip(lote, docs):
+                with self._candado:
+                    futuro = self._pendientes.pop(texto)
+                if isinstance(doc, Exception):
+                    futuro.set_exception(doc)
+                else:
+                    futuro.set_result(doc)
@@ -0,0 +1,112 @@
+"""Servidor local de modelos: aloja una sola vez los modelos de español e inglés.
+
+Cada proceso de Streamlit carga normalmente su propia copia de los modelos de
+spaCy. Con ocho procesos por nodo, eso son dieciséis copias en memoria. Este
+servidor carga las dos una vez y responde por HTTP en localhost:
+
+    POST /analizar  {"idioma": "es" | "en", "oracion": "..."}
+        -> {"exito": ..., "verbo": ..., "lema": ..., "datos": {campos de DatosClause / ClauseData}}
+    GET /estado     -> vocabulario, memoria y lotes de cada modelo
+
+Cada pedido corre en su hilo y pasa por el ServicioAnalisis del detector, así
+que los pedidos simultáneos se analizan juntos con nlp.pipe. Los procesos de la
+aplicación lo usan si se define VENDLER_SERVIDOR_MODELOS (ver cliente_modelos.py).
+
+Uso: python servidor_modelos.py [--host 127.0.0.1] [--puerto 8765]
+"""
+
+import argparse
+import json
+import logging
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+def crear_analizadores() -> Dict[str, Callable[[str], dict]]:
+    """Carga los dos modelos y devuelve, por idioma, una función que analiza una cláusula."""
+    from nucleo import aktionsart_en, aktionsart_es
+
+    def analizador(analizar_localmente, clase_datos):
+        def analizar(oracion: str) -> dict:
+            datos = clase_datos()
+            exito, verbo, lema = analizar_localmente(oracion, datos)
+            return {"exito": exito, "verbo": verbo, "lema": lema, "datos": asdict(datos)}
+        return analizar
+
+    for modulo in (aktionsart_es, aktionsart_en):
+        if modulo.load_nlp() is None:
+            logger.warning("%s: el modelo de spaCy no está instalado; solo se analiza por reglas", modulo.__name__)
+    return {
+        "es": analizador(aktionsart_es.analizar_localmente, aktionsart_es.DatosClause),
+        "en": analizador(aktionsart_en.analyze_locally, aktionsart_en.ClauseData),
+    }
+
+def estado_modelos() -> dict:
+    from nucleo import aktionsart_en, aktionsart_es
+
+    estado = {}
+    for idioma, modulo in (("es", aktionsart_es), ("en", aktionsart_en)):
+        servicio = modulo.load_nlp()
+        if servicio is None:
+            estado[idioma] = None
+            continue
+        estado[idioma] = {**asdict(servicio.modelo.estado()), **servicio.estadisticas()}
+    return estado
+
+class ManejadorAnalisis(BaseHTTPRequestHandler):
+    analizadores: Dict[str, Callable[[str], dict]] = {}
+
+    def _responder(self, codigo: int, cuerpo: dict) -> None:
+        datos = json.dumps(cuerpo, ensure_ascii=False).encode("utf-8")
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def do_GET(self):
+        if self.path != "/estado":
+            return self._responder(404, {"error": "ruta desconocida"})
+        self._responder(200, estado_modelos())
+
+    def do_POST(self):
+        if self.path != "/analizar":
+            return self._responder(404, {"error": "ruta desconocida"})
+        try:
+            largo = int(self.headers.get("Content-Length", 0))
+            pedido = json.loads(self.rfile.read(largo))
+            analizar = self.analizadores[pedido["idioma"]]
+            oracion = str(pedido["oracion"])
+        except (ValueError, KeyError, TypeError):
+            return self._responder(400, {"error": "se esperaba {\"idioma\": \"es\" | \"en\", \"oracion\": ...}"})
+        try:
+            self._responder(200, analizar(oracion))
+        except Exception:
+            logger.exception("Falló el análisis de %r", oracion)
+            self._responder(500, {"error": "falló el análisis"})
+
+    def log_message(self, formato, *args):
+        logger.debug(formato, *args)
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local de los modelos de spaCy de Vendler")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+
+    ManejadorAnalisis.analizadores = crear_analizadores()
+    servidor = ThreadingHTTPServer((args.host, args.puerto), ManejadorAnalisis)
+    servidor.daemon_threads = True
+    logger.info("Servidor de modelos en http://%s:%d", args.host, args.puerto)
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+if __name__ == "__main__":
+    main()
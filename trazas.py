@@ -0,0 +1,215 @@
+"""Grabación opcional de sesiones reales, para reproducirlas como prueba de rendimiento.
+
+Con VENDLER_TRAZAS=<archivo>, cada ejecución del guion que provoca el usuario añade
+una línea JSON al archivo (solo se agrega, nunca se reescribe):
+
+    {"s": "3fa2c1d0", "t": 5120, "a": [[id, campo, valor], ...], "p": ["akt", "ES", "matriz"]}
+
+- s: identificador aleatorio de la sesión (no es el de Streamlit);
+- t: milisegundos desde que empezó la sesión;
+- a: los widgets que el usuario cambió o pulsó (id de Streamlit, campo de WidgetState, valor);
+- p: sección, idioma y paso (akt_paso, akt_step o ls_paso) en que quedó la página.
+
+La primera línea de cada sesión lleva además "inicio" (época en segundos) y "version"
+(huella del código de la aplicación: los id de los widgets cambian con el código).
+
+El texto libre se anonimiza antes de escribirse: se conservan las palabras
+funcionales, los valores de los operadores y las formas verbales que reconocen los
+analizadores por reglas (de ellas depende el recorrido por el detector); las demás se reemplazan por
+seudónimos, los mismos durante toda la sesión. Los valores que la aplicación ofrece
+como opción (radios, listas) se conservan tal cual.
+
+benchmarks/bench_reproduccion.py reproduce estos archivos contra un servidor.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+logger = logging.getLogger(__name__)
+
+ARCHIVO = os.environ.get("VENDLER_TRAZAS", "")
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+MODULOS_APLICACION = ("vendler.py", "aktionsart_es.py", "aktionsart_en.py", "ls.py", "info.py",
+                      os.path.join("nucleo", "ls.py"), os.path.join("nucleo", "aktionsart_es.py"),
+                      os.path.join("nucleo", "aktionsart_en.py"))
+
+NOMBRES = ("Ana", "Luis", "Eva", "Hugo", "Sara", "Raúl", "Inés", "Tomás")
+COSAS = ("cosa", "objeto", "asunto", "lugar", "tema", "pieza", "parte", "punto")
+
+PALABRA = re.compile(r"[^\W\d_]+")
+DIGITO = re.compile(r"\d")
+
+_candado = threading.Lock()
+_activado = bool(ARCHIVO)
+
+class _Sesion:
+    """Lo que el grabador guarda en st.session_state entre ejecuciones."""
+
+    def __init__(self):
+        self.id = secrets.token_hex(4)
+        self.inicio = time.time()
+        self.valores: Dict[str, tuple] = {}   # último valor de cada widget (sin los botones)
+        self.seudonimos: Dict[str, str] = {}
+        self.pendiente: Optional[dict] = None
+        self.primera = True
+
+@lru_cache(maxsize=1)
+def _codigo_aplicacion() -> tuple:
+    """Huella del código y textos literales de la aplicación (opciones, etiquetas)."""
+    huella = hashlib.sha1()
+    literales = set()
+    for relativa in MODULOS_APLICACION:
+        with open(os.path.join(RAIZ, relativa), encoding="utf-8") as f:
+            fuente = f.read()
+        huella.update(fuente.encode("utf-8"))
+        for nodo in ast.walk(ast.parse(fuente)):
+            if isinstance(nodo, ast.Constant) and isinstance(nodo.value, str):
+                literales.add(nodo.value.lower())
+    return huella.hexdigest()[:12], frozenset(literales)
+
+def version_aplicacion() -> str:
+    """La huella que lleva la primera línea de cada sesión grabada."""
+    return _codigo_aplicacion()[0]
+
+@lru_cache(maxsize=1)
+def _palabras_conservadas() -> FrozenSet[str]:
+    from analisis_rapido_es import PALABRAS_FUNCIONALES
+    from morfologia_es import CLITICOS
+    from nucleo.ls import OPERADORES
+    from quick_parse_en import FUNCTION_WORDS
+    valores_operadores = {p.lower() for op in OPERADORES for p in PALABRA.findall(op.ejemplos)}
+    return PALABRAS_FUNCIONALES | CLITICOS | FUNCTION_WORDS | frozenset(valores_operadores)
+
+@lru_cache(maxsize=4096)
+def _es_forma_verbal(palabra: str) -> bool:
+    from analisis_rapido_es import verbos_conocidos
+    from morfologia_es import analizar_forma
+    from quick_parse_en import reverse_index
+
+    if palabra in reverse_index():
+        return True
+    lexico = verbos_conocidos()
+    analisis = analizar_forma(palabra, lexico=lexico)
+    return analisis is not None and analisis.lema in lexico
+
+def anonimizar(texto: str, seudonimos: Dict[str, str]) -> str:
+    """Reemplaza por seudónimos las palabras que no son funcionales ni formas verbales."""
+    if texto.lower() in _codigo_aplicacion()[1]:
+        return texto  # una opción de la propia aplicación
+
+    def reemplazar(coincidencia) -> str:
+        palabra = coincidencia.group(0)
+        minuscula = palabra.lower()
+        if minuscula in _palabras_conservadas() or _es_forma_verbal(minuscula):
+            return palabra
+        if palabra not in seudonimos:
+            grupo = NOMBRES if palabra[0].isupper() else COSAS
+            usados = sum(1 for s in seudonimos.values() if s.rstrip("0123456789") in grupo)
+            sufijo = str(usados // len(grupo) + 1) if usados >= len(grupo) else ""
+            seudonimos[palabra] = grupo[usados % len(grupo)] + sufijo
+        return seudonimos[palabra]
+
+    return PALABRA.sub(reemplazar, DIGITO.sub("0", texto))
+
+def _valor(estado) -> Optional[tuple]:
+    campo = estado.WhichOneof("value")
+    if campo in ("trigger_value", "bool_value", "int_value", "double_value", "string_value"):
+        return campo, getattr(estado, campo)
+    if campo in ("int_array_value", "double_array_value", "string_array_value"):
+        return campo, tuple(getattr(estado, campo).data)
+    return None  # archivos, componentes: no se graban
+
+def _paso() -> list:
+    estado = st.session_state
+    seccion, idioma = estado.get("seccion"), estado.get("lang")
+    if seccion == "akt":
+        paso = estado.get("akt_paso" if idioma == "ES" else "akt_step")
+    elif seccion == "ls":
+        paso = estado.get("ls_paso")
+    else:
+        paso = None
+    return [seccion, idioma, paso]
+
+def _escribir(sesion: _Sesion) -> None:
+    evento, sesion.pendiente = sesion.pendiente, None
+    acciones = []
+    for id_widget, campo, valor in evento.pop("a"):
+        if campo == "string_value":
+            valor = anonimizar(valor, sesion.seudonimos)
+        elif campo == "string_array_value":
+            valor = [anonimizar(v, sesion.seudonimos) for v in valor]
+        acciones.append([id_widget, campo, valor])
+    linea = {"s": sesion.id, "t": evento["t"], "a": acciones, "p": _paso()}
+    if sesion.primera:
+        linea.update(inicio=int(sesion.inicio), version=version_aplicacion())
+        sesion.primera = False
+    with _candado, open(ARCHIVO, "a", encoding="utf-8") as f:
+        f.write(json.dumps(linea, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+def _estados() -> list:
+    return get_script_run_ctx().session_state.get_widget_states()
+
+def _protegido(funcion):
+    """El grabador nunca debe romper la aplicación: ante un error se desactiva."""
+    def envoltura():
+        global _activado
+        if not _activado:
+            return
+        try:
+            funcion()
+        except Exception:
+            _activado = False
+            logger.exception("Falló la grabación de trazas; queda desactivada")
+    return envoltura
+
+@_protegido
+def inicio_ejecucion() -> None:
+    """Al comienzo del guion: anota lo que el usuario cambió o pulsó desde la ejecución anterior."""
+    sesion = st.session_state.get("_traza")
+    if sesion is None:
+        sesion = st.session_state["_traza"] = _Sesion()
+    acciones: List[list] = []
+    for estado in _estados():
+        valor = _valor(estado)
+        if valor is None:
+            continue
+        campo, dato = valor
+        if campo == "trigger_value":
+            if dato:
+                acciones.append([estado.id, campo, True])
+        elif sesion.valores.get(estado.id) != valor:
+            sesion.valores[estado.id] = valor
+            acciones.append([estado.id, campo, list(dato) if isinstance(dato, tuple) else dato])
+    # Tras st.rerun la ejecución nueva no trae acciones: la pendiente se escribe al final de esta
+    if not acciones and not sesion.primera:
+        return
+    if sesion.pendiente is not None:
+        _escribir(sesion)
+    sesion.pendiente = {"t": int((time.time() - sesion.inicio) * 1000), "a": acciones}
+
+@_protegido
+def fin_ejecucion() -> None:
+    """Al final del guion: escribe la acción pendiente con el paso en que quedó la página."""
+    sesion = st.session_state.get("_traza")
+    if sesion is None:
+        return
+    # Valores por defecto de los widgets nuevos: el navegador los reenvía, pero no son acciones
+    for estado in _estados():
+        valor = _valor(estado)
+        if valor is not None and valor[0] != "trigger_value":
+            sesion.valores[estado.id] = valor
+    if sesion.pendiente is not None:
+        _escribir(sesion)
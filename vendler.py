@@ -4,6 +4,8 @@ import aktionsart_en
 import ls
 import info
 import base64
+from calentamiento import estado_calentamiento, iniciar_calentamiento
+from trazas import fin_ejecucion, inicio_ejecucion
 from pathlib import Path
 
 # Configuración de la página (Sin barra lateral)
@@ -22,6 +24,9 @@ if 'lang' not in st.session_state:
 if 'seccion' not in st.session_state:
     st.session_state.seccion = 'home'
 
+# Grabación opcional de la sesión (VENDLER_TRAZAS); no hace nada si no está definida
+inicio_ejecucion()
+
 # --- 2. FUNCIONES DE CONTROL (Callbacks) ---
 
 def cambiar_seccion(nueva_seccion):
@@ -29,12 +34,12 @@ def cambiar_seccion(nueva_seccion):
     if nueva_seccion == 'akt':
         # Variables de aktionsart_es
         for key in ['akt_paso', 'historial', 'rasgos', 'datos', 'oracion_original', 
-                    'oracion_actual', 'clausula_limpia', 'variante_no_causativa', 'reformulacion']:
+                    'oracion_actual', 'clausula_limpia', 'variante_no_causativa', 'reformulacion', 'pruebas']:
             if key in st.session_state:
                 del st.session_state[key]
         # Variables de aktionsart_en
         for key in ['akt_step', 'history', 'features', 'data', 'original_clause', 
-                    'current_clause', 'clean_clause', 'non_causative_variant', 'paraphrase']:
+                    'current_clause', 'clean_clause', 'non_causative_variant', 'paraphrase', 'tests']:
             if key in st.session_state:
                 del st.session_state[key]
     elif nueva_seccion == 'ls':
@@ -69,6 +74,7 @@ textos = {
         'desc_akt': "Pruebas diagnósticas interactivas para determinar la clase aspectual.",
         'desc_ls': "Generación formal de la estructura lógica (LS) en español.",
         'desc_info': "Créditos, bibliografía y contacto institucional.",
+        'calentando': "Preparando los modelos de análisis; el primer análisis puede tardar unos segundos más.",
         'lang_label': "Switch to English"
     },
     'EN': {
@@ -90,6 +96,7 @@ textos = {
         'desc_akt': "Interactive diagnostic tests to determine the aspectual class.",
         'desc_ls': None,
         'desc_info': "Credits, bibliography, and institutional contact info.",
+        'calentando': "Loading the analysis models; the first analysis may take a few extra seconds.",
         'lang_label': "Cambiar a español",
         'footer': "Carlos González Vergara | cgonzalv@uc.cl"
     }
@@ -124,6 +131,8 @@ st.divider()
 # --- 5. RENDERIZADO DE CONTENIDO ---
 
 if st.session_state.seccion == 'home':
+    # Mientras se lee la portada, un hilo carga los modelos y hace el primer análisis
+    iniciar_calentamiento()
     st.markdown(L['presentacion'])
     st.divider()
     
@@ -148,6 +157,9 @@ if st.session_state.seccion == 'home':
             st.button(L['btn_info'], key="go_info_en", use_container_width=True, on_click=cambiar_seccion, args=('info',))
             st.caption(L['desc_info'])
 
+    if estado_calentamiento() == "en curso":
+        st.caption(L['calentando'])
+
     st.divider()
 
     # Footer: logo cgv.tools + badge CC en la misma línea, firma debajo
@@ -197,4 +209,6 @@ st.markdown("""
             display: none;
         }
     </style>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """, unsafe_allow_html=True)
+
+fin_ejecucion()